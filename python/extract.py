@@ -0,0 +1,259 @@
+# core
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+import json
+import math
+import os
+import time
+from typing import Any, Iterator
+
+# dependencies
+import fire
+import numpy as np
+import numpy.typing as npt
+import soundfile as sf
+from tqdm import tqdm
+
+# src
+from kymatio.datasets import _find_audio_files
+from kymatio.numpy import Scattering1D, TimeFrequencyScattering1D
+
+# transforms built by each worker process, keyed by input length
+_transforms: dict[int, Any] = {}
+_transform_config: dict[str, Any] = {}
+
+
+def readAudio(path: str, max_length: float) -> tuple[npt.NDArray[np.float32], int]:
+	'''
+	Import an audio file, convert it to mono, and trim it.
+	params:
+		path						Audio file to import.
+		max_length					Maximum length (seconds) of the audio, beyond which it is trimmed.
+	returns:
+		The audio and its sample rate (hz).
+	'''
+	info = sf.info(path)
+	x, sample_rate = sf.read(path, frames=int(max_length * info.samplerate), dtype='float32', always_2d=True)
+	return x.mean(axis=1), sample_rate
+
+
+def readAudioFiles(
+	paths: list[str],
+	max_length: float,
+	n_readers: int,
+) -> Iterator[tuple[str, npt.NDArray[np.float32] | None, int]]:
+	'''
+	Decode audio files in background threads, yielding them in order. At most a few files per reader are held in memory
+	at once. Files that fail to decode are yielded with `None` audio.
+	params:
+		paths						Audio files to import.
+		max_length					See `readAudio`.
+		n_readers					Number of reader threads.
+	'''
+	with ThreadPoolExecutor(n_readers) as executor:
+		pending: deque[tuple[str, Future]] = deque()
+		paths_iter = iter(paths)
+		while True:
+			# keep the readers busy
+			while len(pending) < 4 * n_readers:
+				path = next(paths_iter, None)
+				if path is None:
+					break
+				pending.append((path, executor.submit(readAudio, path, max_length)))
+			if not pending:
+				return
+			path, future = pending.popleft()
+			try:
+				x, sample_rate = future.result()
+			except (RuntimeError, OSError) as e:
+				print(f'Skipping {path}: {e}')
+				yield path, None, 0
+				continue
+			yield path, x, sample_rate
+
+
+def bucketLength(length: int, J: int) -> int:
+	'''
+	The length to which an input is zero padded, such that inputs of similar length share a transform and a batch.
+	params:
+		length						Length of the input (samples).
+		J							Maximum log-scale of the transform, which lower bounds the length.
+	'''
+	return max(2 ** math.ceil(math.log2(max(length, 1))), 2 ** J)
+
+
+def _buildTransform(length: int) -> Any:
+	if length not in _transforms:
+		config = dict(_transform_config)
+		if config.pop('transform') == 'jtfs':
+			_transforms[length] = TimeFrequencyScattering1D(shape=(length,), out_type='array', **config)
+		else:
+			for param in ('J_fr', 'Q_fr', 'F'):
+				config.pop(param)
+			_transforms[length] = Scattering1D(shape=(length,), **config)
+	return _transforms[length]
+
+
+def _initWorker(config: dict[str, Any]) -> None:
+	_transform_config.update(config)
+
+
+def _transformBatch(x: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+	return _buildTransform(x.shape[-1])(x).astype(np.float32)
+
+
+def _loadIndex(index_path: str) -> tuple[set[str], int]:
+	'''
+	Read the files already processed by a previous run, whether extracted or failed to decode, and the next free shard
+	number.
+	'''
+	done: set[str] = set()
+	n_shards = 0
+	if os.path.isfile(index_path):
+		with open(index_path, 'r+') as f:
+			lines = f.readlines()
+			# a crash may leave a partial last line, which later entries would be appended to
+			if lines and not lines[-1].endswith('\n'):
+				lines.pop()
+				f.seek(0)
+				f.truncate(sum(len(line.encode()) for line in lines))
+		for line in lines:
+			entry = json.loads(line)
+			done.add(entry['file'])
+			if 'shard' in entry:
+				n_shards = max(n_shards, entry['shard'] + 1)
+	return done, n_shards
+
+
+def runExtraction(
+	audio_dir: str = '',
+	output_dir: str = os.path.join(os.getcwd(), 'features/'),
+	transform: str = 'jtfs',
+	J: int = 13,
+	Q: int = 12,
+	J_fr: int = 5,
+	Q_fr: int = 2,
+	T: int | None = None,
+	F: int | None = None,
+	batch_size: int = 8,
+	max_length: float = 15.,
+	n_readers: int = 4,
+	n_workers: int = os.cpu_count() or 1,
+) -> None:
+	'''
+	Main routine for extracting scattering or JTFS features from a directory tree of audio files.
+
+	Files are decoded in background threads, zero padded to the next power of two (at least 2 ** J) and grouped into
+	batches of equal padded length, which are transformed across a process pool. Each batch is written to its own shard,
+	`shard_<n>.npy`, of shape (batch, n_coeffs, time), and `index.jsonl` maps each file to its shard and row, along with
+	its unpadded length (samples) and sample rate. Files that fail to decode are listed as `{"file": ..., "failed": true}`.
+	A shard is listed in the index only once written, so rerunning with the same `output_dir` resumes where a previous
+	run stopped, without retrying failed files.
+
+	params:
+		audio_dir		Directory containing the input audio files, searched recursively.
+		output_dir		Where the shards and index are saved.
+		transform		'jtfs' for `TimeFrequencyScattering1D`, or 'scattering' for `Scattering1D`.
+		J				Maximum log-scale of the transform.
+		Q				Wavelets per octave of the first order.
+		J_fr			Maximum log-scale of frequential scattering (JTFS only).
+		Q_fr			Wavelets per octave of frequential scattering (JTFS only).
+		T				Temporal support of the low-pass filter (samples); None is 2 ** J.
+		F				Frequential support of the low-pass filter (JTFS only); None is 2 ** J_fr.
+		batch_size		Maximum number of files transformed at once.
+		max_length		Maximum allowable length (seconds) of an input audio file. All audio files that exceed this duration
+						will be trimmed.
+		n_readers		Number of audio decoding threads.
+		n_workers		Number of transform processes.
+	'''
+	# initialise input and output directories
+	if not os.path.isdir(audio_dir):
+		raise ValueError('Directory of audio files must be specified: `--audio_dir </absolute/path/to/audio/files/>`')
+	if transform not in ('jtfs', 'scattering'):
+		raise ValueError(f"`transform` must be 'jtfs' or 'scattering', got {transform}")
+	os.makedirs(output_dir, exist_ok=True)
+	index_path = os.path.join(output_dir, 'index.jsonl')
+	done, n_shards = _loadIndex(index_path)
+	audio_files = [f for f in _find_audio_files(audio_dir) if f not in done]
+	if done:
+		print(f'Resuming: {len(done)} files already processed, {len(audio_files)} remaining.')
+	config = dict(transform=transform, J=J, Q=Q, J_fr=J_fr, Q_fr=Q_fr, T=T, F=F)
+	# per padded length, files awaiting a full batch
+	buckets: dict[int, list[tuple[str, npt.NDArray[np.float32], int]]] = {}
+	# batches being transformed, with the files they contain
+	running: dict[Future, list[tuple[str, int, int]]] = {}
+	n_files, n_samples = 0, 0
+	start = time.time()
+
+	def submit(pool: ProcessPoolExecutor, bucket: list[tuple[str, npt.NDArray[np.float32], int]], length: int) -> None:
+		batch = np.zeros((len(bucket), length), dtype=np.float32)
+		for i, (_, x, _) in enumerate(bucket):
+			batch[i, :len(x)] = x
+		running[pool.submit(_transformBatch, batch)] = [(f, len(x), sr) for f, x, sr in bucket]
+
+	def collect(bar: tqdm, block: bool) -> None:
+		nonlocal n_files, n_samples, n_shards
+		finished, _ = wait(list(running), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+		for future in finished:
+			files = running.pop(future)
+			# write then rename, so an interrupted run never leaves a partial shard
+			shard_path = os.path.join(output_dir, f'shard_{n_shards:06}.npy')
+			np.save(f'{shard_path}.tmp.npy', future.result())
+			os.replace(f'{shard_path}.tmp.npy', shard_path)
+			with open(index_path, 'a') as f:
+				for row, (file, length, sample_rate) in enumerate(files):
+					f.write(json.dumps({
+						'file': file,
+						'shard': n_shards,
+						'row': row,
+						'length': length,
+						'sample_rate': sample_rate,
+					}) + '\n')
+			n_shards += 1
+			n_files += len(files)
+			n_samples += sum(length for _, length, _ in files)
+			bar.postfix = f'{n_samples / max(time.time() - start, 1e-9):.0f} samples/s'
+			bar.update(len(files))
+
+	with (
+		ProcessPoolExecutor(n_workers, initializer=_initWorker, initargs=(config, )) as pool,
+		tqdm(
+			total=len(audio_files),
+			bar_format='{percentage:3.0f}% |{bar}| {n_fmt}/{total_fmt}, Elapsed: {elapsed}, ETA: {remaining}, {rate_fmt}'
+			+ '{postfix}   ',
+			unit=' files',
+		) as bar,
+	):
+		for path, x, sample_rate in readAudioFiles(
+			[os.path.join(audio_dir, f) for f in audio_files],
+			max_length,
+			n_readers,
+		):
+			if x is None:
+				# record the failure, so that resuming doesn't retry it
+				with open(index_path, 'a') as f:
+					f.write(json.dumps({'file': os.path.relpath(path, audio_dir), 'failed': True}) + '\n')
+				bar.update(1)
+				continue
+			length = bucketLength(x.shape[0], J)
+			bucket = buckets.setdefault(length, [])
+			bucket.append((os.path.relpath(path, audio_dir), x, sample_rate))
+			if len(bucket) == batch_size:
+				submit(pool, buckets.pop(length), length)
+			# bound the decoded audio held in memory
+			collect(bar, block=len(running) >= 2 * n_workers)
+		# flush partial batches
+		for length, bucket in buckets.items():
+			submit(pool, bucket, length)
+		while running:
+			collect(bar, block=True)
+	# report throughput
+	elapsed = time.time() - start
+	print(
+		f'Extracted {n_files} files in {elapsed:.1f}s, {n_samples / max(elapsed, 1e-9):.0f} samples/s,',
+		f'written to {output_dir}',
+	)
+
+
+if __name__ == '__main__':
+	fire.Fire(runExtraction)
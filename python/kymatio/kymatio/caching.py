@@ -55,7 +55,8 @@ def get_cache_dir(name="", cache_base_dir=None, create=True):
         return path
     else:
         if create:
-            os.makedirs(path)
+            # another process may create it meanwhile
+            os.makedirs(path, exist_ok=True)
             return path
         else:
             raise ValueError(
@@ -1,7 +1,12 @@
 import os
+import hashlib
+import json
+import shutil
 import subprocess
+import uuid
+import warnings
 import numpy as np
-from scipy.io import loadmat
+from scipy.io import loadmat, wavfile
 from .caching import get_cache_dir
 try:
     from urllib.request import urlopen
@@ -116,6 +121,11 @@ def fetch_fsdd(verbose=False):
         (should be base_dir/free-spoken-digit-dataset/recordings),
         and 'files', with value the list of the files in path_dataset
         ending with .wav
+
+    Notes
+    -----
+    To iterate over the recordings without decoding them file by file, pack
+    them once with `load_audio_corpus(dictionary['path_dataset'])`.
     """
     path = get_dataset_dir("fsdd")
     # check if there is already the free sound dataset within this directory
@@ -137,6 +147,324 @@ def fetch_fsdd(verbose=False):
     return dictionary
 
 
+# bump when the packed layout changes, to invalidate packed corpora
+_AUDIO_CORPUS_VERSION = 1
+
+
+# file extensions that soundfile reads, but that aren't named after its
+# formats; not `.mat` for MAT4/MAT5, which is mostly MATLAB data
+_AUDIO_FORMAT_ALIASES = dict(AIFF=('aif', 'aifc'), MPEG=('mp3',),
+                             NIST=('sph',), OGG=('oga', 'opus'),
+                             WAV=('wave',))
+# formats that can't be read without being told their layout
+_AUDIO_FORMATS_HEADERLESS = ('RAW',)
+
+
+def _find_audio_files(audio_dir):
+    """Audio files under `audio_dir`, relative to it, in a reproducible
+    order."""
+    extensions = ['.wav', '.wave']
+    try:
+        import soundfile as sf
+        for fmt in sf.available_formats():
+            if fmt in _AUDIO_FORMATS_HEADERLESS:
+                continue
+            for ext in (fmt,) + _AUDIO_FORMAT_ALIASES.get(fmt, ()):
+                extensions.append('.' + ext.lower())
+    except ImportError:
+        pass
+    extensions = tuple(set(extensions))
+
+    audio_files = []
+    for root, dirs, files in os.walk(audio_dir):
+        dirs.sort()
+        for file in sorted(files):
+            if file.lower().endswith(extensions):
+                audio_files.append(os.path.relpath(os.path.join(root, file),
+                                                   audio_dir))
+    return audio_files
+
+
+def _read_audio(filename):
+    """Reads an audio file as mono float32 in [-1, 1], and its sample rate."""
+    if filename.lower().endswith(('.wav', '.wave')):
+        sample_rate, x = wavfile.read(filename)
+        if x.dtype == np.uint8:
+            x = (x.astype('float32') - 128) / 128
+        elif np.issubdtype(x.dtype, np.integer):
+            x = x.astype('float32') / -np.iinfo(x.dtype).min
+    else:
+        import soundfile as sf
+        x, sample_rate = sf.read(filename, dtype='float32')
+    x = np.asarray(x, dtype='float32')
+    if x.ndim == 2:
+        x = x.mean(axis=1)
+    return x, sample_rate
+
+
+def _audio_files_signature(audio_dir, audio_files):
+    signature = []
+    for file in audio_files:
+        stat = os.stat(os.path.join(audio_dir, file))
+        signature.append([file, stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def pack_audio_corpus(audio_dir, path, shard_size=2**26, verbose=False):
+    """
+    Decodes every audio file under `audio_dir` once, and packs them into
+    shards of concatenated float32 samples, readable by `AudioCorpus`.
+
+    Arguments
+    ---------
+    audio_dir: string
+        Directory containing the audio files, searched recursively.
+    path: string
+        Directory the packed corpus is written to. It is written elsewhere
+        then renamed, so it is never seen partially written.
+    shard_size: int, optional
+        Maximum number of samples per shard, unless a single file is longer.
+        Defaults to 2**26 (256 MB).
+    verbose: boolean, optional
+        Whether to display indications of the operations undertaken.
+        Defaults to False
+
+    Returns
+    -------
+    corpus: AudioCorpus
+        The packed corpus.
+    """
+    if not os.path.isdir(audio_dir):
+        raise ValueError("Could not find audio directory {}".format(audio_dir))
+    audio_files = _find_audio_files(audio_dir)
+    signature = _audio_files_signature(audio_dir, audio_files)
+
+    tmp_path = '%s.%s.tmp' % (os.path.normpath(path), uuid.uuid4().hex)
+    os.makedirs(tmp_path)
+    try:
+        files, shards, offsets, lengths, sample_rates = [], [], [], [], []
+        buffer = np.zeros(shard_size, dtype='float32')
+        n_shards, n_samples = 0, 0
+
+        def flush():
+            np.save(os.path.join(tmp_path, 'shard_%06d.npy' % n_shards),
+                    buffer[:n_samples])
+
+        for i, file in enumerate(audio_files):
+            try:
+                x, sample_rate = _read_audio(os.path.join(audio_dir, file))
+            except (ValueError, RuntimeError, OSError) as e:
+                warnings.warn("Skipping {}: {}".format(file, e))
+                continue
+            if n_samples + len(x) > shard_size and n_samples > 0:
+                flush()
+                n_shards, n_samples = n_shards + 1, 0
+            if len(x) > len(buffer):
+                buffer = np.zeros(len(x), dtype='float32')
+            buffer[n_samples:n_samples + len(x)] = x
+            files.append(file)
+            shards.append(n_shards)
+            offsets.append(n_samples)
+            lengths.append(len(x))
+            sample_rates.append(int(sample_rate))
+            n_samples += len(x)
+            if verbose and (i + 1) % 1000 == 0:
+                print("Packed {}/{} files".format(i + 1, len(audio_files)))
+        if files:
+            flush()
+
+        index = dict(version=_AUDIO_CORPUS_VERSION,
+                     audio_dir=os.path.abspath(audio_dir),
+                     signature=signature, files=files, shards=shards,
+                     offsets=offsets, lengths=lengths,
+                     sample_rates=sample_rates)
+        with open(os.path.join(tmp_path, 'index.json'), 'w') as f:
+            json.dump(index, f)
+
+        # move any previous packing out of the way, then commit ours
+        if os.path.exists(path):
+            old_path = '%s.%s.old' % (os.path.normpath(path), uuid.uuid4().hex)
+            os.rename(path, old_path)
+            shutil.rmtree(old_path, ignore_errors=True)
+        os.rename(tmp_path, path)
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    if verbose:
+        print("Packed {} files into {}".format(len(files), path))
+    return AudioCorpus(path)
+
+
+def load_audio_corpus(audio_dir, name=None, shard_size=2**26,
+                      cache_base_dir=None, verbose=False):
+    """
+    Loads a directory of audio files as an `AudioCorpus`, packing it on
+    first use under `caching.get_cache_dir('audio_corpora')`.
+
+    The packed corpus is reused as long as it was packed from `audio_dir`
+    and its audio files are unchanged (same paths, sizes and modification
+    times), and is used as is if `audio_dir` no longer exists.
+
+    Arguments
+    ---------
+    audio_dir: string
+        Directory containing the audio files, searched recursively; for
+        instance, `fetch_fsdd()['path_dataset']`.
+    name: string, optional
+        Name of the packed corpus. Defaults to the name of `audio_dir`,
+        suffixed with a hash of its absolute path, so that directories of
+        the same name (e.g. `recordings`) don't share a corpus.
+    shard_size: int, optional
+        See `pack_audio_corpus`.
+    cache_base_dir: string, optional
+        Passed to `caching.get_cache_dir`.
+    verbose: boolean, optional
+        Whether to display indications of the operations undertaken.
+        Defaults to False
+
+    Returns
+    -------
+    corpus: AudioCorpus
+        The packed corpus.
+    """
+    audio_dir = os.path.abspath(audio_dir)
+    if name is None:
+        name = '%s_%s' % (os.path.basename(audio_dir), hashlib.sha256(
+            audio_dir.encode()).hexdigest()[:12])
+    path = os.path.join(
+        get_cache_dir('audio_corpora', cache_base_dir=cache_base_dir),
+        'v%s' % _AUDIO_CORPUS_VERSION, name)
+
+    if os.path.isfile(os.path.join(path, 'index.json')):
+        corpus = AudioCorpus(path)
+        packed_from = corpus.index['audio_dir']
+        if not os.path.isdir(audio_dir):
+            if packed_from != audio_dir:
+                raise ValueError("Could not find audio directory {}, and "
+                                 "corpus '{}' was packed from {}".format(
+                                     audio_dir, name, packed_from))
+            return corpus
+        if packed_from != audio_dir:
+            if verbose:
+                print("Corpus '{}' was packed from {}, repacking".format(
+                    name, packed_from))
+            return pack_audio_corpus(audio_dir, path, shard_size=shard_size,
+                                     verbose=verbose)
+        signature = _audio_files_signature(audio_dir,
+                                           _find_audio_files(audio_dir))
+        if signature == corpus.index['signature']:
+            return corpus
+        if verbose:
+            print("Audio files changed, repacking", audio_dir)
+    elif verbose:
+        print("Packing", audio_dir)
+    return pack_audio_corpus(audio_dir, path, shard_size=shard_size,
+                             verbose=verbose)
+
+
+class AudioCorpus():
+    """
+    Random access to a corpus packed by `pack_audio_corpus`, with shards
+    memory-mapped so that only the samples read are loaded.
+
+    Arguments
+    ---------
+    path: string
+        Directory of the packed corpus.
+
+    Attributes
+    ----------
+    files: list[str]
+        Paths of the audio files, relative to the directory they were packed
+        from.
+    lengths, sample_rates: np.ndarray
+        Number of samples, and sample rate, of each file.
+
+    Example
+    -------
+    ::
+
+        corpus = load_audio_corpus(fetch_fsdd()['path_dataset'])
+        for x, idxs in corpus.batches(batch_size=64, shuffle=True):
+            Sx = jtfs(x)
+    """
+    def __init__(self, path):
+        with open(os.path.join(path, 'index.json'), 'r') as f:
+            self.index = json.load(f)
+        if self.index['version'] != _AUDIO_CORPUS_VERSION:
+            raise ValueError("Corpus at {} was packed by an incompatible "
+                             "version; repack it.".format(path))
+        self.path = path
+        self.files = self.index['files']
+        self.shards = np.array(self.index['shards'], dtype='int64')
+        self.offsets = np.array(self.index['offsets'], dtype='int64')
+        self.lengths = np.array(self.index['lengths'], dtype='int64')
+        self.sample_rates = np.array(self.index['sample_rates'],
+                                     dtype='int64')
+        n_shards = self.shards.max() + 1 if len(self.shards) else 0
+        self._shards = [
+            np.load(os.path.join(path, 'shard_%06d.npy' % n), mmap_mode='r')
+            for n in range(n_shards)]
+
+    def __len__(self):
+        return len(self.files)
+
+    def __getitem__(self, i):
+        """Samples of the `i`-th file, as a read-only view."""
+        offset = self.offsets[i]
+        return self._shards[self.shards[i]][offset:offset + self.lengths[i]]
+
+    def batch(self, idxs, length=None):
+        """
+        Reads files into a zero-padded (or trimmed) float32 array of shape
+        `(len(idxs), length)`; `length` defaults to the longest file read.
+        """
+        idxs = np.asarray(idxs, dtype='int64')
+        if length is None:
+            length = self.lengths[idxs].max() if len(idxs) else 0
+        x = np.zeros((len(idxs), length), dtype='float32')
+        # read in storage order, to keep disk access sequential
+        for i in np.lexsort((self.offsets[idxs], self.shards[idxs])):
+            n = min(self.lengths[idxs[i]], length)
+            x[i, :n] = self[idxs[i]][:n]
+        return x
+
+    def batches(self, batch_size=32, length=None, shuffle=False, seed=None,
+                drop_last=False):
+        """
+        Iterates over the corpus in batches.
+
+        Arguments
+        ---------
+        batch_size: int, optional
+            Number of files per batch. Defaults to 32.
+        length: int, optional
+            Length each file is zero-padded or trimmed to; see `batch`.
+        shuffle: bool, optional
+            Whether to visit files in random order. Defaults to False.
+        seed: int, optional
+            Seed of the shuffling.
+        drop_last: bool, optional
+            Whether to skip the last batch if smaller than `batch_size`.
+            Defaults to False.
+
+        Yields
+        ------
+        x: np.ndarray
+            Batch of shape `(batch_size, length)`.
+        idxs: np.ndarray
+            Index of each row of `x` into the corpus.
+        """
+        order = np.arange(len(self))
+        if shuffle:
+            np.random.default_rng(seed).shuffle(order)
+        for start in range(0, len(order), batch_size):
+            idxs = order[start:start + batch_size]
+            if drop_last and len(idxs) < batch_size:
+                return
+            yield self.batch(idxs, length), idxs
+
+
 atom_charges=dict(H=1, C=6, O=8, N=7, S=16)
 
 def read_xyz(filename):
@@ -156,39 +484,42 @@ def read_xyz(filename):
     =====
     The file format is #atoms\\nenergy\\nrepeat: atom type\\tx\\ty\\tz"""
 
-    energies = []
-    charges = []
-    positions = []
-    n_atoms = []
-
     with open(filename, "r") as f:
-        content = f.read()
-
-    raw_molecule_txts = content.split("\n\n")
-    for raw_molecule_txt in raw_molecule_txts:
-        s = raw_molecule_txt.split("\n")
-        n_atoms.append(int(s[0]))
-        energies.append(float(s[1]))
-        atom_positions = []
-        molecule_charges = []
-        charges.append(molecule_charges)
-        positions.append(atom_positions)
-        for i, row in zip(range(n_atoms[-1]), s[2:]):
-            atom_type, *str_position = [x for x in row.split(" ") if x]
-            molecule_charges.append(atom_charges[atom_type])
-            pos = np.array(list(map(float, str_position)))
-            atom_positions.append(pos)
-
-    arr_positions = np.zeros((len(n_atoms), max(n_atoms), 3), dtype='float32')
-    for arr_pos, pos, n in zip(arr_positions, positions, n_atoms):
-        arr_pos[:n] = np.array(pos)
+        tokens = f.read().split()
 
+    # each molecule is `n, energy`, then `n` rows of `type, x, y, z`; only the
+    # molecule headers are walked in Python, the rows are gathered in bulk
+    starts = []
+    n_atoms = []
+    i = 0
+    while i < len(tokens):
+        starts.append(i)
+        n_atoms.append(int(tokens[i]))
+        i += 2 + 4 * n_atoms[-1]
+    starts = np.array(starts)
+    n_atoms = np.array(n_atoms)
+    energies = np.array([tokens[i] for i in starts + 1],
+                        dtype='float64').astype('float32')
+
+    # token index of each atom's row, and its slot within the molecule
+    atom_slots = np.arange(n_atoms.sum()) - np.repeat(
+        np.cumsum(n_atoms) - n_atoms, n_atoms)
+    atom_starts = np.repeat(starts + 2, n_atoms) + 4 * atom_slots
+    atom_molecules = np.repeat(np.arange(len(n_atoms)), n_atoms)
+
+    arr_positions = np.zeros((len(n_atoms), n_atoms.max(), 3), dtype='float32')
+    position_idxs = (atom_starts[:, None] + np.arange(1, 4)).ravel()
+    arr_positions[atom_molecules, atom_slots] = np.array(
+        [tokens[i] for i in position_idxs], dtype='float64').reshape(-1, 3)
+
+    atom_types, atom_type_idxs = np.unique([tokens[i] for i in atom_starts],
+                                           return_inverse=True)
+    type_charges = np.array([atom_charges[t] for t in atom_types], dtype='int')
     arr_charges = np.zeros_like(arr_positions[..., 0], dtype='int')
-    for arr_charge, molecule_charges, n in zip(arr_charges, charges, n_atoms):
-        arr_charge[:n] = molecule_charges
+    arr_charges[atom_molecules, atom_slots] = type_charges[atom_type_idxs]
 
     return dict(positions=arr_positions,
-                energies=np.array(energies, dtype='float32'),
+                energies=energies,
                 charges=arr_charges)
 
 
@@ -199,40 +530,87 @@ def _pca_align_positions(positions, masks, inplace=False):
     else:
         output = positions
 
-    masks = masks.astype('bool')
-    for pos, mask, out in zip(positions, masks, output):
-        masked_pos = pos[mask]
-        masked_pos -= masked_pos.mean(0)
-        cov = masked_pos.T.dot(masked_pos.copy())
-        v, V = np.linalg.eigh(cov)
-        aligned = masked_pos.dot(V[:, ::-1])  # largest to smallest
-        out[mask] = aligned
+    # all molecules at once, padding atoms are zeroed so they don't contribute
+    masks = masks.astype('bool')[..., None]
+    n_atoms = np.maximum(masks.sum(1, keepdims=True), 1)
+    masked_pos = np.where(masks, positions, 0)
+    masked_pos = np.where(
+        masks, masked_pos - masked_pos.sum(1, keepdims=True) / n_atoms, 0)
+    cov = np.matmul(masked_pos.transpose(0, 2, 1), masked_pos)
+    v, V = np.linalg.eigh(cov)
+    aligned = np.matmul(masked_pos, V[..., ::-1])  # largest to smallest
+    output[...] = np.where(masks, aligned, output)
 
     if not inplace:
         return output
 
 
+_QM7_ARRAYS = ('positions', 'energies', 'charges')
+
+
+def _save_qm7(path, qm7):
+    os.makedirs(path, exist_ok=True)
+    # write then rename, so concurrent readers never see a partial file
+    for name in _QM7_ARRAYS:
+        filename = os.path.join(path, name + '.npy')
+        tmp_filename = '%s.%s.tmp.npy' % (filename[:-4], os.getpid())
+        np.save(tmp_filename, qm7[name])
+        os.replace(tmp_filename, filename)
+
+
+def _load_qm7(path, mmap=True):
+    filenames = [os.path.join(path, name + '.npy') for name in _QM7_ARRAYS]
+    if not all(os.path.isfile(f) for f in filenames):
+        return None
+    return {name: np.load(f, mmap_mode='r' if mmap else None)
+            for name, f in zip(_QM7_ARRAYS, filenames)}
+
 
 qm7_url = "https://qmml.org/Datasets/gdb7-12.zip"
-def fetch_qm7(align=True, cache=True):
-    """Fetches the GDB7-12 dataset"""
+def fetch_qm7(align=True, cache=True, mmap=True):
+    """Fetches the GDB7-12 dataset
+
+    Parameters
+    ==========
+
+    align: bool, optional
+        Whether to rotate each molecule so that its longest axis is x.
+        Defaults to True
+    cache: bool, optional
+        Whether to load the parsed (and aligned) dataset from, or save it to,
+        `caching.get_cache_dir('qm7')`. Defaults to True
+    mmap: bool, optional
+        If True, cached arrays are memory-mapped read-only rather than read
+        into memory. Defaults to True
+
+    Returns
+    =======
+    dictionary with keys 'positions', 'energies' and 'charges'"""
 
     if cache:
         cache_path = get_cache_dir("qm7")
+        aligned_path = os.path.join(cache_path, "aligned")
+        unaligned_path = os.path.join(cache_path, "unaligned")
         if align:
-            aligned_filename = os.path.join(cache_path, "qm7_aligned.npz")
-            if os.path.exists(aligned_filename):
-                f = np.load(aligned_filename)
-                return dict(**f)
+            qm7 = _load_qm7(aligned_path, mmap)
+            if qm7 is not None:
+                return qm7
 
         # load unaligned if existent, align if required
+        qm7 = _load_qm7(unaligned_path, mmap=False)
         unaligned_filename = os.path.join(cache_path, "qm7.npz")
-        if os.path.exists(unaligned_filename):
-            f = np.load(unaligned_filename)
+        if qm7 is None and os.path.exists(unaligned_filename):
+            # cache written by earlier versions
+            with np.load(unaligned_filename) as f:
+                qm7 = dict(**f)
+            _save_qm7(unaligned_path, qm7)
+        if qm7 is not None:
             if align:
-                _pca_align_positions(f['positions'], f['charges'], inplace=True)
-                np.savez(aligned_filename, **f)
-            return dict(**f)
+                _pca_align_positions(qm7['positions'], qm7['charges'],
+                                     inplace=True)
+                _save_qm7(aligned_path, qm7)
+                return _load_qm7(aligned_path, mmap)
+            return _load_qm7(unaligned_path, mmap)
 
     path = get_dataset_dir("qm7")
     qm7_file = os.path.join(path, "dsgdb7ae.xyz")
@@ -246,11 +624,13 @@ def fetch_qm7(align=True, cache=True):
 
     qm7 = read_xyz(qm7_file)
     if cache:
-        np.savez(unaligned_filename, **qm7)
+        _save_qm7(unaligned_path, qm7)
 
     if align:
         _pca_align_positions(qm7['positions'], qm7['charges'], inplace=True)
         if cache:
-            np.savez(aligned_filename, **qm7)
+            _save_qm7(aligned_path, qm7)
 
+    if cache:
+        return _load_qm7(aligned_path if align else unaligned_path, mmap)
     return qm7
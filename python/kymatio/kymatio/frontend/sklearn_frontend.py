@@ -1,3 +1,8 @@
+import math
+import numbers
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.base import BaseEstimator, TransformerMixin
 
 
@@ -6,13 +11,55 @@ class ScatteringTransformerMixin(BaseEstimator, TransformerMixin):
         # No fitting necessary.
         return self
 
+    def get_params(self, deep=True):
+        # the transform derives attributes from some arguments (e.g. `F=None`
+        # becomes `2**J_fr`), so report them as passed, as `clone` requires
+        params = getattr(self, '_init_params', None)
+        if params is None:
+            return super().get_params(deep)
+        return dict(params)
+
+    def set_params(self, **params):
+        if getattr(self, '_init_params', None) is None:
+            return super().set_params(**params)
+        for name in params:
+            if name not in self._init_params:
+                raise ValueError("Invalid parameter '{}' for estimator "
+                                 "{}.".format(name, type(self).__name__))
+        # filters depend on the parameters, so rebuild the transform
+        self.__init__(**dict(self._init_params, **params))
+        return self
+
     def predict(self, x):
         n_samples = x.shape[0]
-        x = x.reshape((-1,) + self.shape)
-        Sx = self.scattering(x)
-        Sx = Sx.reshape(n_samples, -1)
+        shape = ((self.shape,) if isinstance(self.shape, numbers.Integral)
+                 else tuple(self.shape))
+        n_jobs = effective_n_jobs(getattr(self, 'n_jobs', None))
+        batch_size = getattr(self, 'batch_size', None)
+        if batch_size is None:
+            batch_size = max(math.ceil(n_samples / n_jobs), 1)
+
+        def transform(start, stop):
+            Sx = self.scattering(x[start:stop].reshape((-1,) + shape))
+            return Sx.reshape(stop - start, -1)
 
-        return Sx
+        if batch_size >= n_samples:
+            return transform(0, n_samples)
+
+        # the first row determines the output's size and type
+        Sx0 = transform(0, 1)
+        out = np.empty((n_samples, Sx0.shape[1]), dtype=Sx0.dtype)
+        out[:1] = Sx0
+
+        def transform_into(start):
+            stop = min(start + batch_size, n_samples)
+            out[start:stop] = transform(start, stop)
+
+        # threads share the filterbank, and FFTs release the GIL
+        Parallel(n_jobs=n_jobs, prefer='threads')(
+            delayed(transform_into)(start)
+            for start in range(1, n_samples, batch_size))
+        return out
 
     transform = predict
 
@@ -29,6 +76,11 @@ class ScatteringTransformerMixin(BaseEstimator, TransformerMixin):
         `sklearn.base`. As a result, it supports calculating the scattering
         transform by calling the `predict` and `transform` methods. By
         extension, it can be included as part of a scikit-learn `Pipeline`.
+
+        Rows of the input are transformed in chunks of `batch_size` (default
+        `n_samples / n_jobs`), across `n_jobs` threads (default 1, `-1` for
+        all cores) which share the filterbank, into a preallocated
+        `(n_samples, n_features)` output.
         """
 
     _doc_sample = 'np.random.randn(np.prod({shape}))'
@@ -29,9 +29,12 @@ def scattering1d(x, pad_fn, unpad, backend, J, log2_T, psi1, psi2, phi,
         The array `phi[j]` is a real-valued filter.
     J : int
         scale of the scattering
-    log2_T : int
+    log2_T : int / list[int]
         (log2 of) temporal support of low-pass filter, controlling amount of
-        imposed time-shift invariance and maximum subsampling
+        imposed time-shift invariance and maximum subsampling.
+        If a list, `phi` must be a list of same length, one per `log2_T`, and
+        a list of outputs is returned (multi-scale pyramid). Moduli are
+        computed once, subsampled as for `min(log2_T)`.
     pad_left : int, optional
         how much to pad the signal on the left. Defaults to `0`
     pad_right : int, optional
@@ -66,11 +69,14 @@ def scattering1d(x, pad_fn, unpad, backend, J, log2_T, psi1, psi2, phi,
     concatenate = backend.concatenate
 
 
+    # multi-scale pyramid: share moduli, lowpass per `log2_T`
+    pyramid = isinstance(log2_T, (list, tuple))
+    log2_Ts = log2_T if pyramid else [log2_T]
+    phis = phi if pyramid else [phi]
+    log2_T = min(log2_Ts)
+
     # S is simply a dictionary if we do not perform the averaging...
-    batch_size = x.shape[0]
-    kJ = max(log2_T - oversampling, 0)
-    temporal_size = ind_end[kJ] - ind_start[kJ]
-    out_S_0, out_S_1, out_S_2 = [], [], []
+    out_S_0, out_S_1, out_S_2 = [[[] for _ in log2_Ts] for _ in range(3)]
 
     # pad to a dyadic size and make it complex
     U_0 = pad_fn(x)
@@ -78,19 +84,20 @@ def scattering1d(x, pad_fn, unpad, backend, J, log2_T, psi1, psi2, phi,
     U_0_hat = rfft(U_0)
 
     # Get S0
-    k0 = max(log2_T - oversampling, 0)
+    for log2_T_i, phi_i, out_S_0_i in zip(log2_Ts, phis, out_S_0):
+        k0 = max(log2_T_i - oversampling, 0)
 
-    if average:
-        S_0_c = cdgmm(U_0_hat, phi[0])
-        S_0_hat = subsample_fourier(S_0_c, 2**k0)
-        S_0_r = irfft(S_0_hat)
+        if average:
+            S_0_c = cdgmm(U_0_hat, phi_i[0])
+            S_0_hat = subsample_fourier(S_0_c, 2**k0)
+            S_0_r = irfft(S_0_hat)
 
-        S_0 = unpad(S_0_r, ind_start[k0], ind_end[k0])
-    else:
-        S_0 = x
-    out_S_0.append({'coef': S_0,
-                    'j': (),
-                    'n': ()})
+            S_0 = unpad(S_0_r, ind_start[k0], ind_end[k0])
+        else:
+            S_0 = x
+        out_S_0_i.append({'coef': S_0,
+                          'j': (),
+                          'n': ()})
 
     # First order:
     for n1 in range(len(psi1)):
@@ -110,20 +117,21 @@ def scattering1d(x, pad_fn, unpad, backend, J, log2_T, psi1, psi2, phi,
         if average or max_order > 1:
             U_1_hat = rfft(U_1_m)
 
-        if average:
-            # Convolve with phi_J
-            k1_J = max(log2_T - k1 - oversampling, 0)
-            S_1_c = cdgmm(U_1_hat, phi[k1])
-            S_1_hat = subsample_fourier(S_1_c, 2**k1_J)
-            S_1_r = irfft(S_1_hat)
+        for log2_T_i, phi_i, out_S_1_i in zip(log2_Ts, phis, out_S_1):
+            if average:
+                # Convolve with phi_J
+                k1_J = max(log2_T_i - k1 - oversampling, 0)
+                S_1_c = cdgmm(U_1_hat, phi_i[k1])
+                S_1_hat = subsample_fourier(S_1_c, 2**k1_J)
+                S_1_r = irfft(S_1_hat)
 
-            S_1 = unpad(S_1_r, ind_start[k1_J + k1], ind_end[k1_J + k1])
-        else:
-            S_1 = unpad(U_1_m, ind_start[k1], ind_end[k1])
+                S_1 = unpad(S_1_r, ind_start[k1_J + k1], ind_end[k1_J + k1])
+            else:
+                S_1 = unpad(U_1_m, ind_start[k1], ind_end[k1])
 
-        out_S_1.append({'coef': S_1,
-                        'j': (j1,),
-                        'n': (n1,)})
+            out_S_1_i.append({'coef': S_1,
+                              'j': (j1,),
+                              'n': (n1,)})
 
         if max_order == 2:
             # 2nd order
@@ -146,29 +154,37 @@ def scattering1d(x, pad_fn, unpad, backend, J, log2_T, psi1, psi2, phi,
                     if average:
                         U_2_hat = rfft(U_2_m)
 
-                        # Convolve with phi_J
-                        k2_J = max(log2_T - k2 - k1 - oversampling, 0)
-
-                        S_2_c = cdgmm(U_2_hat, phi[k1 + k2])
-                        S_2_hat = subsample_fourier(S_2_c, 2**k2_J)
-                        S_2_r = irfft(S_2_hat)
-
-                        S_2 = unpad(S_2_r, ind_start[k1 + k2 + k2_J], ind_end[k1 + k2 + k2_J])
-                    else:
-                        S_2 = unpad(U_2_m, ind_start[k1 + k2], ind_end[k1 + k2])
-
-                    out_S_2.append({'coef': S_2,
-                                    'j': (j1, j2),
-                                    'n': (n1, n2)})
-
-    out_S = []
-    out_S.extend(out_S_0)
-    out_S.extend(out_S_1)
-    out_S.extend(out_S_2)
-
-    if out_type == 'array' and average:
-        out_S = concatenate([x['coef'] for x in out_S])
-
-    return out_S
+                    for log2_T_i, phi_i, out_S_2_i in zip(log2_Ts, phis,
+                                                          out_S_2):
+                        if average:
+                            # Convolve with phi_J
+                            k2_J = max(log2_T_i - k2 - k1 - oversampling, 0)
+
+                            S_2_c = cdgmm(U_2_hat, phi_i[k1 + k2])
+                            S_2_hat = subsample_fourier(S_2_c, 2**k2_J)
+                            S_2_r = irfft(S_2_hat)
+
+                            S_2 = unpad(S_2_r, ind_start[k1 + k2 + k2_J],
+                                        ind_end[k1 + k2 + k2_J])
+                        else:
+                            S_2 = unpad(U_2_m, ind_start[k1 + k2],
+                                        ind_end[k1 + k2])
+
+                        out_S_2_i.append({'coef': S_2,
+                                          'j': (j1, j2),
+                                          'n': (n1, n2)})
+
+    outs = []
+    for out_S_0_i, out_S_1_i, out_S_2_i in zip(out_S_0, out_S_1, out_S_2):
+        out_S = []
+        out_S.extend(out_S_0_i)
+        out_S.extend(out_S_1_i)
+        out_S.extend(out_S_2_i)
+
+        if out_type == 'array' and average:
+            out_S = concatenate([x['coef'] for x in out_S])
+        outs.append(out_S)
+
+    return outs if pyramid else outs[0]
 
 __all__ = ['scattering1d']
@@ -7,12 +7,30 @@ def timefrequency_scattering1d(
         pad_fn, pad_left=0, pad_right=0, ind_start=None, ind_end=None,
         oversampling=0, oversampling_fr=0, aligned=True, average=True,
         average_global=None, average_global_phi=None, out_type='array',
-        out_3D=False, out_exclude=None, pad_mode='zero'):
+        out_3D=False, out_exclude=None, pad_mode='zero', paths_exclude=None):
     """
     Main function implementing the Joint Time-Frequency Scattering transform.
 
     Below is implementation documentation for developers.
 
+    Multiple heads
+    ==============
+    `scf` may be a list of `_FrequencyScatteringBase`, all sharing time
+    scattering (padding, first order, and second-order temporal wavelet
+    transforms), with one output returned per head. The first head uses
+    `aligned, oversampling_fr, out_3D, out_type` as passed, others their own
+    (`scf.aligned`, etc). `paths_exclude` may then be a list, one per head.
+
+    Path pruning
+    ============
+    `paths_exclude` is a dict mapping a joint pair name to a dict of
+    `(n2, n1_fr): fill` entries. Pruned paths skip their frequential
+    scattering & joint lowpassing; if all joint paths of a given `n2` are
+    pruned, so is its wavelet transform over time. `fill` is either `None`,
+    dropping the coefficient, or a dict with keys `'shape', 'j', 's', 'stride'`
+    (`'shape'` excluding batch dim), appending zeros in its place.
+    See `toolkit.prune_jtfs`.
+
     Frequential scattering
     ======================
 
@@ -593,20 +611,33 @@ def timefrequency_scattering1d(
     """
     # pack for later
     B = backend
-    average_fr = scf.average_fr
     if out_exclude is None:
         out_exclude = []
     N = x.shape[-1]
-    commons = (B, scf, out_exclude, aligned, oversampling_fr, average_fr,
-               out_3D, oversampling, average, average_global, average_global_phi,
-               unpad, log2_T, phi, ind_start, ind_end, N)
+
+    # frequential scattering heads, all sharing time scattering; first head
+    # takes frequential args as passed, others from their own `scf`
+    multi_head = isinstance(scf, (list, tuple))
+    scfs = scf if multi_head else [scf]
+    if not isinstance(paths_exclude, (list, tuple)):
+        paths_exclude = [paths_exclude] + [None] * (len(scfs) - 1)
+    heads = []
+    for i, scf in enumerate(scfs):
+        if i != 0:
+            aligned, oversampling_fr, out_3D, out_type = (
+                scf.aligned, scf.oversampling_fr, scf.out_3D, scf.out_type)
+        commons = (B, scf, out_exclude, aligned, oversampling_fr,
+                   scf.average_fr, out_3D, oversampling, average,
+                   average_global, average_global_phi, unpad, log2_T, phi,
+                   ind_start, ind_end, N, paths_exclude[i] or {}, x)
+        heads.append({'commons': commons, 'out_type': out_type,
+                      'out_S_1': {'phi_t * phi_f': []},
+                      'out_S_2': {'psi_t * psi_f': [[], []],
+                                  'psi_t * phi_f': [],
+                                  'phi_t * psi_f': [[]]}})
 
     out_S_0 = []
     out_S_1_tm = []
-    out_S_1 = {'phi_t * phi_f': []}
-    out_S_2 = {'psi_t * psi_f': [[], []],
-               'psi_t * phi_f': [],
-               'phi_t * psi_f': [[]]}
 
     # pad to a dyadic size and make it complex
     U_0 = pad_fn(x)
@@ -728,6 +759,146 @@ def timefrequency_scattering1d(
 
     # Frequential averaging over time averaged coefficients ##################
     # `U1 * (phi_t * phi_f)` pair
+    for head in heads:
+        head['S_1_tm_hat'] = _phi_t_frequency_lowpass(
+            S_1_tm_list, include_phi_t, head['commons'], head['out_S_1'])
+
+    ##########################################################################
+    # Joint scattering: separable convolutions (along time & freq), and low-pass
+    # `U1 * (psi_t * psi_f)` (up & down), and `U1 * (psi_t * phi_f)`
+    skip_spinned = bool('psi_t * psi_f_up'   in out_exclude and
+                        'psi_t * psi_f_down' in out_exclude)
+    if not (skip_spinned and 'psi_t * phi_f' in out_exclude):
+        for n2 in range(len(psi2)):
+            j2 = psi2[n2]['j']
+            if j2 == 0:
+                continue
+
+            heads_n2 = []
+            for head in heads:
+                commons, out_S_2 = head['commons'], head['out_S_2']
+                _, scf, _, aligned, _, _, out_3D, *_ = commons
+                # frequential pad
+                if aligned and out_3D:
+                    pad_fr = scf.J_pad_frs_max
+                else:
+                    pad_fr = scf.J_pad_frs[n2]
+
+                # skip all convolutions if every joint path of `n2` is pruned;
+                # `_frequency_*` then only fill or drop
+                if commons[-2] and _n2_pruned(n2, pad_fr, skip_spinned,
+                                              commons):
+                    if not skip_spinned:
+                        _frequency_scattering(None, j2, n2, pad_fr, None, None,
+                                              commons, out_S_2['psi_t * psi_f'])
+                    if 'psi_t * phi_f' not in out_exclude:
+                        _frequency_lowpass(None, None, j2, n2, pad_fr, None,
+                                           None, commons,
+                                           out_S_2['psi_t * phi_f'])
+                else:
+                    heads_n2.append((head, pad_fr))
+            if not heads_n2:
+                continue
+
+            Y_2_list = []
+            # Wavelet transform over time
+            for n1 in range(len(psi1)):
+                # Retrieve first-order coefficient in the list
+                j1 = psi1[n1]['j']
+                if j1 >= j2:
+                    continue
+                U_1_hat = U_1_hat_list[n1]
+
+                # what we subsampled in 1st-order
+                sub1_adj = min(j1, log2_T) if average else j1
+                k1 = max(sub1_adj - oversampling, 0)
+                # what we subsample now in 2nd
+                sub2_adj = min(j2, log2_T) if average else j2
+                k2 = max(sub2_adj - k1 - oversampling, 0)
+
+                # Convolution and downsampling
+                Y_2_c = B.cdgmm(U_1_hat, psi2[n2][k1])
+                Y_2_hat = B.subsample_fourier(Y_2_c, 2**k2)
+                Y_2_c = B.ifft(Y_2_hat)
+
+                # sum is same for all `n1`
+                k1_plus_k2 = k1 + k2
+                Y_2_c, trim_tm = _maybe_unpad_time(Y_2_c, k1_plus_k2, commons2)
+                Y_2_list.append(Y_2_c)
+
+            # Transform over frequency, per head ##############################
+            for head, pad_fr in heads_n2:
+                commons, out_S_2 = head['commons'], head['out_S_2']
+                scf = commons[1]
+
+                if scf.pad_mode_fr == 'custom':
+                    Y_2_arr = scf.pad_fn_fr(Y_2_list, pad_fr, scf, B)
+                else:
+                    Y_2_arr = _right_pad(Y_2_list, pad_fr, scf, B)
+
+                # temporal pad modification
+                if pad_mode == 'reflect' and average:
+                    # `=` since tensorflow makes copy
+                    Y_2_arr = B.conj_reflections(Y_2_arr,
+                                                 ind_start[trim_tm][k1_plus_k2],
+                                                 ind_end[  trim_tm][k1_plus_k2],
+                                                 k1_plus_k2, N,
+                                                 pad_left, pad_right, trim_tm)
+
+                # swap axes & map to Fourier domain to prepare for conv
+                # along freq
+                Y_2_hat = B.fft(Y_2_arr, axis=-2)
+
+                # Transform over frequency + low-pass, for both spins ########
+                # `* psi_f` part of `U1 * (psi_t * psi_f)`
+                if not skip_spinned:
+                    _frequency_scattering(Y_2_hat, j2, n2, pad_fr, k1_plus_k2,
+                                          trim_tm, commons,
+                                          out_S_2['psi_t * psi_f'])
+
+                # Low-pass over frequency ####################################
+                # `* phi_f` part of `U1 * (psi_t * phi_f)`
+                if 'psi_t * phi_f' not in out_exclude:
+                    _frequency_lowpass(Y_2_hat, Y_2_arr, j2, n2, pad_fr,
+                                       k1_plus_k2, trim_tm, commons,
+                                       out_S_2['psi_t * phi_f'])
+
+    ##########################################################################
+    # `U1 * (phi_t * psi_f)`
+    if 'phi_t * psi_f' not in out_exclude:
+        # take largest subsampling factor
+        j2 = log2_T
+        k1_plus_k2 = (max(log2_T - oversampling, 0) if not average_global_phi else
+                      log2_T)
+        # n2_time = U_0.shape[-1] // 2**max(j2 - oversampling, 0)
+
+        for head in heads:
+            commons = head['commons']
+            pad_fr = commons[1].J_pad_frs_max
+
+            # reuse from first-order scattering
+            Y_2_hat = head['S_1_tm_hat']
+
+            # Transform over frequency + low-pass
+            # `* psi_f` part of `U1 * (phi_t * psi_f)`
+            _frequency_scattering(Y_2_hat, j2, -1, pad_fr, k1_plus_k2, 0,
+                                  commons, head['out_S_2']['phi_t * psi_f'],
+                                  spin_down=False)
+
+    ##########################################################################
+    # pack outputs & return
+    outs = [_pack_out(out_S_0, out_S_1_tm, head) for head in heads]
+    return outs if multi_head else outs[0]
+
+
+def _phi_t_frequency_lowpass(S_1_tm_list, include_phi_t, commons, out_S_1):
+    """`U1 * (phi_t * phi_f)`; returns frequential FFT of time-averaged `U1`
+    for reuse in `U1 * (phi_t * psi_f)`, if it was computed."""
+    (B, scf, out_exclude, aligned, oversampling_fr, average_fr, out_3D,
+     oversampling, average, average_global, average_global_phi, unpad, log2_T,
+     *_) = commons
+    S_1_tm_hat = None
+
     if include_phi_t:
         # zero-pad along frequency
         pad_fr = scf.J_pad_frs_max
@@ -799,99 +970,13 @@ def timefrequency_scattering1d(
             'stride': stride})
     else:
         scf.__total_conv_stride_over_U1 = -1
+    return S_1_tm_hat
 
-    ##########################################################################
-    # Joint scattering: separable convolutions (along time & freq), and low-pass
-    # `U1 * (psi_t * psi_f)` (up & down), and `U1 * (psi_t * phi_f)`
-    skip_spinned = bool('psi_t * psi_f_up'   in out_exclude and
-                        'psi_t * psi_f_down' in out_exclude)
-    if not (skip_spinned and 'psi_t * phi_f' in out_exclude):
-        for n2 in range(len(psi2)):
-            j2 = psi2[n2]['j']
-            if j2 == 0:
-                continue
-
-            Y_2_list = []
-            # Wavelet transform over time
-            for n1 in range(len(psi1)):
-                # Retrieve first-order coefficient in the list
-                j1 = psi1[n1]['j']
-                if j1 >= j2:
-                    continue
-                U_1_hat = U_1_hat_list[n1]
-
-                # what we subsampled in 1st-order
-                sub1_adj = min(j1, log2_T) if average else j1
-                k1 = max(sub1_adj - oversampling, 0)
-                # what we subsample now in 2nd
-                sub2_adj = min(j2, log2_T) if average else j2
-                k2 = max(sub2_adj - k1 - oversampling, 0)
-
-                # Convolution and downsampling
-                Y_2_c = B.cdgmm(U_1_hat, psi2[n2][k1])
-                Y_2_hat = B.subsample_fourier(Y_2_c, 2**k2)
-                Y_2_c = B.ifft(Y_2_hat)
 
-                # sum is same for all `n1`
-                k1_plus_k2 = k1 + k2
-                Y_2_c, trim_tm = _maybe_unpad_time(Y_2_c, k1_plus_k2, commons2)
-                Y_2_list.append(Y_2_c)
-
-            # frequential pad
-            if aligned and out_3D:
-                pad_fr = scf.J_pad_frs_max
-            else:
-                pad_fr = scf.J_pad_frs[n2]
-
-            if scf.pad_mode_fr == 'custom':
-                Y_2_arr = scf.pad_fn_fr(Y_2_list, pad_fr, scf, B)
-            else:
-                Y_2_arr = _right_pad(Y_2_list, pad_fr, scf, B)
-
-            # temporal pad modification
-            if pad_mode == 'reflect' and average:
-                # `=` since tensorflow makes copy
-                Y_2_arr = B.conj_reflections(Y_2_arr,
-                                             ind_start[trim_tm][k1_plus_k2],
-                                             ind_end[  trim_tm][k1_plus_k2],
-                                             k1_plus_k2, N,
-                                             pad_left, pad_right, trim_tm)
-
-            # swap axes & map to Fourier domain to prepare for conv along freq
-            Y_2_hat = B.fft(Y_2_arr, axis=-2)
-
-            # Transform over frequency + low-pass, for both spins ############
-            # `* psi_f` part of `U1 * (psi_t * psi_f)`
-            if not skip_spinned:
-                _frequency_scattering(Y_2_hat, j2, n2, pad_fr, k1_plus_k2,
-                                      trim_tm, commons, out_S_2['psi_t * psi_f'])
-
-            # Low-pass over frequency ########################################
-            # `* phi_f` part of `U1 * (psi_t * phi_f)`
-            if 'psi_t * phi_f' not in out_exclude:
-                _frequency_lowpass(Y_2_hat, Y_2_arr, j2, n2, pad_fr, k1_plus_k2,
-                                   trim_tm, commons, out_S_2['psi_t * phi_f'])
-
-    ##########################################################################
-    # `U1 * (phi_t * psi_f)`
-    if 'phi_t * psi_f' not in out_exclude:
-        # take largest subsampling factor
-        j2 = log2_T
-        k1_plus_k2 = (max(log2_T - oversampling, 0) if not average_global_phi else
-                      log2_T)
-        pad_fr = scf.J_pad_frs_max
-        # n2_time = U_0.shape[-1] // 2**max(j2 - oversampling, 0)
-
-        # reuse from first-order scattering
-        Y_2_hat = S_1_tm_hat
-
-        # Transform over frequency + low-pass
-        # `* psi_f` part of `U1 * (phi_t * psi_f)`
-        _frequency_scattering(Y_2_hat, j2, -1, pad_fr, k1_plus_k2, 0, commons,
-                              out_S_2['phi_t * psi_f'], spin_down=False)
-
-    ##########################################################################
-    # pack outputs & return
+def _pack_out(out_S_0, out_S_1_tm, head):
+    B, _, out_exclude, _, _, _, out_3D, *_, paths_exclude, _ = head['commons']
+    out_type, out_S_1, out_S_2 = (head['out_type'], head['out_S_1'],
+                                  head['out_S_2'])
     out = {}
     out['S0'] = out_S_0
     out['S1'] = out_S_1_tm
@@ -901,9 +986,12 @@ def timefrequency_scattering1d(
     out['psi_t * psi_f_up']   = out_S_2['psi_t * psi_f'][0]
     out['psi_t * psi_f_down'] = out_S_2['psi_t * psi_f'][1]
 
-    # delete excluded
+    # delete excluded, and pairs emptied by pruning
     for pair in out_exclude:
         del out[pair]
+    for pair in paths_exclude:
+        if pair in out and len(out[pair]) == 0:
+            del out[pair]
 
     # warn of any zero-sized coefficients
     for pair in out:
@@ -960,15 +1048,16 @@ def _frequency_scattering(Y_2_hat, j2, n2, pad_fr, k1_plus_k2, trim_tm, commons,
 
     # Transform over frequency + low-pass, for both spins (if `spin_down`)
     for s1_fr, (spin, psi1_f) in enumerate(zip(spins, psi1_fs)):
+        pair = _spin_to_pair[spin]
+        if pair in out_exclude:
+            # would be deleted from output anyway
+            continue
         for n1_fr in range(len(psi1_f)):
-            if scf.sampling_psi_fr == 'exclude':
-                # 'exclude' is scale-oriented but to be safe also check
-                # if padded length is available
-                if subsample_equiv_due_to_pad not in psi1_f[n1_fr]:
-                    continue
-                width = psi1_f[n1_fr]['width'][subsample_equiv_due_to_pad]
-                if width > scf.N_frs[n2]:
-                    continue
+            if _n1_fr_excluded(psi1_f, n1_fr, subsample_equiv_due_to_pad, n2,
+                               scf):
+                continue
+            if _fill_pruned(pair, n2, n1_fr, out_S_2[s1_fr], commons):
+                continue
 
             # compute subsampling
             j1_fr = psi1_f[n1_fr]['j'][subsample_equiv_due_to_pad]
@@ -1004,6 +1093,8 @@ def _frequency_scattering(Y_2_hat, j2, n2, pad_fr, k1_plus_k2, trim_tm, commons,
 def _frequency_lowpass(Y_2_hat, Y_2_arr, j2, n2, pad_fr, k1_plus_k2, trim_tm,
                        commons, out_S_2):
     B, scf, _, aligned, oversampling_fr, average_fr, *_ = commons
+    if _fill_pruned('psi_t * phi_f', n2, -1, out_S_2, commons):
+        return
 
     subsample_equiv_due_to_pad = scf.J_pad_frs_max_init - pad_fr
 
@@ -1046,7 +1137,7 @@ def _joint_lowpass(U_2_m, n2, n1_fr, subsample_equiv_due_to_pad, n1_fr_subsample
                    k1_plus_k2, total_conv_stride_over_U1, trim_tm, commons):
     (B, scf, _, aligned, oversampling_fr, average_fr, out_3D, oversampling,
      average, average_global, average_global_phi, unpad, log2_T, phi,
-     ind_start, ind_end, N) = commons
+     ind_start, ind_end, N, *_) = commons
 
     # compute subsampling logic ##############################################
     global_averaged_fr = (scf.average_fr_global if n1_fr != -1 else
@@ -1164,6 +1255,63 @@ def _joint_lowpass(U_2_m, n2, n1_fr, subsample_equiv_due_to_pad, n1_fr_subsample
 
 
 #### helper methods ##########################################################
+_spin_to_pair = {1: 'psi_t * psi_f_up', -1: 'psi_t * psi_f_down',
+                 0: 'phi_t * psi_f'}
+
+
+def _n1_fr_excluded(psi1_f, n1_fr, subsample_equiv_due_to_pad, n2, scf):
+    """Whether `psi1_f[n1_fr]` is unavailable at `n2`'s padding with
+    `sampling_psi_fr='exclude'`."""
+    if scf.sampling_psi_fr == 'exclude':
+        # 'exclude' is scale-oriented but to be safe also check
+        # if padded length is available
+        if subsample_equiv_due_to_pad not in psi1_f[n1_fr]:
+            return True
+        width = psi1_f[n1_fr]['width'][subsample_equiv_due_to_pad]
+        if width > scf.N_frs[n2]:
+            return True
+    return False
+
+
+def _fill_pruned(pair, n2, n1_fr, out_list, commons):
+    """Returns True if the path is pruned, appending zeros to `out_list`
+    if it's pruned with a fill template (else it's dropped)."""
+    B, *_, paths_exclude, x = commons
+    paths = paths_exclude.get(pair, None)
+    if paths is None or (n2, n1_fr) not in paths:
+        return False
+    fill = paths[(n2, n1_fr)]
+    if fill is not None:
+        coef = B.zeros_like(x, (x.shape[0], *fill['shape']))
+        out_list.append({'coef': coef, 'j': fill['j'], 'n': (n2, n1_fr),
+                         's': fill['s'], 'stride': fill['stride']})
+    return True
+
+
+def _n2_pruned(n2, pad_fr, skip_spinned, commons):
+    """Whether every to-be-output joint path of `n2` is pruned."""
+    scf, out_exclude, *_, paths_exclude, _ = commons[1:]
+
+    def pruned(pair, n1_fr):
+        return (n2, n1_fr) in paths_exclude.get(pair, ())
+
+    if 'psi_t * phi_f' not in out_exclude and not pruned('psi_t * phi_f', -1):
+        return False
+    if not skip_spinned:
+        subsample_equiv_due_to_pad = scf.J_pad_frs_max_init - pad_fr
+        for spin, psi1_f in ((1, scf.psi1_f_fr_up), (-1, scf.psi1_f_fr_down)):
+            pair = _spin_to_pair[spin]
+            if pair in out_exclude:
+                continue
+            for n1_fr in range(len(psi1_f)):
+                if _n1_fr_excluded(psi1_f, n1_fr, subsample_equiv_due_to_pad,
+                                   n2, scf):
+                    continue
+                if not pruned(pair, n1_fr):
+                    return False
+    return True
+
+
 def _right_pad(coeff_list, pad_fr, scf, B):
     if scf.pad_mode_fr == 'conj-reflect-zero':
         return _pad_conj_reflect_zero(coeff_list, pad_fr, scf.N_frs_max, B)
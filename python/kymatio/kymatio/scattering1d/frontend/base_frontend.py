@@ -36,6 +36,7 @@ class ScatteringBase1D(ScatteringBase):
         self.normalize = normalize
         self.r_psi = r_psi if isinstance(r_psi, tuple) else (r_psi, r_psi)
         self.backend = backend
+        self.max_memory = None
 
     def build(self):
         """Set up padding and filters
@@ -92,6 +93,17 @@ class ScatteringBase1D(ScatteringBase):
             raise ValueError(("2**J cannot exceed input length (rounded up to "
                               "pow2) (got {} > {})".format(2**(self.J), mx)))
 
+        # multi-scale `T`: build for the largest, see `create_filters`
+        self.T_pyramid = None
+        if isinstance(self.T, (list, tuple)):
+            if not self.average:
+                raise ValueError("list `T` requires `average=True`")
+            elif len(self.T) == 0 or 'global' in self.T:
+                raise ValueError("list `T` must be non-empty and contain "
+                                 "only ints (got %s)" % str(self.T))
+            self.T_pyramid = list(self.T)
+            self.T = max(self.T_pyramid)
+
         # check T or set default
         if self.T is None:
             self.T = 2**(self.J)
@@ -102,6 +114,9 @@ class ScatteringBase1D(ScatteringBase):
                               "cannot exceed input length (got {} > {})"
                               ).format(self.T, self.N))
         self.log2_T = math.floor(math.log2(self.T))
+        self.log2_T_pyramid = (None if self.T_pyramid is None else
+                               [math.floor(math.log2(T))
+                                for T in self.T_pyramid])
         self.average_global_phi = bool(self.T == mx)
         self.average_global = bool(self.average_global_phi and self.average)
 
@@ -153,6 +168,61 @@ class ScatteringBase1D(ScatteringBase):
                     p[k][M//2 + 1:] = 0  # zero negatives
                     p[k][M//2] /= 2      # halve Nyquist
 
+        # lowpass per `T` of the pyramid; the wavelets, whose normalization
+        # depends on `T`, are those of `max(T)` for all levels
+        self.phi_f_pyramid = None
+        if self.T_pyramid is not None:
+            self.phi_f_pyramid = [scattering_filter_factory(
+                self.J_pad, self.J, self.Q, T, normalize=self.normalize,
+                criterion_amplitude=self.criterion_amplitude, r_psi=self.r_psi,
+                sigma0=self.sigma0, alpha=self.alpha, P_max=self.P_max,
+                eps=self.eps)[0] for T in self.T_pyramid]
+
+    def _memory_per_sample(self, itemsize):
+        """Estimate of peak memory (bytes) of `scattering` per input sample,
+        given real `itemsize` of the filters. Rough, errs on the high side.
+        """
+        N_pad = 2**self.J_pad
+        log2_T = (min(self.log2_T_pyramid) if self.T_pyramid is not None else
+                  self.log2_T)
+        n_levels = len(self.T_pyramid) if self.T_pyramid is not None else 1
+        k = max(log2_T - self.oversampling, 0) if self.average else 0
+
+        n_paths = len(ScatteringBase1D.meta(self)['n'])
+        n_out = n_paths * n_levels * (self.N // 2**k + 1)
+        # padded input, its spectrum, wavelet products in flight, and FFT
+        # scratch, complex
+        n_work = 2 * 12 * N_pad
+        return itemsize * (n_work + n_out)
+
+    def _micro_batch_size(self, x):
+        """Number of samples along the leading axis of `x` per micro-batch
+        that fit `max_memory`, or None if `x` fits whole."""
+        if self.max_memory is None or len(x.shape) < 2:
+            return None
+        p = self.psi1_f[0][0]
+        itemsize = (p.element_size() if hasattr(p, 'element_size') else
+                    p.itemsize)
+        per_sample = (self._memory_per_sample(itemsize) *
+                      int(np.prod(x.shape[1:-1])))
+        batch_size = max(int(self.max_memory // per_sample), 1)
+        return batch_size if batch_size < x.shape[0] else None
+
+    def _scattering_micro_batched(self, x, batch_size):
+        """Run `scattering` on `x` in chunks of `batch_size` along the leading
+        axis, writing into one preallocated output."""
+        n_samples = x.shape[0]
+        out, start = None, 0
+        for i in range(0, n_samples, batch_size):
+            S = self.scattering(x[i:i + batch_size])
+            n_rows = _n_rows(S)
+            if out is None:
+                n_rows_total = n_rows // min(batch_size, n_samples) * n_samples
+                out = _empty_like_rows(S, n_rows_total)
+            _write_rows(out, S, start)
+            start += n_rows
+        return out
+
     def meta(self):
         """Get meta information on the transform
 
@@ -411,9 +481,23 @@ class ScatteringBase1D(ScatteringBase):
                 - Q1: For audio signals, a value of `>= 12` is recommended in
                   order to separate partials.
                 - Q2: Recommended `1` for most (`Scattering1D`) applications.
-        T : int
+        T : int / list[int]
             temporal support of low-pass filter, controlling amount of imposed
             time-shift invariance and maximum subsampling.
+
+            If a list, computes a multi-scale pyramid in one pass: `scattering`
+            returns a list of outputs, one per `T` in the given order. The
+            wavelet transform and modulus are shared; only the final lowpass
+            differs. Moduli are subsampled as for the smallest `T`, so larger-`T`
+            levels are computed as if with greater `oversampling` (less
+            aliasing than a separate run with that `T`). Padding, wavelet
+            normalization, and `meta()` are for `max(T)`, so smaller-`T`
+            levels differ from separate runs throughout: the first-order
+            wavelets' normalization depends on `T` (by about `5e-4` between
+            `T=32` and `T=256`), giving about `1e-5` to `1e-4` relative
+            difference even with equal padding. Where a separate run would
+            pad less, boundary effects add up to about `1e-3`. Requires
+            `average=True`, and isn't supported by `TimeFrequencyScattering1D`.
         max_order : int, optional
             The maximum order of scattering coefficients to compute. Must be
             either `1` or `2`. Defaults to `2`.
@@ -438,7 +522,17 @@ class ScatteringBase1D(ScatteringBase):
             wavelets are fixed to one wavelet per octave).
         T : int
             temporal support of low-pass filter, controlling amount of imposed
-            time-shift invariance and maximum subsampling
+            time-shift invariance and maximum subsampling. `max(T)` if `T`
+            was passed as a list.
+        T_pyramid : list[int] / None
+            `T` as passed if a list, else None.
+        max_memory : int / None
+            Memory budget (bytes) for a `scattering` call. If set, inputs
+            whose estimated peak memory exceeds it are split along the leading
+            (batch) axis into micro-batches, with results written into one
+            preallocated output. The estimate is computed from the filterbank
+            and padding, and is approximate. NumPy and PyTorch only.
+            Settable after instantiation. Defaults to None (no splitting).
         {attrs_shape}max_order : int
             The maximum scattering order of the transform.
         {attr_average}oversampling : int
@@ -545,6 +639,8 @@ class TimeFrequencyScatteringBase1D():
         self.out_3D = out_3D
         self.out_type = out_type
         self.out_exclude = out_exclude
+        self.paths_exclude = None
+        self.heads = []
 
     def build(self):
         """Check args and instantiate `_FrequencyScatteringBase` object
@@ -556,6 +652,8 @@ class TimeFrequencyScatteringBase1D():
         automatically during object creation and no subsequent calls are
         therefore needed.
         """
+        if self.T_pyramid is not None:
+            raise ValueError("list `T` is unsupported for JTFS")
         # if config yields no second order coeffs, we cannot do joint scattering
         if self._no_second_order_filters:
             raise ValueError("configuration yields no second-order filters; "
@@ -696,23 +794,122 @@ class TimeFrequencyScatteringBase1D():
                 ind_end[trim_tm] = end
         self.ind_start, self.ind_end = ind_start, ind_end
 
-    def meta(self):
+    def meta(self, head=0):
         """Get meta information on the transform
 
         Calls the static method `compute_meta_jtfs()` with the parameters of the
         transform object.
 
+        Parameters
+        ----------
+        head : int
+            `0` for the transform's own frequential scattering, `k` for
+            `heads[k - 1]` (see `add_head()`).
+
         Returns
         ------
         meta : dictionary
             See `help(kymatio.scattering1d.utils.compute_meta_jtfs)`.
         """
-        return compute_meta_jtfs(self.J_pad, self.J, self.Q, self.J_fr, self.Q_fr,
-                                 self.T, self.F, self.aligned, self.out_3D,
-                                 self.out_type, self.out_exclude,
-                                 self.sampling_filters_fr, self.average,
-                                 self.average_global, self.average_global_phi,
-                                 self.oversampling, self.r_psi, self.scf)
+        if head == 0:
+            return compute_meta_jtfs(
+                self.J_pad, self.J, self.Q, self.J_fr, self.Q_fr, self.T,
+                self.F, self.aligned, self.out_3D, self.out_type,
+                self.out_exclude, self.sampling_filters_fr, self.average,
+                self.average_global, self.average_global_phi,
+                self.oversampling, self.r_psi, self.scf, self.paths_exclude)
+        scf = self.heads[head - 1]
+        return compute_meta_jtfs(
+            self.J_pad, self.J, self.Q, scf.J_fr, scf.Q_fr, self.T, scf.F,
+            scf.aligned, scf.out_3D, scf.out_type, self.out_exclude,
+            scf.sampling_filters_fr, self.average, self.average_global,
+            self.average_global_phi, self.oversampling, self.r_psi, scf)
+
+    def _memory_per_sample(self, itemsize):
+        """Estimate of peak memory (bytes) of `scattering` per input sample,
+        given real `itemsize` of the filters. Rough, errs on the high side.
+        """
+        N_pad = 2**self.J_pad
+        # second-order temporal transforms are kept for all `n2` and padded
+        # along frequency; heads add frequential work of the same size
+        n_Y_2 = 0
+        for p in self.psi2_f:
+            k2 = max(min(p['j'], self.log2_T) - self.oversampling, 0)
+            n_Y_2 += 2**self.scf.J_pad_frs_max_init * N_pad // 2**k2
+        n_Y_2 *= 1 + len(self.heads)
+
+        k = max(self.log2_T - self.oversampling, 0) if self.average else 0
+        n_rows = 0
+        for head in range(1 + len(self.heads)):
+            meta = self.meta(head)
+            # `out_3D=True` with `out_type='array'` splits into two parts
+            for meta_part in (meta if isinstance(meta, tuple) else [meta]):
+                meta_n = meta_part['n']
+                for n in (meta_n.values() if isinstance(meta_n, dict) else
+                          [meta_n]):
+                    n_rows += int(np.prod(n.shape[:-1]))
+        n_out = n_rows * (self.N // 2**k + 1)
+        # frequential products dominate, and are mostly subsampled, so
+        # count `Y_2` at real size; plus time work, complex
+        n_work = n_Y_2 + 2 * 12 * N_pad
+        return itemsize * (n_work + n_out)
+
+    def add_head(self, **kwargs):
+        """Add a frequential scattering head that shares this transform's
+        time scattering.
+
+        Calling the transform then returns a list of outputs, first of the
+        transform's own frequential scattering, then of each head in order
+        of addition. Time scattering (padding, first order, and second-order
+        temporal wavelet transforms) is computed once for all heads, so that
+        a sweep over frequential configurations costs about one time
+        scattering pass.
+
+        Parameters
+        ----------
+        **kwargs
+            Any of `J_fr, Q_fr, F, average_fr, aligned, sampling_filters_fr,
+            max_pad_factor_fr, pad_mode_fr, oversampling_fr, out_3D,
+            out_type`. Unspecified default to those of the transform.
+            `out_exclude` is shared; `paths_exclude` and `out_structure`
+            apply only to the transform's own output, since path indices
+            `n1_fr` refer to each head's own frequential filterbank.
+
+        Returns
+        -------
+        scf : `_FrequencyScatteringBase`
+            The added head, also appended to `self.heads`.
+        """
+        scf = self.scf
+        # copy as it's modified in place by `_FrequencyScatteringBase`
+        max_pad_factor_fr = (list(scf.max_pad_factor_fr)
+                             if scf.max_pad_factor_fr is not None else None)
+        pad_mode_fr = (scf.pad_fn_fr if scf.pad_mode_fr == 'custom' else
+                       scf.pad_mode_fr)
+        params = dict(
+            J_fr=scf.J_fr, Q_fr=scf.Q_fr, F=scf.F, average_fr=scf.average_fr,
+            aligned=self.aligned, sampling_filters_fr=scf.sampling_filters_fr,
+            max_pad_factor_fr=max_pad_factor_fr, pad_mode_fr=pad_mode_fr,
+            oversampling_fr=scf.oversampling_fr, out_3D=scf.out_3D,
+            out_type=self.out_type)
+        for name in kwargs:
+            if name not in params:
+                raise ValueError(("'{}' is not a frequential scattering "
+                                  "parameter; must be one of: {}").format(
+                                      name, ', '.join(params)))
+        params.update(kwargs)
+        _check_runtime_args_jtfs(self.average, params['average_fr'],
+                                 params['out_type'], params['out_3D'])
+
+        scf = _FrequencyScatteringBase(
+            self._N_frs, params['J_fr'], params['Q_fr'], params['F'], 1,
+            params['average_fr'], params['aligned'],
+            params['oversampling_fr'], params['sampling_filters_fr'],
+            params['out_type'], params['out_3D'], params['max_pad_factor_fr'],
+            params['pad_mode_fr'], self.analytic, scf.normalize_fr,
+            scf.r_psi_fr, self._n_psi1_f, self.backend)
+        self.heads.append(scf)
+        return scf
 
     @property
     def fr_attributes(self):
@@ -1378,6 +1575,24 @@ class TimeFrequencyScatteringBase1D():
 
     r_psi_fr : float
         Frequential redundancy.
+
+    heads : list[`_FrequencyScatteringBase`]
+        Additional frequential scattering heads sharing time scattering;
+        see `add_head()`. If non-empty, the transform outputs a list.
+
+    paths_exclude : dict[str: dict[tuple[int]: dict / None]] / None
+        Joint paths to prune from computation, as
+        `{pair: {(n2, n1_fr): fill}}`, where `n1_fr=-1` denotes `phi_f`.
+        `fill=None` drops the coefficient from output (and `meta()`), else
+        `fill` is a dict with keys `'shape', 'j', 's', 'stride'`, and zeros
+        of `(batch_size, *shape)` are output in place of the coefficient.
+        Settable after instantiation; see `kymatio.toolkit.prune_jtfs`.
+        Applies only to the transform's own output, not to `heads`.
+
+    max_memory : int / None
+        Memory budget (bytes) for a `scattering` call; see `Scattering1D`.
+        Inputs are split along the leading axis, so that each micro-batch's
+        estimated peak memory fits. NumPy and PyTorch only.
     """
 
     _terminology = \
@@ -1972,6 +2187,47 @@ class _FrequencyScatteringBase(ScatteringBase):
         return {k: getattr(self, k) for k in args}
 
 
+def _is_array(x):
+    return hasattr(x, 'dtype') and getattr(x, 'ndim', 0) > 0
+
+
+def _n_rows(S):
+    """Length along leading axis of first array in a scattering output."""
+    if _is_array(S):
+        return S.shape[0]
+    for v in (S.values() if isinstance(S, dict) else S):
+        if _is_array(v) or isinstance(v, (dict, list, tuple)):
+            n = _n_rows(v)
+            if n is not None:
+                return n
+
+
+def _empty_like_rows(S, n_rows):
+    """Uninitialized scattering output structured like `S`, with `n_rows`
+    along leading axis of each array. Non-array entries are copied."""
+    if _is_array(S):
+        shape = (n_rows, *S.shape[1:])
+        if hasattr(S, 'new_empty'):  # torch
+            return S.new_empty(shape)
+        return np.empty(shape, dtype=S.dtype)
+    elif isinstance(S, dict):
+        return {k: _empty_like_rows(v, n_rows) for k, v in S.items()}
+    elif isinstance(S, (list, tuple)):
+        return type(S)(_empty_like_rows(v, n_rows) for v in S)
+    return S
+
+
+def _write_rows(out, S, start):
+    if _is_array(S):
+        out[start:start + S.shape[0]] = S
+    elif isinstance(S, dict):
+        for k, v in S.items():
+            _write_rows(out[k], v, start)
+    elif isinstance(S, (list, tuple)):
+        for o, v in zip(out, S):
+            _write_rows(o, v, start)
+
+
 def _check_runtime_args_jtfs(average, average_fr, out_type, out_3D):
     if 'array' in out_type and not average:
         raise ValueError("Options `average=False` and `'array' in out_type` "
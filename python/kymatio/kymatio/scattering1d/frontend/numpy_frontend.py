@@ -35,6 +35,10 @@ class ScatteringNumPy1D(ScatteringNumPy, ScatteringBase1D):
         if not self.out_type in ('array', 'list'):
             raise RuntimeError("The out_type must be one of 'array' or 'list'.")
 
+        batch_size = self._micro_batch_size(x)
+        if batch_size is not None:
+            return self._scattering_micro_batched(x, batch_size)
+
         batch_shape = x.shape[:-1]
         signal_shape = x.shape[-1:]
 
@@ -48,26 +52,31 @@ class ScatteringNumPy1D(ScatteringNumPy, ScatteringBase1D):
         else:
             size_scattering = 0
 
-        S = scattering1d(x, self.pad_fn, self.backend.unpad, self.backend, self.J, self.log2_T, self.psi1_f, self.psi2_f,
-                         self.phi_f, max_order=self.max_order, average=self.average,
+        pyramid = bool(self.T_pyramid is not None)
+        log2_T, phi_f = ((self.log2_T_pyramid, self.phi_f_pyramid) if pyramid
+                         else (self.log2_T, self.phi_f))
+        S = scattering1d(x, self.pad_fn, self.backend.unpad, self.backend, self.J, log2_T, self.psi1_f, self.psi2_f,
+                         phi_f, max_order=self.max_order, average=self.average,
                          ind_start=self.ind_start, ind_end=self.ind_end,
                          oversampling=self.oversampling,
                          size_scattering=size_scattering,
                          out_type=self.out_type)
 
-        if self.out_type == 'array':
-            scattering_shape = S.shape[-2:]
-            new_shape = batch_shape + scattering_shape
-
-            S = S.reshape(new_shape)
-        else:
-            for x in S:
-                scattering_shape = x['coef'].shape[-1:]
+        Ss = S if pyramid else [S]
+        for i, S in enumerate(Ss):
+            if self.out_type == 'array':
+                scattering_shape = S.shape[-2:]
                 new_shape = batch_shape + scattering_shape
 
-                x['coef'] = x['coef'].reshape(new_shape)
+                Ss[i] = S.reshape(new_shape)
+            else:
+                for x in S:
+                    scattering_shape = x['coef'].shape[-1:]
+                    new_shape = batch_shape + scattering_shape
 
-        return S
+                    x['coef'] = x['coef'].reshape(new_shape)
+
+        return Ss if pyramid else Ss[0]
 
 ScatteringNumPy1D._document()
 
@@ -110,6 +119,10 @@ class TimeFrequencyScatteringNumPy1D(TimeFrequencyScatteringBase1D,
         _check_runtime_args_jtfs(self.average, self.average_fr, self.out_type,
                                  self.out_3D)
 
+        batch_size = self._micro_batch_size(x)
+        if batch_size is not None:
+            return self._scattering_micro_batched(x, batch_size)
+
         signal_shape = x.shape[-1:]
         x = x.reshape((-1, 1) + signal_shape)
 
@@ -120,7 +133,7 @@ class TimeFrequencyScatteringNumPy1D(TimeFrequencyScatteringBase1D,
             self.J,
             self.log2_T,
             self.psi1_f, self.psi2_f, self.phi_f,
-            self.scf,
+            [self.scf, *self.heads] if self.heads else self.scf,
             self.pad_fn,
             average=self.average,
             average_global=self.average_global,
@@ -133,12 +146,14 @@ class TimeFrequencyScatteringNumPy1D(TimeFrequencyScatteringBase1D,
             out_type=self.out_type,
             out_3D=self.out_3D,
             out_exclude=self.out_exclude,
-            pad_mode=self.pad_mode)
+            pad_mode=self.pad_mode,
+            paths_exclude=self.paths_exclude)
+        Ss = S if self.heads else [S]
         if self.out_structure is not None:
-            S = pack_coeffs_jtfs(S, self.meta(), self.out_structure,
-                                 separate_lowpass=True,
-                                 sampling_psi_fr=self.sampling_psi_fr)
-        return S
+            Ss[0] = pack_coeffs_jtfs(Ss[0], self.meta(), self.out_structure,
+                                     separate_lowpass=True,
+                                     sampling_psi_fr=self.sampling_psi_fr)
+        return Ss if self.heads else Ss[0]
 
     def scf_compute_padding_fr(self):
         raise NotImplementedError("Here for docs; implemented in "
@@ -1,19 +1,52 @@
+import math
+
 from ...frontend.sklearn_frontend import ScatteringTransformerMixin
 from ...numpy import Scattering1D as ScatteringNumPy1D
+from ...numpy import (TimeFrequencyScattering1D as
+                      TimeFrequencyScatteringNumPy1D)
 
 
 # NOTE: Order in base classes matters here, since we want the sklearn-specific
 # documentation parameters to take precedence over NP.
 class ScatteringTransformer1D(ScatteringTransformerMixin, ScatteringNumPy1D):
-    pass
+    def __init__(self, J, shape, Q=1, T=None, max_order=2, average=True,
+            oversampling=0, out_type='array', pad_mode='reflect',
+            max_pad_factor=2, analytic=False, normalize='l1-energy',
+            r_psi=math.sqrt(.5), backend='numpy', n_jobs=None,
+            batch_size=None):
+        self._init_params = {name: value for name, value in locals().items()
+                             if name != 'self'}
+        ScatteringNumPy1D.__init__(self, J, shape, Q, T, max_order, average,
+                oversampling, out_type, pad_mode, max_pad_factor, analytic,
+                normalize, r_psi, backend)
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
 
 
 ScatteringTransformer1D._document()
 
 
 class TimeFrequencyScatteringTransformer1D(ScatteringTransformerMixin,
-                                           ScatteringNumPy1D):
-    pass
+                                           TimeFrequencyScatteringNumPy1D):
+    def __init__(self, J, shape, Q, J_fr=None, Q_fr=2, T=None, F=None,
+                 implementation=None, average=True, average_fr=False,
+                 oversampling=0, oversampling_fr=None, aligned=True,
+                 sampling_filters_fr=('exclude', 'resample'), out_type="array",
+                 out_3D=False, out_exclude=None, pad_mode='reflect',
+                 pad_mode_fr='conj-reflect-zero', max_pad_factor=2,
+                 max_pad_factor_fr=None, analytic=True, normalize='l1-energy',
+                 r_psi=math.sqrt(.5), backend="numpy", n_jobs=None,
+                 batch_size=None):
+        self._init_params = {name: value for name, value in locals().items()
+                             if name != 'self'}
+        TimeFrequencyScatteringNumPy1D.__init__(
+            self, J, shape, Q, J_fr, Q_fr, T, F, implementation, average,
+            average_fr, oversampling, oversampling_fr, aligned,
+            sampling_filters_fr, out_type, out_3D, out_exclude, pad_mode,
+            pad_mode_fr, max_pad_factor, max_pad_factor_fr, analytic,
+            normalize, r_psi, backend)
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
 
 
 TimeFrequencyScatteringTransformer1D._document()
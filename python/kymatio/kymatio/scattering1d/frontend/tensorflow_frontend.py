@@ -50,26 +50,31 @@ class ScatteringTensorFlow1D(ScatteringTensorFlow, ScatteringBase1D):
         else:
             size_scattering = 0
 
-        S = scattering1d(x, self.pad_fn, self.backend.unpad, self.backend, self.J, self.log2_T, self.psi1_f, self.psi2_f,
-                         self.phi_f, max_order=self.max_order, average=self.average,
+        pyramid = bool(self.T_pyramid is not None)
+        log2_T, phi_f = ((self.log2_T_pyramid, self.phi_f_pyramid) if pyramid
+                         else (self.log2_T, self.phi_f))
+        S = scattering1d(x, self.pad_fn, self.backend.unpad, self.backend, self.J, log2_T, self.psi1_f, self.psi2_f,
+                         phi_f, max_order=self.max_order, average=self.average,
                          ind_start=self.ind_start, ind_end=self.ind_end,
                          oversampling=self.oversampling,
                          size_scattering=size_scattering,
                          out_type=self.out_type)
 
-        if self.out_type == 'array':
-            scattering_shape = tf.shape(S)[-2:]
-            new_shape = tf.concat((batch_shape, scattering_shape), 0)
-
-            S = tf.reshape(S, new_shape)
-        else:
-            for x in S:
-                scattering_shape = tf.shape(x['coef'])[-1:]
+        Ss = S if pyramid else [S]
+        for i, S in enumerate(Ss):
+            if self.out_type == 'array':
+                scattering_shape = tf.shape(S)[-2:]
                 new_shape = tf.concat((batch_shape, scattering_shape), 0)
 
-                x['coef'] = tf.reshape(x['coef'], new_shape)
+                Ss[i] = tf.reshape(S, new_shape)
+            else:
+                for x in S:
+                    scattering_shape = tf.shape(x['coef'])[-1:]
+                    new_shape = tf.concat((batch_shape, scattering_shape), 0)
+
+                    x['coef'] = tf.reshape(x['coef'], new_shape)
 
-        return S
+        return Ss if pyramid else Ss[0]
 
 
 ScatteringTensorFlow1D._document()
@@ -121,7 +126,7 @@ class TimeFrequencyScatteringTensorFlow1D(TimeFrequencyScatteringBase1D,
             self.J,
             self.log2_T,
             self.psi1_f, self.psi2_f, self.phi_f,
-            self.scf,
+            [self.scf, *self.heads] if self.heads else self.scf,
             self.pad_fn,
             average=self.average,
             average_global=self.average_global,
@@ -134,12 +139,14 @@ class TimeFrequencyScatteringTensorFlow1D(TimeFrequencyScatteringBase1D,
             out_type=self.out_type,
             out_3D=self.out_3D,
             out_exclude=self.out_exclude,
-            pad_mode=self.pad_mode)
+            pad_mode=self.pad_mode,
+            paths_exclude=self.paths_exclude)
+        Ss = S if self.heads else [S]
         if self.out_structure is not None:
-            S = pack_coeffs_jtfs(S, self.meta(), self.out_structure,
-                                 separate_lowpass=True,
-                                 sampling_psi_fr=self.sampling_psi_fr)
-        return S
+            Ss[0] = pack_coeffs_jtfs(Ss[0], self.meta(), self.out_structure,
+                                     separate_lowpass=True,
+                                     sampling_psi_fr=self.sampling_psi_fr)
+        return Ss if self.heads else Ss[0]
 
     def scf_compute_padding_fr(self):
         raise NotImplementedError("Here for docs; implemented in "
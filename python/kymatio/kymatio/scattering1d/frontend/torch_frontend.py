@@ -51,6 +51,12 @@ class ScatteringTorch1D(ScatteringTorch, ScatteringBase1D):
                         psi_f[sub_k]).float()
                     self.register_buffer('tensor' + str(n), psi_f[sub_k])
                     n += 1
+        for phi_f in (self.phi_f_pyramid or ()):
+            for k in phi_f.keys():
+                if type(k) != str:
+                    phi_f[k] = torch.from_numpy(phi_f[k]).float()
+                    self.register_buffer('tensor' + str(n), phi_f[k])
+                    n += 1
 
     def load_filters(self):
         """This function loads filters from the module's buffer """
@@ -74,6 +80,12 @@ class ScatteringTorch1D(ScatteringTorch, ScatteringBase1D):
                     psi_f[sub_k] = buffer_dict['tensor' + str(n)]
                     n += 1
 
+        for phi_f in (self.phi_f_pyramid or ()):
+            for k in phi_f.keys():
+                if type(k) != str:
+                    phi_f[k] = buffer_dict['tensor' + str(n)]
+                    n += 1
+
     def scattering(self, x):
         # basic checking, should be improved
         if len(x.shape) < 1:
@@ -88,6 +100,10 @@ class ScatteringTorch1D(ScatteringTorch, ScatteringBase1D):
         if not self.out_type in ('array', 'list'):
             raise RuntimeError("The out_type must be one of 'array' or 'list'.")
 
+        batch_size = self._micro_batch_size(x)
+        if batch_size is not None:
+            return self._scattering_micro_batched(x, batch_size)
+
         batch_shape = x.shape[:-1]
         signal_shape = x.shape[-1:]
 
@@ -110,26 +126,31 @@ class ScatteringTorch1D(ScatteringTorch, ScatteringBase1D):
         if x.device.type != device:
             x = x.to(device)
 
-        S = scattering1d(x, self.pad_fn, self.backend.unpad, self.backend, self.J, self.log2_T, self.psi1_f, self.psi2_f,
-                         self.phi_f, max_order=self.max_order, average=self.average,
+        pyramid = bool(self.T_pyramid is not None)
+        log2_T, phi_f = ((self.log2_T_pyramid, self.phi_f_pyramid) if pyramid
+                         else (self.log2_T, self.phi_f))
+        S = scattering1d(x, self.pad_fn, self.backend.unpad, self.backend, self.J, log2_T, self.psi1_f, self.psi2_f,
+                         phi_f, max_order=self.max_order, average=self.average,
                          ind_start=self.ind_start, ind_end=self.ind_end,
                          oversampling=self.oversampling,
                          size_scattering=size_scattering,
                          out_type=self.out_type)
 
-        if self.out_type == 'array':
+        Ss = S if pyramid else [S]
+        for i, S in enumerate(Ss):
+            if self.out_type == 'array':
                 scattering_shape = S.shape[-2:]
                 new_shape = batch_shape + scattering_shape
 
-                S = S.reshape(new_shape)
-        else:
-            for x in S:
-                scattering_shape = x['coef'].shape[-1:]
-                new_shape = batch_shape + scattering_shape
+                Ss[i] = S.reshape(new_shape)
+            else:
+                for x in S:
+                    scattering_shape = x['coef'].shape[-1:]
+                    new_shape = batch_shape + scattering_shape
 
-                x['coef'] = x['coef'].reshape(new_shape)
+                    x['coef'] = x['coef'].reshape(new_shape)
 
-        return S
+        return Ss if pyramid else Ss[0]
 
 ScatteringTorch1D._document()
 
@@ -167,9 +188,21 @@ class TimeFrequencyScatteringTorch1D(TimeFrequencyScatteringBase1D,
         saves those arrays as module's buffers."""
         n_final = self._register_filters(self, ('phi_f', 'psi1_f', 'psi2_f'))
         # register filters from freq-scattering object (see base_frontend.py)
-        self._register_filters(self.scf,
+        for scf in (self.scf, *self.heads):
+            n_final = self._register_filters(
+                scf, ('phi_f_fr', 'psi1_f_fr_up', 'psi1_f_fr_down'),
+                n0=n_final)
+
+    def add_head(self, **kwargs):
+        """Docs in `TimeFrequencyScatteringBase1D`. Also registers the head's
+        filters as buffers, on the device of existing filters."""
+        device = next(self.buffers()).device
+        scf = TimeFrequencyScatteringBase1D.add_head(self, **kwargs)
+        self._register_filters(scf,
                                ('phi_f_fr', 'psi1_f_fr_up', 'psi1_f_fr_down'),
-                               n0=n_final)
+                               n0=len(dict(self.named_buffers())))
+        self.to(device)
+        return scf
 
     def _register_filters(self, obj, filter_names, n0=0):
         n = n0
@@ -202,9 +235,10 @@ class TimeFrequencyScatteringTorch1D(TimeFrequencyScatteringBase1D,
         """This function loads filters from the module's buffer """
         n_final = self._load_filters(self, ('phi_f', 'psi1_f', 'psi2_f'))
         # register filters from freq-scattering object (see base_frontend.py)
-        self._load_filters(self.scf,
-                           ('phi_f_fr', 'psi1_f_fr_up', 'psi1_f_fr_down'),
-                           n0=n_final)
+        for scf in (self.scf, *self.heads):
+            n_final = self._load_filters(
+                scf, ('phi_f_fr', 'psi1_f_fr_up', 'psi1_f_fr_down'),
+                n0=n_final)
 
     def _load_filters(self, obj, filter_names, n0=0):
         buffer_dict = dict(self.named_buffers())
@@ -239,6 +273,10 @@ class TimeFrequencyScatteringTorch1D(TimeFrequencyScatteringBase1D,
         _check_runtime_args_jtfs(self.average, self.average_fr, self.out_type,
                                  self.out_3D)
 
+        batch_size = self._micro_batch_size(x)
+        if batch_size is not None:
+            return self._scattering_micro_batched(x, batch_size)
+
         signal_shape = x.shape[-1:]
         x = x.reshape((-1, 1) + signal_shape)
 
@@ -258,7 +296,7 @@ class TimeFrequencyScatteringTorch1D(TimeFrequencyScatteringBase1D,
             self.J,
             self.log2_T,
             self.psi1_f, self.psi2_f, self.phi_f,
-            self.scf,
+            [self.scf, *self.heads] if self.heads else self.scf,
             self.pad_fn,
             average=self.average,
             average_global=self.average_global,
@@ -271,12 +309,14 @@ class TimeFrequencyScatteringTorch1D(TimeFrequencyScatteringBase1D,
             out_type=self.out_type,
             out_3D=self.out_3D,
             out_exclude=self.out_exclude,
-            pad_mode=self.pad_mode)
+            pad_mode=self.pad_mode,
+            paths_exclude=self.paths_exclude)
+        Ss = S if self.heads else [S]
         if self.out_structure is not None:
-            S = pack_coeffs_jtfs(S, self.meta(), self.out_structure,
-                                 separate_lowpass=True,
-                                 sampling_psi_fr=self.sampling_psi_fr)
-        return S
+            Ss[0] = pack_coeffs_jtfs(Ss[0], self.meta(), self.out_structure,
+                                     separate_lowpass=True,
+                                     sampling_psi_fr=self.sampling_psi_fr)
+        return Ss if self.heads else Ss[0]
 
     def scf_compute_padding_fr(self):
         raise NotImplementedError("Here for docs; implemented in "
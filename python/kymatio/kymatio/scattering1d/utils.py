@@ -370,7 +370,8 @@ def compute_meta_scattering(J, Q, J_pad, T, r_psi=math.sqrt(.5), max_order=2):
 
 def compute_meta_jtfs(J_pad, J, Q, J_fr, Q_fr, T, F, aligned, out_3D, out_type,
                       out_exclude, sampling_filters_fr, average, average_global,
-                      average_global_phi, oversampling, r_psi, scf):
+                      average_global_phi, oversampling, r_psi, scf,
+                      paths_exclude=None):
     """Get metadata on the Joint Time-Frequency Scattering transform.
 
     This information specifies the content of each scattering coefficient,
@@ -417,6 +418,10 @@ def compute_meta_jtfs(J_pad, J, Q, J_fr, Q_fr, T, F, aligned, out_3D, out_type,
     scf : `scattering1d.frontend.base_frontend._FrequencyScatteringBase`
         Frequential scattering object, storing pertinent attributes and filters.
 
+    paths_exclude : dict[str: dict[tuple[int]: dict / None]] / None
+        Pruned joint paths, see `help(TimeFrequencyScattering1D)`. Paths that
+        are dropped (`None` fill) are dropped from meta.
+
     Returns
     -------
     meta : dictionary
@@ -843,6 +848,22 @@ def compute_meta_jtfs(J_pad, J, Q, J_fr, Q_fr, T, F, aligned, out_3D, out_type,
             for field in meta:
                 del meta[field][pair]
 
+    if paths_exclude is not None:
+        # drop pruned paths that aren't zero-filled
+        for pair, paths in paths_exclude.items():
+            dropped = [n for n, fill in paths.items() if fill is None]
+            if pair not in meta['n'] or not dropped or meta['n'][pair].size == 0:
+                continue
+            n = meta['n'][pair]
+            n2_n1_fr = n[:, 0, :2] if out_3D else n[:, :2]
+            keep = ~np.array([tuple(nn) in dropped for nn in
+                              n2_n1_fr.astype(int).tolist()], dtype=bool)
+            for field in meta:
+                if keep.any():
+                    meta[field][pair] = meta[field][pair][keep]
+                else:
+                    del meta[field][pair]
+
     # ensure time / freq stride doesn't exceed log2_T / log2_F in averaged cases,
     # and J / J_fr in unaveraged
     smax_t_nophi = log2_T if average else J
@@ -62,7 +62,7 @@ class NumpyBackend2D(NumpyBackend):
         Parameters
         ----------
         x : tensor_like
-            input tensor with at least three dimensions.
+            input tensor with at least two dimensions.
         k : int
             integer such that x is subsampled by k along the spatial variables.
 
@@ -76,12 +76,95 @@ class NumpyBackend2D(NumpyBackend):
         """
         cls.complex_check(x)
 
-        y = x.reshape(-1, k, x.shape[1] // k, k, x.shape[2] // k)
+        y = x.reshape(x.shape[:-2] + (k, x.shape[-2] // k, k, x.shape[-1] // k))
 
-        out = y.mean(axis=(1, 3))
+        out = y.mean(axis=(-4, -2))
 
         return out
 
+    @classmethod
+    def cdgmm(cls, A, B):
+        """Complex pointwise multiplication between tensors `A` and `B`,
+        broadcasting over leading axes.
+
+        Parameters
+        ----------
+        A : tensor
+            Complex tensor of size `(..., M, N)`.
+        B : tensor
+            Complex or real tensor of size `(..., M, N)`.
+
+        Returns
+        -------
+        C : tensor
+            `A * B`, of the broadcasted size.
+        """
+        if not cls._is_complex(A):
+            raise TypeError('The first input must be complex.')
+
+        if A.shape[-2:] != B.shape[-2:]:
+            raise RuntimeError('The inputs are not compatible for '
+                               'multiplication (%s and %s).' % (A.shape, B.shape))
+
+        if not cls._is_complex(B) and not cls._is_real(B):
+            raise TypeError('The second input must be complex or real.')
+
+        return A * B
+
+    @classmethod
+    def subsample_fourier_half(cls, x, k, N):
+        """Same as `subsample_fourier`, but on half spectra of real signals
+        (as from `rfft_half`).
+
+        Periodizes along the full (first) spatial frequency axis, then
+        completes the (smaller) result by Hermitian symmetry to periodize
+        along the half axis.
+
+        Parameters
+        ----------
+        x : tensor_like
+            Half spectrum, of size `(..., M, N // 2 + 1)`.
+        k : int
+            Integer such that x is subsampled by k along the spatial variables.
+        N : int
+            Length of the last spatial axis of the signal.
+
+        Returns
+        -------
+        out : tensor_like
+            Half spectrum of the subsampled signal, of size
+            `(..., M // k, N // k // 2 + 1)`.
+        """
+        cls.complex_check(x)
+
+        y = x.reshape(x.shape[:-2] + (k, x.shape[-2] // k, x.shape[-1]))
+        y = cls.half_to_full(y.mean(axis=-3), N)
+        y = y.reshape(y.shape[:-1] + (k, N // k)).mean(axis=-2)
+
+        return y[..., :N // k // 2 + 1]
+
+    @classmethod
+    def half_to_full(cls, x, N):
+        """Full spectrum from half spectrum of a real signal, via
+        `X[u, v] = conj(X[-u, -v])`.
+
+        Parameters
+        ----------
+        x : tensor_like
+            Half spectrum, of size `(..., M, N // 2 + 1)`.
+        N : int
+            Length of the last spatial axis of the signal.
+
+        Returns
+        -------
+        out : tensor_like
+            Full spectrum, of size `(..., M, N)`.
+        """
+        # rows at `-u`
+        x_neg = cls._np.roll(x[..., ::-1, :], 1, axis=-2)
+        return cls._np.concatenate(
+            (x, x_neg[..., N - N // 2 - 1:0:-1].conj()), axis=-1)
+
     @classmethod
     def Pad(cls, pad_size, input_size, pre_pad=False):
         return cls._Pad(cls._np, pad_size, input_size, pre_pad)
@@ -100,6 +183,16 @@ class NumpyBackend2D(NumpyBackend):
         cls.complex_check(x)
         return cls._fft.ifft2(x).real
 
+    @classmethod
+    def rfft_half(cls, x):
+        cls.real_check(x)
+        return cls._fft.rfft2(x)
+
+    @classmethod
+    def irfft_half(cls, x, N):
+        cls.complex_check(x)
+        return cls._fft.irfft2(x, s=(x.shape[-2], N))
+
     @classmethod
     def ifft(cls, x):
         cls.complex_check(x)
@@ -1,3 +1,11 @@
+import math
+
+
+# max number of elements of an intermediate in `scattering2d_stacked`'s
+# second order; larger batches are slower on CPU, bound by memory traffic
+_STACKED_BLOCK_SIZE = 2**18
+
+
 def scattering2d(x, pad, unpad, backend, J, L, phi, psi, max_order,
         out_type='array'):
     subsample_fourier = backend.subsample_fourier
@@ -85,4 +93,110 @@ def scattering2d(x, pad, unpad, backend, J, L, phi, psi, max_order,
     return out_S
 
 
-__all__ = ['scattering2d']
+def scattering2d_stacked(x, pad, unpad, backend, J, L, phi_half, psi_stacked,
+        max_order, out_type='array'):
+    """Same as `scattering2d`, but convolves with all `L` orientations of a
+    scale at once, and second order with all `(theta1, theta2)` of a
+    `(j1, j2)` at once, as one broadcasted multiply and one batched FFT.
+
+    `psi_stacked[j][res]` is an array of shape `(L, M // 2**res, N // 2**res)`,
+    stacking `psi[n][res]` for `psi[n]['j'] == j` in order of `theta`. The
+    backend's `cdgmm`, `subsample_fourier`, and FFTs must broadcast over
+    leading axes. Peak memory is about `L` times that of `scattering2d`;
+    second order is split over `theta1` if exceeding `_STACKED_BLOCK_SIZE`.
+
+    Real-valued stages (input, moduli, and lowpassing) use half spectra via
+    the backend's `rfft_half`, `subsample_fourier_half`, and `irfft_half`,
+    so `phi_half[res]` is `phi[res][:, :N // 2**res // 2 + 1]`. Only wavelet
+    stages use full spectra, extended with `half_to_full`.
+    """
+    subsample_fourier = backend.subsample_fourier
+    subsample_fourier_half = backend.subsample_fourier_half
+    modulus = backend.modulus
+    rfft_half = backend.rfft_half
+    irfft_half = backend.irfft_half
+    half_to_full = backend.half_to_full
+    ifft = backend.ifft
+    cdgmm = backend.cdgmm
+    concatenate = backend.concatenate
+
+    U_r = pad(x)
+    N = U_r.shape[-1]
+
+    U_0_h = rfft_half(U_r)
+
+    # First low pass filter
+    S_0 = cdgmm(U_0_h, phi_half[0])
+    S_0 = subsample_fourier_half(S_0, k=2 ** J, N=N)
+    S_0 = unpad(irfft_half(S_0, N=N // 2 ** J))
+
+    # full spectrum for wavelets
+    U_0_c = half_to_full(U_0_h, N=N)
+    # add orientation axis, to broadcast against filter stacks
+    U_0_c = U_0_c.reshape(U_0_c.shape[:-2] + (1,) + U_0_c.shape[-2:])
+
+    S_1, S_2 = {}, {}
+    for j1 in range(J):
+        N1 = N // 2 ** j1
+        U_1_c = cdgmm(U_0_c, psi_stacked[j1][0])
+        if j1 > 0:
+            U_1_c = subsample_fourier(U_1_c, k=2 ** j1)
+        U_1_c = ifft(U_1_c)
+        U_1_c = modulus(U_1_c)
+        U_1_h = rfft_half(U_1_c)
+
+        # Second low pass filter
+        S_1_c = cdgmm(U_1_h, phi_half[j1])
+        S_1_c = subsample_fourier_half(S_1_c, k=2 ** (J - j1), N=N1)
+        S_1[j1] = unpad(irfft_half(S_1_c, N=N // 2 ** J))
+
+        if max_order < 2:
+            continue
+        U_1_c = half_to_full(U_1_h, N=N1)
+        # batch all `(theta1, theta2)` for a `(j1, j2)`, in chunks of
+        # `theta1` to keep products within `_STACKED_BLOCK_SIZE` elements
+        n_theta1 = _STACKED_BLOCK_SIZE // math.prod(U_1_c.shape)
+        n_theta1 = min(max(n_theta1, 1), L)
+        for j2 in range(j1 + 1, J):
+            N2 = N // 2 ** j2
+            for theta1_0 in range(0, L, n_theta1):
+                # `(..., theta1, theta2, M, N)`
+                U_2_c = U_1_c[..., theta1_0:theta1_0 + n_theta1, :, :]
+                U_2_c = U_2_c.reshape(U_2_c.shape[:-2] + (1,) +
+                                      U_2_c.shape[-2:])
+                U_2_c = cdgmm(U_2_c, psi_stacked[j2][j1])
+                U_2_c = subsample_fourier(U_2_c, k=2 ** (j2 - j1))
+                U_2_c = ifft(U_2_c)
+                U_2_c = modulus(U_2_c)
+                U_2_h = rfft_half(U_2_c)
+
+                # Third low pass filter
+                S_2_c = cdgmm(U_2_h, phi_half[j2])
+                S_2_c = subsample_fourier_half(S_2_c, k=2 ** (J - j2), N=N2)
+                S_2_r = unpad(irfft_half(S_2_c, N=N // 2 ** J))
+                for theta1 in range(theta1_0, theta1_0 + S_2_r.shape[-4]):
+                    S_2[j1, j2, theta1] = S_2_r[..., theta1 - theta1_0,
+                                                :, :, :]
+
+    # unstack, ordered as in `scattering2d`
+    out_S = [{'coef': S_0,
+              'j': (),
+              'theta': ()}]
+    out_S.extend({'coef': S_1[j1][..., theta1, :, :],
+                  'j': (j1,),
+                  'theta': (theta1,)}
+                 for j1 in range(J) for theta1 in range(L))
+    out_S.extend({'coef': S_2[j1, j2, theta1][..., theta2, :, :],
+                  'j': (j1, j2),
+                  'theta': (theta1, theta2)}
+                 for j1 in range(J) for theta1 in range(L)
+                 for j2 in range(j1 + 1, J) for theta2 in range(L)
+                 if max_order == 2)
+
+    if out_type == 'array':
+        out_S = concatenate([x['coef'] for x in out_S])
+
+    return out_S
+
+
+__all__ = ['scattering2d', 'scattering2d_stacked']
@@ -1,8 +1,15 @@
+import math
+import os
 import numpy as np
 from scipy.fft import fft2, ifft2
 
+from ..caching import get_cache_dir
 
-def filter_bank(M, N, J, L=8):
+# bump when filter construction changes, to invalidate caches
+_FILTER_BANK_VERSION = 1
+
+
+def filter_bank(M, N, J, L=8, cache=False):
     """
         Builds in Fourier the Morlet filters used for the scattering transform.
         Each single filter is provided as a dictionary with the following keys:
@@ -16,6 +23,9 @@ def filter_bank(M, N, J, L=8):
             logscale of the scattering
         L : int, optional
             number of angles used for the wavelet transform
+        cache : bool, optional
+            If True, loads the filters from, or saves them to, a file under
+            `caching.get_cache_dir('scattering2d_filters')`.
         Returns
         -------
         filters : list
@@ -25,24 +35,33 @@ def filter_bank(M, N, J, L=8):
         -----
         The design of the filters is optimized for the value L = 8.
     """
+    if cache:
+        path = os.path.join(
+            get_cache_dir('scattering2d_filters'),
+            'v{}_M{}_N{}_J{}_L{}.npz'.format(_FILTER_BANK_VERSION, M, N, J, L))
+        if os.path.isfile(path):
+            return _load_filter_bank(path, J, L)
+
     filters = {}
     filters['psi'] = []
 
+    # all (j, theta) at once, ordered as `filters['psi']`
+    thetas = (int(L-L/2-1) - np.arange(L)) * np.pi / L
+    psi_signals = np.concatenate([
+        morlet_2d(M, N, 0.8 * 2**j, thetas, 3.0 / 4.0 * np.pi /2**j, 4.0/L)
+        for j in range(J)])
+    # drop the imaginary part, it is zero anyway
+    psi_signals_fourier = np.real(fft2(psi_signals))
     for j in range(J):
+        psi_signals_fourier_j = psi_signals_fourier[j*L:(j + 1)*L]
+        psi_res = [periodize_filter_fft(psi_signals_fourier_j, res)
+                   for res in range(min(j + 1, max(J - 1, 1)))]
         for theta in range(L):
             psi = {}
             psi['j'] = j
             psi['theta'] = theta
-            psi_signal = morlet_2d(M, N, 0.8 * 2**j,
-                (int(L-L/2-1)-theta) * np.pi / L,
-                3.0 / 4.0 * np.pi /2**j, 4.0/L)
-            psi_signal_fourier = fft2(psi_signal)
-            # drop the imaginary part, it is zero anyway
-            psi_signal_fourier = np.real(psi_signal_fourier)
-            for res in range(min(j + 1, max(J - 1, 1))):
-                psi_signal_fourier_res = periodize_filter_fft(
-                    psi_signal_fourier, res)
-                psi[res] = psi_signal_fourier_res
+            for res, psi_signal_fourier_res in enumerate(psi_res):
+                psi[res] = psi_signal_fourier_res[theta]
             filters['psi'].append(psi)
 
     filters['phi'] = {}
@@ -55,6 +74,35 @@ def filter_bank(M, N, J, L=8):
         phi_signal_fourier_res = periodize_filter_fft(phi_signal_fourier, res)
         filters['phi'][res] = phi_signal_fourier_res
 
+    if cache:
+        _save_filter_bank(path, filters)
+    return filters
+
+
+def _save_filter_bank(path, filters):
+    arrays = {'phi_%s' % res: filters['phi'][res]
+              for res in filters['phi'] if res != 'j'}
+    for n, psi in enumerate(filters['psi']):
+        for res in psi:
+            if res not in ('j', 'theta'):
+                arrays['psi_%s_%s' % (n, res)] = psi[res]
+    # write then rename, so concurrent readers never see a partial file
+    tmp_path = '%s.%s.tmp.npz' % (path[:-4], os.getpid())
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _load_filter_bank(path, J, L):
+    with np.load(path) as data:
+        filters = {'phi': {'j': J}, 'psi': []}
+        for res in range(J):
+            filters['phi'][res] = data['phi_%s' % res]
+        for j in range(J):
+            for theta in range(L):
+                psi = {'j': j, 'theta': theta}
+                for res in range(min(j + 1, max(J - 1, 1))):
+                    psi[res] = data['psi_%s_%s' % (j*L + theta, res)]
+                filters['psi'].append(psi)
     return filters
 
 
@@ -63,7 +111,7 @@ def periodize_filter_fft(x, res):
         Parameters
         ----------
         x : numpy array
-            signal to periodize in Fourier
+            signal to periodize in Fourier, of shape `(..., M, N)`
         res :
             resolution to which the signal is cropped.
 
@@ -73,12 +121,12 @@ def periodize_filter_fft(x, res):
             It returns a crop version of the filter, assuming that
              the convolutions will be done via compactly supported signals.
     """
-    M = x.shape[0]
-    N = x.shape[1]
-
-    crop = np.zeros((M // 2 ** res, N // 2 ** res), x.dtype)
+    M = x.shape[-2]
+    N = x.shape[-1]
+    dtype = x.dtype
+    Mr, Nr = M // 2 ** res, N // 2 ** res
 
-    mask = np.ones(x.shape, np.float32)
+    mask = np.ones(x.shape[-2:], np.float32)
     len_x = int(M * (1 - 2 ** (-res)))
     start_x = int(M * 2 ** (-res - 1))
     len_y = int(N * (1 - 2 ** (-res)))
@@ -87,13 +135,11 @@ def periodize_filter_fft(x, res):
     mask[:, start_y:start_y + len_y] = 0
     x = np.multiply(x,mask)
 
-    for k in range(int(M / 2 ** res)):
-        for l in range(int(N / 2 ** res)):
-            for i in range(int(2 ** res)):
-                for j in range(int(2 ** res)):
-                    crop[k, l] += x[k + i * int(M / 2 ** res), l + j * int(N / 2 ** res)]
-
-    return crop
+    # crop[k, l] = sum_{i, j} x[k + i*Mr, l + j*Nr]
+    x = x[..., :Mr * 2 ** res, :Nr * 2 ** res]
+    crop = x.reshape(*x.shape[:-2], 2 ** res, Mr, 2 ** res, Nr
+                     ).sum(axis=(-4, -2))
+    return crop.astype(dtype, copy=False)
 
 
 def morlet_2d(M, N, sigma, theta, xi, slant=0.5, offset=0):
@@ -114,8 +160,8 @@ def morlet_2d(M, N, sigma, theta, xi, slant=0.5, offset=0):
             bandwidth parameter
         xi : float
             central frequency (in [0, 1])
-        theta : float
-            angle in [0, pi]
+        theta : float / ndarray
+            angle in [0, pi]; if an array, computes a filter per angle
         slant : float, optional
             parameter which guides the elipsoidal shape of the morlet
         offset : int, optional
@@ -124,11 +170,12 @@ def morlet_2d(M, N, sigma, theta, xi, slant=0.5, offset=0):
         Returns
         -------
         morlet_fft : ndarray
-            numpy array of size (M, N)
+            numpy array of size (M, N), or (*theta.shape, M, N)
     """
     wv = gabor_2d(M, N, sigma, theta, xi, slant, offset)
     wv_modulus = gabor_2d(M, N, sigma, theta, 0, slant, offset)
-    K = np.sum(wv) / np.sum(wv_modulus)
+    K = (np.sum(wv, axis=(-2, -1), keepdims=True) /
+         np.sum(wv_modulus, axis=(-2, -1), keepdims=True))
 
     mor = wv - K * wv_modulus
     return mor
@@ -149,8 +196,8 @@ def gabor_2d(M, N, sigma, theta, xi, slant=1.0, offset=0):
             bandwidth parameter
         xi : float
             central frequency (in [0, 1])
-        theta : float
-            angle in [0, pi]
+        theta : float / ndarray
+            angle in [0, pi]; if an array, computes a filter per angle
         slant : float, optional
             parameter which guides the elipsoidal shape of the morlet
         offset : int, optional
@@ -159,25 +206,44 @@ def gabor_2d(M, N, sigma, theta, xi, slant=1.0, offset=0):
         Returns
         -------
         morlet_fft : ndarray
-            numpy array of size (M, N)
+            numpy array of size (M, N), or (*theta.shape, M, N)
     """
-    gab = np.zeros((M, N), np.complex64)
-    R = np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]], np.float32)
-    R_inv = np.array([[np.cos(theta), np.sin(theta)], [-np.sin(theta), np.cos(theta)]], np.float32)
+    theta = np.asarray(theta)
+    thetas = theta.reshape(-1)
+    cos, sin = np.cos(thetas), np.sin(thetas)
+    R = np.array([[cos, -sin], [sin, cos]], np.float32).transpose(2, 0, 1)
+    R_inv = np.array([[cos, sin], [-sin, cos]], np.float32).transpose(2, 0, 1)
     D = np.array([[1, 0], [0, slant * slant]])
-    curv = np.dot(R, np.dot(D, R_inv)) / ( 2 * sigma * sigma)
-
+    curv = np.matmul(R, np.matmul(D, R_inv)) / ( 2 * sigma * sigma)
+    # broadcast over thetas, then space
+    curv = curv[:, :, :, None, None]
+    cos, sin = cos[:, None, None], sin[:, None, None]
+    # the envelope underflows `complex64` (adds exactly nothing) beyond
+    # `|u| > r_max`, per smallest eigenvalue of `curv`
+    r_max = np.sqrt(110 / (min(1, slant * slant) / (2 * sigma * sigma)))
+
+    gab = np.zeros((len(thetas), M, N), np.complex64)
     for ex in [-2, -1, 0, 1, 2]:
         for ey in [-2, -1, 0, 1, 2]:
-            [xx, yy] = np.mgrid[offset + ex * M:offset + M + ex * M, offset + ey * N:offset + N + ey * N]
-            arg = -(curv[0, 0] * np.multiply(xx, xx) + (curv[0, 1] + curv[1, 0]) * np.multiply(xx, yy) + curv[
-                1, 1] * np.multiply(yy, yy)) + 1.j * (xx * xi * np.cos(theta) + yy * xi * np.sin(theta))
-            gab += np.exp(arg)
+            x0, y0 = offset + ex * M, offset + ey * N
+            # crop each period to where the envelope doesn't underflow
+            i0 = max(0, math.ceil(-r_max - x0))
+            i1 = min(M, math.floor(r_max - x0) + 1)
+            k0 = max(0, math.ceil(-r_max - y0))
+            k1 = min(N, math.floor(r_max - y0) + 1)
+            if i0 >= i1 or k0 >= k1:
+                continue
+            [xx, yy] = np.mgrid[x0 + i0:x0 + i1, y0 + k0:y0 + k1]
+            arg = -(curv[:, 0, 0] * np.multiply(xx, xx) + (curv[:, 0, 1] + curv[:, 1, 0]) * np.multiply(xx, yy) + curv[
+                :, 1, 1] * np.multiply(yy, yy))
+            if xi != 0:
+                arg = arg + 1.j * (xx * xi * cos + yy * xi * sin)
+            gab[:, i0:i1, k0:k1] += np.exp(arg)
 
     norm_factor = (2 * 3.1415 * sigma * sigma / slant)
     gab /= norm_factor
 
-    return gab
+    return gab.reshape(theta.shape + (M, N))
 
 
 __all__ = ['filter_bank']
@@ -1,12 +1,14 @@
 from ...frontend.base_frontend import ScatteringBase
 
+import numpy as np
+
 from ..filter_bank import filter_bank
 from ..utils import compute_padding
 
 
 class ScatteringBase2D(ScatteringBase):
     def __init__(self, J, shape, L=8, max_order=2, pre_pad=False,
-            backend=None, out_type='array'):
+            backend=None, out_type='array', cache_filters=False):
         super(ScatteringBase2D, self).__init__()
         self.pre_pad = pre_pad
         self.L = L
@@ -15,6 +17,7 @@ class ScatteringBase2D(ScatteringBase):
         self.shape = shape
         self.max_order = max_order
         self.out_type = out_type
+        self.cache_filters = cache_filters
 
     def build(self):
         self.M, self.N = self.shape
@@ -32,9 +35,29 @@ class ScatteringBase2D(ScatteringBase):
         self.unpad = self.backend.unpad
 
     def create_filters(self):
-        filters = filter_bank(self.M_padded, self.N_padded, self.J, self.L)
+        filters = filter_bank(self.M_padded, self.N_padded, self.J, self.L,
+                              cache=self.cache_filters)
         self.phi, self.psi = filters['phi'], filters['psi']
 
+        # per scale and resolution, stack all orientations; `psi` entries
+        # become views into the stacks
+        self.psi_stacked = {}
+        for j in range(self.J):
+            psi_j = [psi for psi in self.psi if psi['j'] == j]
+            self.psi_stacked[j] = {}
+            for res in (k for k in psi_j[0] if isinstance(k, int)):
+                stack = np.stack([psi[res] for psi in psi_j])
+                for psi, psi_res in zip(psi_j, stack):
+                    psi[res] = psi_res
+                self.psi_stacked[j][res] = stack
+
+        # real, for half spectra of real signals
+        self.phi_half = {'j': self.phi['j']}
+        for res in (k for k in self.phi if isinstance(k, int)):
+            N_res = self.phi[res].shape[-1]
+            self.phi_half[res] = np.ascontiguousarray(
+                self.phi[res][..., :N_res // 2 + 1])
+
     _doc_shape = 'M, N'
 
     _doc_instantiation_shape = {True: 'S = Scattering2D(J, (M, N))',
@@ -130,7 +153,12 @@ class ScatteringBase2D(ScatteringBase):
             the signal was padded externally. Defaults to `False`.
         backend : object, optional
             Controls the backend which is combined with the frontend.
-        {param_out_type}
+        {param_out_type}cache_filters : boolean, optional
+            If True, filters are loaded from, or saved to, a cache under
+            `kymatio.caching.get_cache_dir`, so that repeated instantiation
+            with the same `shape, J, L` skips filter construction. Defaults
+            to `False`.
+
         Attributes
         ----------
         J : int
@@ -1,14 +1,14 @@
 from ...frontend.numpy_frontend import ScatteringNumPy
-from ...scattering2d.core.scattering2d import scattering2d
+from ...scattering2d.core.scattering2d import scattering2d_stacked
 from .base_frontend import ScatteringBase2D
 import numpy as np
 
 class ScatteringNumPy2D(ScatteringNumPy, ScatteringBase2D):
     def __init__(self, J, shape, L=8, max_order=2, pre_pad=False,
-            backend='numpy', out_type='array'):
+            backend='numpy', out_type='array', cache_filters=False):
         ScatteringNumPy.__init__(self)
         ScatteringBase2D.__init__(self, J, shape, L, max_order, pre_pad,
-                backend, out_type)
+                backend, out_type, cache_filters)
         ScatteringBase2D._instantiate_backend(self, 'kymatio.scattering2d.backend.')
         ScatteringBase2D.build(self)
         ScatteringBase2D.create_filters(self)
@@ -35,8 +35,9 @@ class ScatteringNumPy2D(ScatteringNumPy, ScatteringBase2D):
 
         input = input.reshape((-1,) + signal_shape)
 
-        S = scattering2d(input, self.pad, self.unpad, self.backend, self.J,
-                self.L, self.phi, self.psi, self.max_order, self.out_type)
+        S = scattering2d_stacked(input, self.pad, self.unpad, self.backend,
+                self.J, self.L, self.phi_half, self.psi_stacked,
+                self.max_order, self.out_type)
 
         if self.out_type == 'array':
             scattering_shape = S.shape[-3:]
@@ -5,7 +5,15 @@ from ...numpy import Scattering2D as ScatteringNumPy2D
 # NOTE: Order in base classes matters here, since we want the sklearn-specific
 # documentation parameters to take precedence over NP.
 class ScatteringTransformer2D(ScatteringTransformerMixin, ScatteringNumPy2D):
-    pass
+    def __init__(self, J, shape, L=8, max_order=2, pre_pad=False,
+            backend='numpy', out_type='array', cache_filters=False,
+            n_jobs=None, batch_size=None):
+        self._init_params = {name: value for name, value in locals().items()
+                             if name != 'self'}
+        ScatteringNumPy2D.__init__(self, J, shape, L, max_order, pre_pad,
+                backend, out_type, cache_filters)
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
 
 
 ScatteringTransformer2D._document()
@@ -7,7 +7,7 @@ from ...frontend.torch_frontend import ScatteringTorch
 
 class ScatteringTorch2D(ScatteringTorch, ScatteringBase2D):
     def __init__(self, J, shape, L=8, max_order=2, pre_pad=False,
-            backend='torch', out_type='array'):
+            backend='torch', out_type='array', cache_filters=False):
         ScatteringTorch.__init__(self)
         ScatteringBase2D.__init__(**locals())
         ScatteringBase2D._instantiate_backend(self, 'kymatio.scattering2d.backend.')
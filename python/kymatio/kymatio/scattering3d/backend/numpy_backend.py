@@ -1,5 +1,12 @@
+import math
+import scipy.ndimage
 from ...backend.numpy_backend import NumpyBackend
 
+# max number of elements per block of stacked `m` convolutions
+_STACKED_BLOCK_SIZE = 2**22
+# number of elements per block of `compute_integrals`
+_INTEGRALS_BLOCK_SIZE = 2**16
+
 
 class NumpyBackend3D(NumpyBackend):
     @classmethod
@@ -27,6 +34,96 @@ class NumpyBackend3D(NumpyBackend):
             module = module ** 2 + cls._np.abs(x) ** 2
         return cls._np.sqrt(module)
 
+    @classmethod
+    def convolve_modulus_rotation(cls, x, filters):
+        """Convolves with all `m` wavelets of an `(l, j)` and takes the
+            rotation covariant modulus.
+
+            Parameters
+            ----------
+            x : tensor
+                Fourier transform of the input, size (batchsize, M, N, O).
+            filters : tensor
+                Fourier transforms of the wavelets, size (2l+1, M, N, O).
+            Returns
+            -------
+            output : tensor
+                Tensor of size (batchsize, M, N, O) holding::
+                $\\sqrt{\\sum_m (\\text{input}_\\text{array} \\star \\psi_{j,l,m})^2)}$
+        """
+        cls.complex_check(x)
+        # blocks of `m` at once: one broadcasted product and one batched
+        # inverse FFT per block, and a single square root at the end
+        step = max(1, _STACKED_BLOCK_SIZE // x.size)
+        module = 0
+        for m in range(0, len(filters), step):
+            y = cls._fft.ifftn(x[:, None] * filters[m:m + step],
+                               axes=(-3, -2, -1), overwrite_x=True)
+            module_m = y.real ** 2
+            module_m += y.imag ** 2
+            module = module + module_m.sum(axis=1)
+        return cls._np.sqrt(module)
+
+    @classmethod
+    def sample_points(cls, x, points):
+        """Samples a batch of volumes at given points.
+
+            Parameters
+            ----------
+            x : tensor
+                Size (B, M, N, O).
+            points : tensor
+                Integer grid coordinates, size (B, P, 3).
+            Returns
+            -------
+            output : tensor
+                Tensor of size (B, P) such that
+                output[b, p] = x[b, points[b, p, 0], points[b, p, 1], points[b, p, 2]].
+        """
+        b = cls._np.arange(x.shape[0])[:, None]
+        return x[b, points[..., 0], points[..., 1], points[..., 2]]
+
+    @classmethod
+    def convolve_modulus_at_points(cls, x, filters, points):
+        """Convolves with truncated signal space filters at given points, and
+            takes the rotation covariant modulus.
+
+            Parameters
+            ----------
+            x : tensor
+                Size (B, M, N, O).
+            filters : tensor
+                Filters in signal space, size (n_m, W, W, W), centered at
+                `[:, W // 2, W // 2, W // 2]`.
+            points : tensor
+                Integer grid coordinates, size (B, P, 3).
+            Returns
+            -------
+            output : tensor
+                Tensor of size (B, P) holding::
+                $\\sqrt{\\sum_m (\\text{input}_\\text{array} \\star \\psi_{j,l,m})^2)}$
+                at the points, with the convolution periodic over the grid.
+        """
+        np = cls._np
+        B, P = points.shape[:2]
+        n_m, W = filters.shape[:2]
+        u = np.arange(W) - W // 2
+        # `x[b, p - u]` for every offset `u` of the filter
+        idx = [(points[..., i, None] - u) % x.shape[i + 1] for i in range(3)]
+        filters = filters.reshape(n_m, -1).T
+        out = np.zeros((B, P))
+        # bound the `(chunk, P, W, W, W)` patches
+        step = max(1, _STACKED_BLOCK_SIZE // (P * W ** 3))
+        for b in range(0, B, step):
+            sl = slice(b, b + step)
+            patches = x[np.arange(B)[sl, None, None, None, None],
+                        idx[0][sl, :, :, None, None],
+                        idx[1][sl, :, None, :, None],
+                        idx[2][sl, :, None, None, :]]
+            y = np.matmul(patches.reshape(patches.shape[:2] + (-1,)), filters)
+            out[sl] = np.sqrt((y.real ** 2 + y.imag ** 2).sum(axis=-1))
+        return out
+
     @classmethod
     def compute_integrals(cls, input_array, integral_powers):
         """Computes integrals.
@@ -47,11 +144,95 @@ class NumpyBackend3D(NumpyBackend):
                 Tensor of size (B, P) containing the integrals of the input_array
                 to the powers p (l_p norms).
         """
-        integrals = cls._np.zeros((input_array.shape[0], len(integral_powers)),
-                dtype=cls._np.complex64)
-        for i_q, q in enumerate(integral_powers):
-            integrals[:, i_q] = (input_array ** q).reshape((input_array.shape[0], -1)).sum(axis=1)
-        return integrals
+        B = input_array.shape[0]
+        x = input_array.reshape((B, -1))
+        integrals = cls._np.zeros((B, len(integral_powers)))
+
+        # one pass over cache-sized blocks, computing every power per block
+        # rather than materialising `input_array ** q` for each `q`
+        rows = max(1, _INTEGRALS_BLOCK_SIZE // x.shape[1])
+        cols = max(1, _INTEGRALS_BLOCK_SIZE // rows)
+        buf = cls._np.empty((min(rows, B), min(cols, x.shape[1])), x.dtype)
+        for b in range(0, B, rows):
+            for k in range(0, x.shape[1], cols):
+                x_blk = x[b:b + rows, k:k + cols]
+                buf_blk = buf[:x_blk.shape[0], :x_blk.shape[1]]
+                out = integrals[b:b + rows]
+                for i_q, q in enumerate(integral_powers):
+                    if q == 1:
+                        out[:, i_q] += x_blk.sum(axis=1)
+                    elif q == 2:
+                        out[:, i_q] += cls._np.einsum('ij,ij->i', x_blk, x_blk)
+                    elif q == 0.5:
+                        out[:, i_q] += cls._np.sqrt(x_blk, out=buf_blk
+                                                    ).sum(axis=1)
+                    else:
+                        out[:, i_q] += cls._np.power(x_blk, q, out=buf_blk
+                                                     ).sum(axis=1)
+        return integrals.astype(cls._np.complex64)
+
+    @classmethod
+    def gaussian_filter(cls, x, sigma, subsample=1, truncate=None):
+        """Separable Gaussian smoothing over the three spatial axes.
+
+            Smooths one axis at a time with a 1D Gaussian, which equals
+            the product with a `gaussian_filter_bank` filter in 3D Fourier
+            space, at a fraction of the cost and memory of 3D FFTs.
+
+            Parameters
+            ----------
+            x : tensor
+                Size (..., M, N, O), real or complex.
+            sigma : float
+                Standard deviation of the Gaussian, in samples.
+            subsample : int, optional
+                Subsampling factor of the output along each axis. Each axis is
+                subsampled right after it is smoothed, so later axes are
+                smoothed at the lower resolution. Defaults to 1.
+            truncate : float / None, optional
+                If None, each axis is smoothed periodically through a 1D FFT,
+                exactly. Otherwise, through a direct periodic convolution with
+                a Gaussian truncated at `truncate * sigma` samples, renormalised
+                to unit sum; this is faster for small `sigma`. Defaults to
+                None.
+            Returns
+            -------
+            output : tensor
+                Tensor of size (..., ceil(M / subsample), ceil(N / subsample),
+                ceil(O / subsample)), of the dtype of `x`.
+        """
+        np = cls._np
+        for axis in (-3, -2, -1):
+            n = x.shape[axis]
+            r = None if truncate is None else int(math.ceil(truncate * sigma))
+            if r is None or 2 * r + 1 > n:
+                g = np.exp(-0.5 * (2 * np.pi * cls._fft.fftfreq(n) * sigma
+                                   ) ** 2)
+                g = g.reshape([n] + [1] * (-axis - 1))
+                if cls._is_complex(x):
+                    x = cls._fft.ifft(cls._fft.fft(x, axis=axis) * g,
+                                      axis=axis).astype(x.dtype, copy=False)
+                else:
+                    g = g[:n // 2 + 1]
+                    x = cls._fft.irfft(cls._fft.rfft(x, axis=axis) * g, n,
+                                       axis=axis).astype(x.dtype, copy=False)
+            else:
+                u = np.arange(-r, r + 1)
+                g = np.exp(-0.5 * (u / sigma) ** 2)
+                g /= g.sum()
+                if cls._is_complex(x):
+                    x = (scipy.ndimage.correlate1d(x.real, g, axis=axis,
+                                                   mode='wrap') +
+                         1j * scipy.ndimage.correlate1d(x.imag, g, axis=axis,
+                                                        mode='wrap')
+                         ).astype(x.dtype, copy=False)
+                else:
+                    x = scipy.ndimage.correlate1d(x, g, axis=axis,
+                                                  mode='wrap')
+            if subsample > 1:
+                x = x[(Ellipsis, slice(None, None, subsample)) +
+                      (slice(None),) * (-axis - 1)]
+        return x
 
     @classmethod
     def concatenate(cls, arrays, L):
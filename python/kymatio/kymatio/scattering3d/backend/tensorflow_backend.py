@@ -39,6 +39,29 @@ class TensorFlowBackend3D(TensorFlowBackend):
             module = module ** 2 + tf.abs(x) ** 2
         return tf.sqrt(module)
 
+    @classmethod
+    def convolve_modulus_rotation(cls, x, filters):
+        """Convolves with all `m` wavelets of an `(l, j)` and takes the
+            rotation covariant modulus.
+
+            Parameters
+            ----------
+            x : tensor
+                Fourier transform of the input, size (batchsize, M, N, O).
+            filters : tensor
+                Fourier transforms of the wavelets, size (2l+1, M, N, O).
+            Returns
+            -------
+            output : tensor
+                Tensor of size (batchsize, M, N, O) holding::
+                $\\sqrt{\\sum_m (\\text{input}_\\text{array} \\star \\psi_{j,l,m})^2)}$
+        """
+        module = None
+        for m in range(len(filters)):
+            module = cls.modulus_rotation(
+                cls.ifft(cls.cdgmm3d(x, filters[m])), module)
+        return module
+
     @staticmethod
     def compute_integrals(input_array, integral_powers):
         """Computes integrals.
@@ -61,6 +61,29 @@ class TorchBackend3D(TorchBackend):
             module = module ** 2 + (x ** 2).sum(-1, keepdim=True)
         return torch.sqrt(module)
 
+    @classmethod
+    def convolve_modulus_rotation(cls, x, filters):
+        """Convolves with all `m` wavelets of an `(l, j)` and takes the
+            rotation covariant modulus.
+
+            Parameters
+            ----------
+            x : tensor
+                Fourier transform of the input, size (batchsize, M, N, O, 2).
+            filters : tensor
+                Fourier transforms of the wavelets, size (2l+1, M, N, O, 2).
+            Returns
+            -------
+            output : tensor
+                Tensor of size (batchsize, M, N, O, 1) holding::
+                $\\sqrt{\\sum_m (\\text{input}_\\text{array} \\star \\psi_{j,l,m})^2)}$
+        """
+        module = None
+        for m in range(len(filters)):
+            module = cls.modulus_rotation(
+                cls.ifft(cls.cdgmm3d(x, filters[m])), module)
+        return module
+
     @staticmethod
     def compute_integrals(input_array, integral_powers):
         """Computes integrals.
@@ -18,7 +18,7 @@ def scattering3d(x, filters, rotation_covariant, L, J, max_order, backend, avera
     ifft = backend.ifft
     cdgmm3d = backend.cdgmm3d
     modulus = backend.modulus
-    modulus_rotation = backend.modulus_rotation
+    convolve_modulus_rotation = backend.convolve_modulus_rotation
     concatenate = backend.concatenate
 
     U_0_c = rfft(x)
@@ -27,35 +27,28 @@ def scattering3d(x, filters, rotation_covariant, L, J, max_order, backend, avera
     for l in range(L + 1):
         s_order_1_l, s_order_2_l = [], []
         for j_1 in range(J + 1):
-            U_1_m = None
             if rotation_covariant:
-                for m in range(len(filters[l][j_1])):
-                    U_1_c = cdgmm3d(U_0_c, filters[l][j_1][m])
-                    U_1_c = ifft(U_1_c)
-                    U_1_m = modulus_rotation(U_1_c, U_1_m)
+                U_1_m = convolve_modulus_rotation(U_0_c, filters[l][j_1])
             else:
-                U_1_c = cdgmm3d(U_0_c, filters[l][j_1][0])
-                U_1_c = ifft(U_1_c)
-                U_1_m = modulus(U_1_c)
+                U_1_m = modulus(ifft(cdgmm3d(U_0_c, filters[l][j_1][0])))
 
             S_1_l = averaging(U_1_m)
             s_order_1_l.append(S_1_l)
 
-            if max_order > 1:
-                U_1_c = rfft(U_1_m)
-                for j_2 in range(j_1 + 1, J + 1):
-                    U_2_m = None
-                    if rotation_covariant:
-                        for m in range(len(filters[l][j_2])):
-                            U_2_c = cdgmm3d(U_1_c, filters[l][j_2][m])
-                            U_2_c = ifft(U_2_c)
-                            U_2_m = modulus_rotation(U_2_c, U_2_m)
-                    else:
-                        U_2_c = cdgmm3d(U_1_c, filters[l][j_2][0])
-                        U_2_c = ifft(U_2_c)
-                        U_2_m = modulus(U_2_c)
-                    S_2_l = averaging(U_2_m)
-                    s_order_2_l.append(S_2_l)
+            if max_order == 1:
+                continue
+
+            # only the Fourier transform of the modulus is kept for the
+            # second order
+            U_1_c = rfft(U_1_m)
+            del U_1_m
+            for j_2 in range(j_1 + 1, J + 1):
+                if rotation_covariant:
+                    U_2_m = convolve_modulus_rotation(U_1_c, filters[l][j_2])
+                else:
+                    U_2_m = modulus(ifft(cdgmm3d(U_1_c, filters[l][j_2][0])))
+                S_2_l = averaging(U_2_m)
+                s_order_2_l.append(S_2_l)
 
         s_order_1.append(s_order_1_l)
 
@@ -73,3 +66,93 @@ def scattering3d(x, filters, rotation_covariant, L, J, max_order, backend, avera
     S = concatenate(S, L)
 
     return S
+
+
+def scattering3d_local(x, filters, local_filters, points, rotation_covariant,
+                       L, J, max_order, backend):
+    """
+    The forward pass of 3D solid harmonic scattering, evaluated only at given
+    points
+    Parameters
+    ----------
+    x : tensor
+        input of size (batchsize, M, N, O)
+    filters : list
+        filters in Fourier space, `filters[l][j]` of size (2l+1, M, N, O)
+    local_filters : list
+        truncated filters in signal space, `local_filters[l][j]` of size
+        (2l+1, W, W, W), or None to convolve over the whole grid instead
+    points : tensor
+        integer grid coordinates, of size (batchsize, P, 3)
+    Returns
+    -------
+    output : tensor
+        the moduli of the wavelet responses at the points, of size
+        (batchsize, n_paths, L + 1, P), with the first- and second-order
+        paths concatenated along the second axis if max_order is 2
+    """
+    rfft = backend.rfft
+    ifft = backend.ifft
+    cdgmm3d = backend.cdgmm3d
+    modulus = backend.modulus
+    convolve_modulus_rotation = backend.convolve_modulus_rotation
+    convolve_modulus_at_points = backend.convolve_modulus_at_points
+    sample_points = backend.sample_points
+    concatenate = backend.concatenate
+
+    def wavelet_modulus(U_c, l, j):
+        if rotation_covariant:
+            return convolve_modulus_rotation(U_c, filters[l][j])
+        return modulus(ifft(cdgmm3d(U_c, filters[l][j][0])))
+
+    def wavelet_modulus_at_points(U, U_c, l, j):
+        # direct convolution near the points if the filter is small, else
+        # over the whole grid
+        if local_filters[l][j] is not None:
+            local_filter = local_filters[l][j]
+            if not rotation_covariant:
+                local_filter = local_filter[:1]
+            return convolve_modulus_at_points(U, local_filter, points)
+        return sample_points(wavelet_modulus(U_c, l, j), points)
+
+    U_0_c = None
+
+    s_order_1, s_order_2 = [], []
+    for l in range(L + 1):
+        s_order_1_l, s_order_2_l = [], []
+        for j_1 in range(J + 1):
+            if max_order == 1:
+                if local_filters[l][j_1] is None and U_0_c is None:
+                    U_0_c = rfft(x)
+                s_order_1_l.append(wavelet_modulus_at_points(x, U_0_c, l, j_1))
+                continue
+
+            # the second order needs the first-order moduli around the
+            # points, so compute them over the whole grid
+            if U_0_c is None:
+                U_0_c = rfft(x)
+            U_1_m = wavelet_modulus(U_0_c, l, j_1)
+            s_order_1_l.append(sample_points(U_1_m, points))
+
+            U_1_c = None
+            for j_2 in range(j_1 + 1, J + 1):
+                if local_filters[l][j_2] is None and U_1_c is None:
+                    U_1_c = rfft(U_1_m)
+                s_order_2_l.append(
+                    wavelet_modulus_at_points(U_1_m, U_1_c, l, j_2))
+
+        s_order_1.append(s_order_1_l)
+
+        if max_order == 2:
+            s_order_2.append(s_order_2_l)
+
+    S = s_order_1
+    if max_order == 2:
+        S = [x + y for x, y in zip(S, s_order_2)]
+
+    # Invert (ell, m × j) ordering to (m × j, ell).
+    S = [x for y in zip(*S) for x in y]
+
+    S = concatenate(S, L)
+
+    return S
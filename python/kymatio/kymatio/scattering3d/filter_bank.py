@@ -1,11 +1,19 @@
-__all__ = ['solid_harmonic_filter_bank']
+__all__ = ['solid_harmonic_filter_bank', 'SolidHarmonicFilterBank',
+           'local_filter_bank']
 
+import os
+from collections import OrderedDict
 import numpy as np
 from scipy.special import sph_harm, factorial
 from .utils import get_3d_angles, double_factorial, sqrt
+from ..caching import get_cache_dir
 
+# bump when filter construction changes, to invalidate caches
+_FILTER_BANK_VERSION = 1
 
-def solid_harmonic_filter_bank(M, N, O, J, L, sigma_0, fourier=True):
+
+def solid_harmonic_filter_bank(M, N, O, J, L, sigma_0, fourier=True,
+                               cache=False):
     """
         Computes a set of 3D Solid Harmonic Wavelets of scales j = [0, ..., J]
         and first orders l = [0, ..., L].
@@ -23,6 +31,9 @@ def solid_harmonic_filter_bank(M, N, O, J, L, sigma_0, fourier=True):
         fourier : boolean
             if true, wavelets are computed in Fourier space
 	    if false, wavelets are computed in signal space
+        cache : boolean, optional
+            If True, each `(l, j)` filter is loaded from, or saved to, a file
+            under `caching.get_cache_dir('scattering3d_filters')`.
 
         Returns
         -------
@@ -34,13 +45,229 @@ def solid_harmonic_filter_bank(M, N, O, J, L, sigma_0, fourier=True):
     for l in range(L + 1):
         filters_l = np.zeros((J + 1, 2 * l + 1, M, N, O), dtype='complex64')
         for j in range(J+1):
-            sigma = sigma_0 * 2 ** j
-            filters_l[j,...] = solid_harmonic_3d(M, N, O, sigma, l, fourier=fourier)
+            filters_l[j,...] = _solid_harmonic_filter(
+                M, N, O, sigma_0, l, j, fourier, cache)
         filters.append(filters_l)
     return filters
 
 
-def gaussian_filter_bank(M, N, O, J, sigma_0, fourier=True):
+def local_filter_bank(filters, sigma_0, truncate=1e-4):
+    """
+        Computes truncated signal space versions of Fourier filters, for
+        convolving at a few points rather than over the whole grid.
+
+        Each filter is cropped to the smallest cube, centered on the origin,
+        outside of which lies at most a fraction `truncate` of its L2 norm.
+        This bounds the error of a response relative to
+        `||filter|| * ||input||` on the cube. The radius thus grows with the
+        scale and with `l`, whose radial profile `r^l exp(-r^2 / 2 sigma^2)`
+        peaks further out. Scale `j = 0` filters are band-limited by the
+        grid and ring slowly in signal space (with `sigma_0 = 1`, 2e-3 to 4e-2
+        of their norm lies beyond `4 sigma_0` for `l = 0, ..., 3`), so at the
+        default `truncate` they don't fit, and are convolved over the full
+        grid.
+
+        Parameters
+        ----------
+        filters : list
+            filters in Fourier space, as returned by
+            `solid_harmonic_filter_bank` or `SolidHarmonicFilterBank`
+        sigma_0 : float
+            width parameter of mother solid harmonic wavelet
+        truncate : float, optional
+            fraction of each filter's L2 norm allowed outside its cube.
+            Defaults to `1e-4`.
+
+        Returns
+        -------
+        local_filters : list of lists
+            `local_filters[l][j]` is a complex64 numpy array of size
+            (2l+1, W, W, W), with W = 2 * half-width + 1, whose entry
+            `[m, r + u0, r + u1, r + u2]` is the wavelet at offset `(u0, u1, u2)`,
+            or None where the cube doesn't fit in half the grid, in which case
+            a full-grid convolution is cheaper.
+    """
+    local_filters = []
+    for l in range(len(filters)):
+        local_filters_l = []
+        for j in range(len(filters[l])):
+            filters_lj = np.asarray(filters[l][j])
+            shape = filters_lj.shape[-3:]
+            # largest half-width worth convolving directly
+            r_max = (min(shape) // 2 - 1) // 2
+            # no cube narrower than the filter's width can qualify
+            if int(np.ceil(sigma_0 * 2 ** j)) > r_max:
+                local_filters_l.append(None)
+                continue
+            filt = np.fft.ifftn(filters_lj, axes=(-3, -2, -1))
+            r = _truncation_radius(filt, truncate)
+            if r > r_max:
+                local_filters_l.append(None)
+                continue
+            u = np.arange(-r, r + 1)
+            filt = filt[:, (u % shape[0])[:, None, None],
+                        (u % shape[1])[None, :, None],
+                        (u % shape[2])[None, None, :]]
+            local_filters_l.append(filt.astype('complex64'))
+        local_filters.append(local_filters_l)
+    return local_filters
+
+
+def _truncation_radius(filt, truncate):
+    """Smallest half-width `r` of the cube holding all but a fraction
+    `truncate` of the L2 norm of `filt`, of size `(..., M, N, O)` with the
+    origin at `[..., 0, 0, 0]`."""
+    shape = filt.shape[-3:]
+    # Chebyshev distance of each grid point to the origin, periodically
+    dist = [np.abs(np.fft.fftfreq(n) * n).astype(int) for n in shape]
+    dist = np.maximum(np.maximum(dist[0][:, None, None],
+                                 dist[1][None, :, None]),
+                      dist[2][None, None, :])
+    energy = (np.abs(filt) ** 2).reshape(-1, *shape).sum(0)
+    # energy outside the cube of half-width `r`, for each `r`
+    energy_outside = energy.sum() - np.cumsum(
+        np.bincount(dist.ravel(), weights=energy.ravel()))
+    energy_outside[-1] = 0  # the whole grid, up to rounding
+    return int(np.argmax(energy_outside <= truncate ** 2 * energy.sum()))
+
+
+class SolidHarmonicFilterBank(object):
+    """
+        On-demand 3D Solid Harmonic Wavelets and Gaussian filters.
+
+        Indexes like the output of `solid_harmonic_filter_bank`, i.e.
+        `filters[l][j]` is the `(2l+1, M, N, O)` array of wavelets of order
+        `l` and scale `j`, but only builds (or loads from the disk cache) a
+        filter when it is requested, and keeps the `max_cached` most recently
+        used ones. Since `scattering3d` consumes all scales of one `l` before
+        moving to the next, the default of `J + 2` filters holds one `l` group,
+        and peak memory doesn't grow with `L`.
+
+        Parameters
+        ----------
+        M, N, O : int
+            spatial sizes
+        J : int
+            maximal scale of the wavelets
+        L : int
+            maximal first order of the wavelets
+        sigma_0 : float
+            width parameter of mother solid harmonic wavelet
+        fourier : boolean, optional
+            if true, filters are computed in Fourier space
+            if false, filters are computed in signal space
+        cache : boolean, optional
+            If True, filters are loaded from, or saved to, files under
+            `caching.get_cache_dir('scattering3d_filters')`.
+        max_cached : int, optional
+            number of filters kept in memory. Defaults to `J + 2`.
+
+        Attributes
+        ----------
+        gaussians : sequence of ndarray
+            `gaussians[j]` is the `(M, N, O)` Gaussian filter of scale `j`, for
+            `j = [0, ..., J + 1]`, as in `gaussian_filter_bank(..., J + 1, ...)`.
+    """
+    def __init__(self, M, N, O, J, L, sigma_0, fourier=True, cache=False,
+                 max_cached=None):
+        self.M, self.N, self.O = M, N, O
+        self.J, self.L = J, L
+        self.sigma_0 = sigma_0
+        self.fourier = fourier
+        self.cache = cache
+        self.max_cached = J + 2 if max_cached is None else max_cached
+        self._filters = OrderedDict()
+
+        self.gaussians = _FilterGroup(
+            lambda j: self._get(('gaussian', j)), J + 2)
+
+    def __len__(self):
+        return self.L + 1
+
+    def __getitem__(self, l):
+        if not 0 <= l <= self.L:
+            raise IndexError("l must be in [0, {}], got {}".format(self.L, l))
+        return _FilterGroup(lambda j: self._get((l, j)), self.J + 1)
+
+    def _get(self, key):
+        if key in self._filters:
+            self._filters.move_to_end(key)
+            return self._filters[key]
+
+        l, j = key
+        if l == 'gaussian':
+            filt = _gaussian_filter(self.M, self.N, self.O, self.sigma_0, j,
+                                    self.fourier, self.cache)
+        else:
+            filt = _solid_harmonic_filter(self.M, self.N, self.O, self.sigma_0,
+                                          l, j, self.fourier, self.cache)
+        self._filters[key] = filt
+        while len(self._filters) > self.max_cached:
+            self._filters.popitem(last=False)
+        return filt
+
+
+class _FilterGroup(object):
+    """Read-only sequence of filters, built by `get(j)` on access."""
+    def __init__(self, get, length):
+        self._get = get
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, j):
+        if not 0 <= j < self._length:
+            raise IndexError("j must be in [0, {}), got {}".format(
+                self._length, j))
+        return self._get(j)
+
+    def __iter__(self):
+        for j in range(self._length):
+            yield self._get(j)
+
+
+def _solid_harmonic_filter(M, N, O, sigma_0, l, j, fourier, cache):
+    path = _filter_cache_path('l{}'.format(l), M, N, O, sigma_0, j, fourier,
+                              cache)
+    if path is not None and os.path.isfile(path):
+        return np.load(path)
+    filt = solid_harmonic_3d(M, N, O, sigma_0 * 2 ** j, l, fourier=fourier)
+    filt = filt.astype('complex64', copy=False)
+    if path is not None:
+        _save_filter(path, filt)
+    return filt
+
+
+def _gaussian_filter(M, N, O, sigma_0, j, fourier, cache):
+    path = _filter_cache_path('gaussian', M, N, O, sigma_0, j, fourier, cache)
+    if path is not None and os.path.isfile(path):
+        return np.load(path)
+    filt = gaussian_3d(M, N, O, sigma_0 * 2 ** j, fourier=fourier)
+    filt = filt.astype('complex64')
+    if path is not None:
+        _save_filter(path, filt)
+    return filt
+
+
+def _filter_cache_path(name, M, N, O, sigma_0, j, fourier, cache):
+    if not cache:
+        return None
+    return os.path.join(
+        get_cache_dir('scattering3d_filters'),
+        'v{}_{}_M{}_N{}_O{}_s{!r}_j{}_{}.npy'.format(
+            _FILTER_BANK_VERSION, name, M, N, O, float(sigma_0), j,
+            'fourier' if fourier else 'signal'))
+
+
+def _save_filter(path, filt):
+    # write then rename, so concurrent readers never see a partial file
+    tmp_path = '%s.%s.tmp.npy' % (path[:-4], os.getpid())
+    np.save(tmp_path, filt)
+    os.replace(tmp_path, path)
+
+
+def gaussian_filter_bank(M, N, O, J, sigma_0, fourier=True, cache=False):
     """
         Computes a set of 3D Gaussian filters of scales j = [0, ..., J].
 
@@ -55,6 +282,9 @@ def gaussian_filter_bank(M, N, O, J, sigma_0, fourier=True):
         fourier : boolean
             if true, wavelets are computed in Fourier space
 	    if false, wavelets are computed in signal space
+        cache : boolean, optional
+            If True, each filter is loaded from, or saved to, a file under
+            `caching.get_cache_dir('scattering3d_filters')`.
 
         Returns
         -------
@@ -64,8 +294,8 @@ def gaussian_filter_bank(M, N, O, J, sigma_0, fourier=True):
     """
     gaussians = np.zeros((J + 1, M, N, O), dtype='complex64')
     for j in range(J + 1):
-        sigma = sigma_0 * 2 ** j
-        gaussians[j, ...] = gaussian_3d(M, N, O, sigma, fourier=fourier)
+        gaussians[j, ...] = _gaussian_filter(M, N, O, sigma_0, j, fourier,
+                                             cache)
     return gaussians
 
 
@@ -1,11 +1,14 @@
+import numpy as np
 from ...frontend.base_frontend import ScatteringBase
-from ..filter_bank import solid_harmonic_filter_bank, gaussian_filter_bank
+from ..filter_bank import (solid_harmonic_filter_bank, gaussian_filter_bank,
+                           SolidHarmonicFilterBank, local_filter_bank)
 
 
 class ScatteringBase3D(ScatteringBase):
     def __init__(self, J, shape, L=3, sigma_0=1, max_order=2,
                  rotation_covariant=True, method='integral', points=None,
-                 integral_powers=(0.5, 1., 2.), backend=None):
+                 integral_powers=(0.5, 1., 2.), backend=None,
+                 lazy_filters=False, cache_filters=False, truncate=1e-4):
         super(ScatteringBase3D, self).__init__()
         self.J = J
         self.shape = shape
@@ -18,19 +21,63 @@ class ScatteringBase3D(ScatteringBase):
         self.points = points
         self.integral_powers = integral_powers
         self.backend = backend
+        self.lazy_filters = lazy_filters
+        self.cache_filters = cache_filters
+        self.truncate = truncate
 
     def build(self):
         self.M, self.N, self.O = self.shape
 
-    def create_filters(self):
-        self.filters = solid_harmonic_filter_bank(
-            self.M, self.N, self.O, self.J, self.L, self.sigma_0)
+        if self.method not in self._methods:
+            raise ValueError('method must be in {}'.format(self._methods))
 
-        self.gaussian_filters = gaussian_filter_bank(
-            self.M, self.N, self.O, self.J + 1, self.sigma_0)
+    def create_filters(self):
+        if self.lazy_filters:
+            self.filters = SolidHarmonicFilterBank(
+                self.M, self.N, self.O, self.J, self.L, self.sigma_0,
+                cache=self.cache_filters)
+            self.gaussian_filters = self.filters.gaussians
+        else:
+            self.filters = solid_harmonic_filter_bank(
+                self.M, self.N, self.O, self.J, self.L, self.sigma_0,
+                cache=self.cache_filters)
+
+            self.gaussian_filters = gaussian_filter_bank(
+                self.M, self.N, self.O, self.J + 1, self.sigma_0,
+                cache=self.cache_filters)
+
+        if self.method == 'local':
+            self.local_filters = local_filter_bank(self.filters, self.sigma_0,
+                                                   self.truncate)
+
+    def _check_points(self, batch_size):
+        """Returns `points` as integer coordinates of size `(B, P, 3)`."""
+        if self.points is None:
+            raise ValueError("method='local' requires `points`.")
+        points = np.round(np.asarray(self.points)).astype(int)
+        if points.ndim == 2:
+            points = np.broadcast_to(points, (batch_size,) + points.shape)
+        if points.ndim != 3 or points.shape[-1] != 3:
+            raise ValueError("`points` must be of shape (P, 3) or (B, P, 3), "
+                             "got {}".format(points.shape))
+        if points.shape[0] != batch_size:
+            raise ValueError("`points` is for a batch of {}, but the input "
+                             "is of {}".format(points.shape[0], batch_size))
+        if ((points < 0).any() or
+                (points >= np.array([self.M, self.N, self.O])).any()):
+            raise ValueError("`points` must be within the grid {}".format(
+                (self.M, self.N, self.O)))
+        return points
 
     _doc_shape = 'M, N, O'
 
+    # values of `method` the frontend implements
+    _methods = ('integral', 'local')
+
+    # frontends whose filters must be materialised (e.g. as buffers) set
+    # this to `False`
+    _doc_lazy_filters = True
+
     _doc_class = \
     r"""The 3D solid harmonic scattering transform
 
@@ -83,10 +130,45 @@ class ScatteringBase3D(ScatteringBase):
             The second order moduli change analogously. Defaults to `True`.
         method: string, optional
             Specifies the method for obtaining scattering coefficients.
-            Currently, only `'integral'` is available. Defaults to `'integral'`.
+            `'integral'` integrates the moduli over the whole volume, to the
+            `integral_powers`.
+            {method_local}Defaults to `'integral'`.
+        points: array-like, optional
+            Only for `method='local'`: integer grid coordinates at which the
+            moduli are evaluated, of shape `(P, 3)`, or `(B, P, 3)` for
+            different points per input. Can be changed after instantiation.
         integral_powers: array-like
             List of exponents to the power of which moduli are raised before
             integration.
+        {param_lazy_filters}cache_filters: bool, optional
+            If `True`, filters are loaded from, or saved to, a cache under
+            `kymatio.caching.get_cache_dir`, so that repeated instantiation
+            with the same `shape, J, L, sigma_0` skips filter construction.
+            Defaults to `False`.
+        {param_truncate}"""
+
+    _doc_method_local = \
+    """`'local'` evaluates the moduli only at `points`, by direct
+            convolution with truncated filters where the filters are small,
+            and returns an array of shape `(B, n_paths, L + 1, P)`.
+            """
+
+    _doc_param_truncate = \
+    """truncate: float, optional
+            Only for `method='local'`: fraction of each filter's L2 norm
+            allowed outside the cube it is cropped to, which bounds the
+            relative error of the moduli at `points`. Filters that don't fit
+            in half the grid at this tolerance (with `sigma_0=1`, all of
+            scale `0` at the default) are convolved over the full grid.
+            Defaults to `1e-4`; see `local_filter_bank`.
+        """
+
+    _doc_param_lazy_filters = \
+    """lazy_filters: bool, optional
+            If `True`, filters are built (or loaded from the cache) one
+            `(l, j)` at a time as the scattering consumes them, and only the
+            most recently used `l` group is kept in memory; see
+            `SolidHarmonicFilterBank`. Defaults to `False`.
         """
 
     _doc_scattering = \
@@ -113,7 +195,13 @@ class ScatteringBase3D(ScatteringBase):
             frontend_paragraph=cls._doc_frontend_paragraph,
             alias_name=cls._doc_alias_name,
             alias_call=cls._doc_alias_call,
-            sample=cls._doc_sample.format(shape=cls._doc_shape))
+            sample=cls._doc_sample.format(shape=cls._doc_shape),
+            param_lazy_filters=(cls._doc_param_lazy_filters
+                                if cls._doc_lazy_filters else ''),
+            method_local=(cls._doc_method_local
+                          if 'local' in cls._methods else ''),
+            param_truncate=(cls._doc_param_truncate
+                            if 'local' in cls._methods else ''))
 
         cls.scattering.__doc__ = ScatteringBase3D._doc_scattering.format(
             array=cls._doc_array,
@@ -1,16 +1,19 @@
 from ...frontend.numpy_frontend import ScatteringNumPy
-from kymatio.scattering3d.core.scattering3d import scattering3d
+from kymatio.scattering3d.core.scattering3d import (scattering3d,
+                                                    scattering3d_local)
 from .base_frontend import ScatteringBase3D
 import numpy as np
 
 
 class HarmonicScatteringNumPy3D(ScatteringNumPy, ScatteringBase3D):
     def __init__(self, J, shape, L=3, sigma_0=1, max_order=2, rotation_covariant=True, method='integral', points=None,
-                 integral_powers=(0.5, 1., 2.), backend='numpy'):
+                 integral_powers=(0.5, 1., 2.), backend='numpy',
+                 lazy_filters=False, cache_filters=False, truncate=1e-4):
         ScatteringNumPy.__init__(self)
         ScatteringBase3D.__init__(self, J, shape, L, sigma_0, max_order,
                                   rotation_covariant, method, points,
-                                  integral_powers, backend)
+                                  integral_powers, backend, lazy_filters,
+                                  cache_filters, truncate)
 
         self.build()
 
@@ -37,10 +40,21 @@ class HarmonicScatteringNumPy3D(ScatteringNumPy, ScatteringBase3D):
         signal_shape = input_array.shape[-3:]
 
         input_array = input_array.reshape((-1,) + signal_shape)
-        self.averaging = lambda x: self.backend.compute_integrals(x, self.integral_powers)
 
-        S = scattering3d(input_array, filters=self.filters, rotation_covariant=self.rotation_covariant, L=self.L,
-                            J=self.J, max_order=self.max_order, backend=self.backend, averaging=self.averaging)
+        if self.method == 'local':
+            points = self._check_points(input_array.shape[0])
+            S = scattering3d_local(input_array, filters=self.filters,
+                                   local_filters=self.local_filters,
+                                   points=points,
+                                   rotation_covariant=self.rotation_covariant,
+                                   L=self.L, J=self.J,
+                                   max_order=self.max_order,
+                                   backend=self.backend)
+        else:
+            self.averaging = lambda x: self.backend.compute_integrals(x, self.integral_powers)
+
+            S = scattering3d(input_array, filters=self.filters, rotation_covariant=self.rotation_covariant, L=self.L,
+                                J=self.J, max_order=self.max_order, backend=self.backend, averaging=self.averaging)
 
 
         scattering_shape = S.shape[1:]
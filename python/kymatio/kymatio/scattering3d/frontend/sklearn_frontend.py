@@ -6,7 +6,19 @@ from ...numpy import HarmonicScattering3D as HarmonicScatteringNumPy3D
 # documentation parameters to take precedence over NP.
 class HarmonicScatteringTransformer3D(ScatteringTransformerMixin,
                                       HarmonicScatteringNumPy3D):
-    pass
+    def __init__(self, J, shape, L=3, sigma_0=1, max_order=2,
+                 rotation_covariant=True, method='integral', points=None,
+                 integral_powers=(0.5, 1., 2.), backend='numpy',
+                 lazy_filters=False, cache_filters=False, truncate=1e-4,
+                 n_jobs=None, batch_size=None):
+        self._init_params = {name: value for name, value in locals().items()
+                             if name != 'self'}
+        HarmonicScatteringNumPy3D.__init__(self, J, shape, L, sigma_0,
+                max_order, rotation_covariant, method, points,
+                integral_powers, backend, lazy_filters, cache_filters,
+                truncate)
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
 
 
 HarmonicScatteringTransformer3D._document()
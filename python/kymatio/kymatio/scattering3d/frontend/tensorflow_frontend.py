@@ -8,13 +8,18 @@ from .base_frontend import ScatteringBase3D
 
 
 class HarmonicScatteringTensorFlow3D(ScatteringTensorFlow, ScatteringBase3D):
+    _methods = ('integral',)
+
     def __init__(self, J, shape, L=3, sigma_0=1, max_order=2,
             rotation_covariant=True, method='integral', points=None,
-            integral_powers=(0.5, 1., 2.), backend='tensorflow', name='HarmonicScattering3D'):
+            integral_powers=(0.5, 1., 2.), backend='tensorflow',
+            name='HarmonicScattering3D', lazy_filters=False,
+            cache_filters=False):
         ScatteringTensorFlow.__init__(self, name=name)
         ScatteringBase3D.__init__(self, J, shape, L, sigma_0, max_order,
                                   rotation_covariant, method, points,
-                                  integral_powers, backend)
+                                  integral_powers, backend, lazy_filters,
+                                  cache_filters)
         self.build()
 
 
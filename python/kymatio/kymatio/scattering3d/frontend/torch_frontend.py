@@ -5,12 +5,18 @@ from .base_frontend import ScatteringBase3D
 
 
 class HarmonicScatteringTorch3D(ScatteringTorch, ScatteringBase3D):
+    _doc_lazy_filters = False
+    _methods = ('integral',)
+
     def __init__(self, J, shape, L=3, sigma_0=1, max_order=2, rotation_covariant=True, method='integral', points=None,
-                 integral_powers=(0.5, 1., 2.), backend='torch'):
+                 integral_powers=(0.5, 1., 2.), backend='torch',
+                 cache_filters=False):
         ScatteringTorch.__init__(self)
+        # filters are registered as buffers, so can't be lazy
         ScatteringBase3D.__init__(self, J, shape, L, sigma_0, max_order,
                                   rotation_covariant, method, points,
-                                  integral_powers, backend)
+                                  integral_powers, backend,
+                                  cache_filters=cache_filters)
 
         self.build()
 
@@ -1,8 +1,10 @@
 import numpy as np
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 
-def generate_weighted_sum_of_gaussians(grid, positions, weights, sigma):
+def generate_weighted_sum_of_gaussians(grid, positions, weights, sigma,
+                                       n_jobs=1):
     """
         Computes sum of 3D Gaussians centered at given positions and weighted
         with the given weights.
@@ -19,27 +21,91 @@ def generate_weighted_sum_of_gaussians(grid, positions, weights, sigma):
             all weights after are ignored
         sigma : float
             width parameter of the Gaussian
+        n_jobs : int, optional
+            number of threads over which chunks of signals are distributed.
+            Defaults to 1.
         Returns
         -------
         signals : numpy array
             numpy array of size (B, M, N, O)
             B is the batch_size, M, N, O are the size of the signal
+        Notes
+        -----
+        If `grid` is a `np.meshgrid(..., indexing='ij')` (as produced by
+        `np.mgrid`), each Gaussian is the outer product of three 1D Gaussians,
+        and the sum over Gaussians is a matrix product; otherwise the Gaussians
+        are evaluated on the full grid, vectorised over signals.
     """
     _, M, N, O = grid.shape
-    signals = np.zeros((positions.shape[0], M, N, O))
-
-    for i_signal in range(positions.shape[0]):
-        n_points = positions[i_signal].shape[0]
-        for i_point in range(n_points):
-            if weights[i_signal, i_point] == 0:
-                break
-            weight = weights[i_signal, i_point]
-            center = positions[i_signal, i_point]
-            signals[i_signal] = np.add(signals[i_signal] , weight * np.exp(
-                -0.5 * ((grid[0] - center[0]) ** 2 +
-                        (grid[1] - center[1]) ** 2 +
-                        (grid[2] - center[2]) ** 2) / sigma**2))
-    return signals / ((2 * np.pi) ** 1.5 * sigma ** 3)
+    positions = np.asarray(positions)
+    # drop every weight after the first zero
+    weights = np.asarray(weights, dtype=np.float64)
+    weights = weights * np.cumprod(weights != 0, axis=1)
+    B, n_points = weights.shape
+    signals = np.zeros((B, M, N, O))
+
+    axes = _grid_axes(grid)
+    # bound the `(chunk, N_gaussians, M, N)` intermediate to ~32 MB; the
+    # dense path is memory-bound, so it works on a few signals at a time
+    chunk = max(1, 2**22 // (n_points * M * max(N, O) if axes is not None
+                             else 8 * M * N * O))
+
+    def compute(start):
+        sl = slice(start, start + chunk)
+        if axes is not None:
+            _sum_of_gaussians_separable(signals[sl], axes, positions[sl],
+                                        weights[sl], sigma)
+        else:
+            _sum_of_gaussians_dense(signals[sl], grid, positions[sl],
+                                    weights[sl], sigma)
+
+    starts = range(0, B, chunk)
+    if n_jobs == 1 or len(starts) == 1:
+        for start in starts:
+            compute(start)
+    else:
+        # BLAS and ufuncs release the GIL
+        with ThreadPoolExecutor(n_jobs) as executor:
+            list(executor.map(compute, starts))
+    signals /= (2 * np.pi) ** 1.5 * sigma ** 3
+    return signals
+
+
+def _grid_axes(grid):
+    """Returns the 1D axes of `grid` if it's an 'ij' meshgrid, else None."""
+    axes = (grid[0][:, 0, 0], grid[1][0, :, 0], grid[2][0, 0, :])
+    for i, axis in enumerate(axes):
+        shape = [1, 1, 1]
+        shape[i] = -1
+        if not np.array_equal(grid[i], np.broadcast_to(axis.reshape(shape),
+                                                       grid.shape[1:])):
+            return None
+    return axes
+
+
+def _sum_of_gaussians_separable(out, axes, positions, weights, sigma):
+    # exp(-(x^2 + y^2 + z^2)) = exp(-x^2) exp(-y^2) exp(-z^2), per axis
+    # of shape (B, N_gaussians, M), (B, N_gaussians, N), (B, N_gaussians, O)
+    gx, gy, gz = [np.exp(-0.5 * (axis[None, None] - positions[..., i, None])**2
+                         / sigma**2) for i, axis in enumerate(axes)]
+    B, n_points, M = gx.shape
+    N, O = gy.shape[-1], gz.shape[-1]
+    gxy = (weights[..., None] * gx)[..., None] * gy[:, :, None]
+    # sum over Gaussians: (B, M*N, N_gaussians) @ (B, N_gaussians, O)
+    out += np.matmul(gxy.reshape(B, n_points, M * N).transpose(0, 2, 1),
+                     gz).reshape(B, M, N, O)
+
+
+def _sum_of_gaussians_dense(out, grid, positions, weights, sigma):
+    for i_point in range(positions.shape[1]):
+        weight = weights[:, i_point]
+        if not weight.any():
+            break
+        center = positions[:, i_point, :, None, None, None]
+        out += weight[:, None, None, None] * np.exp(
+            -0.5 * ((grid[0] - center[:, 0]) ** 2 +
+                    (grid[1] - center[:, 1]) ** 2 +
+                    (grid[2] - center[:, 2]) ** 2) / sigma**2)
 
 def get_3d_angles(cartesian_grid):
     """
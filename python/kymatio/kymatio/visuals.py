@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 """Convenience visual methods."""
 import os
+import io
 import numpy as np
 from scipy.fft import ifft, ifftshift
 from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
 from .scattering1d.filter_bank import compute_temporal_support
 from .toolkit import (coeff_energy, coeff_distance, energy, drop_batch_dim_jtfs,
-                      _eps)
+                      ExtendedUnifiedBackend, _eps)
 
 try:
     import matplotlib.pyplot as plt
@@ -663,7 +665,8 @@ def filterbank_jtfs_2d(jtfs, part='real', zoomed=False, w=1, h=1, borders=False,
 def gif_jtfs_2d(Scx, meta, savedir='', base_name='jtfs2d', images_ext='.png',
              overwrite=False, save_images=None, show=None, cmap='turbo',
              norms=None, skip_spins=False, skip_unspinned=False, sample_idx=0,
-             inf_token=-1, verbose=False, gif_kw=None):
+             inf_token=-1, verbose=False, gif_kw=None, gif_ext='.gif',
+             n_workers=None):
     """Slice heatmaps of JTFS outputs.
 
     Parameters
@@ -689,8 +692,8 @@ def gif_jtfs_2d(Scx, meta, savedir='', base_name='jtfs2d', images_ext='.png',
         If True and file at `savepath` exists, will overwrite it.
 
     save_images : bool (default False)
-        Whether to save images. Images are always saved if `savepath` is not None,
-        but deleted after if `save_images=False`.
+        Whether to save images. The GIF is made from frames kept in memory,
+        so images are only written if `True`.
         If `True` and `savepath` is None, will save images to current working
         directory (but not gif).
 
@@ -724,6 +727,14 @@ def gif_jtfs_2d(Scx, meta, savedir='', base_name='jtfs2d', images_ext='.png',
     gif_kw : dict / None
         Passed as kwargs to `kymatio.visuals.make_gif`.
 
+    gif_ext : str
+        '.gif' (default), or '.mp4' to save a video instead (requires
+        `imageio-ffmpeg`).
+
+    n_workers : int / None
+        If > 1, renders frames in a process pool of this many workers.
+        Ignored if `show`, as frames must then be displayed in order.
+
     Example
     -------
     ::
@@ -762,62 +773,10 @@ def gif_jtfs_2d(Scx, meta, savedir='', base_name='jtfs2d', images_ext='.png',
         assert len(coef) == n_n1s
         return coef
 
-    def _save_image():
-        path = os.path.join(savedir, f'{base_name}{img_idx[0]}{images_ext}')
-        if os.path.isfile(path) and overwrite:
-            os.unlink(path)
-        if not os.path.isfile(path):
-            plt.savefig(path, bbox_inches='tight')
-        img_paths.append(path)
-        img_idx[0] += 1
-
-    def _viz_spins(Scx, i, norm):
-        kup = 'psi_t * psi_f_up'
-        kdn = 'psi_t * psi_f_down'
-        sup = _get_coef(i, kup, meta_idx)
-        sdn = _get_coef(i, kdn, meta_idx)
-
-        _, axes = plt.subplots(1, 2, figsize=(14, 7))
-        kw = dict(abs=1, ticks=0, show=0, norm=norm)
-
-        imshow(sup, ax=axes[0], **kw, title=_title(meta_idx, kup, '+1'))
-        imshow(sdn, ax=axes[1], **kw, title=_title(meta_idx, kdn, '-1'))
-        plt.subplots_adjust(wspace=0.01)
-        if save_images or do_gif:
-            _save_image()
-        if show:
-            plt.show()
-        plt.close()
-
-        meta_idx[0] += len(sup)
-
-    def _viz_simple(Scx, pair, i, norm):
-        coef = _get_coef(i, pair, meta_idx)
-
-        _kw = dict(abs=1, ticks=0, show=0, norm=norm, w=14/12, h=7/12,
-                   title=_title(meta_idx, pair, '0'))
-        if do_gif:
-            # make spacing consistent with up & down
-            _, axes = plt.subplots(1, 2, figsize=(14, 7))
-            imshow(coef, ax=axes[0], **_kw)
-            plt.subplots_adjust(wspace=0.01)
-            axes[1].set_frame_on(False)
-            axes[1].set_xticks([])
-            axes[1].set_yticks([])
-        else:
-            # optimize spacing for single image
-            imshow(coef, **_kw)
-        if save_images or do_gif:
-            _save_image()
-        if show:
-            plt.show()
-        plt.close()
-
-        meta_idx[0] += len(coef)
-
     # handle args & check if already exists (if so, delete if `overwrite`)
     savedir, savepath, images_ext, save_images, show, do_gif = _handle_gif_args(
-        savedir, base_name, images_ext, save_images, overwrite, show=False)
+        savedir, base_name, images_ext, save_images, overwrite, show=False,
+        gif_ext=gif_ext)
 
     # set params
     out_3D = bool(meta['n']['psi_t * phi_f'].ndim == 3)
@@ -838,15 +797,22 @@ def gif_jtfs_2d(Scx, meta, savedir='', base_name='jtfs2d', images_ext='.png',
         norms = [(0, .5 * mx)] * 5
 
     # spinned pairs ##########################################################
-    img_paths = []
-    img_idx = [0]
+    frames_kw = []
     meta_idx = [0]
     if not skip_spins:
+        kup = 'psi_t * psi_f_up'
+        kdn = 'psi_t * psi_f_down'
         i = 0
         while True:
-            _viz_spins(Scx, i, norms[0])
+            sup = _get_coef(i, kup, meta_idx)
+            sdn = _get_coef(i, kdn, meta_idx)
+            frames_kw.append(dict(
+                coefs=(sup, sdn), norm=norms[0],
+                titles=(_title(meta_idx, kup, '+1'),
+                        _title(meta_idx, kdn, '-1'))))
+            meta_idx[0] += len(sup)
             i += 1
-            if meta_idx[0] > len(ns['psi_t * psi_f_up']) - 1:
+            if meta_idx[0] > len(ns[kup]) - 1:
                 break
 
     # unspinned pairs ########################################################
@@ -856,32 +822,70 @@ def gif_jtfs_2d(Scx, meta, savedir='', base_name='jtfs2d', images_ext='.png',
             meta_idx = [0]
             i = 0
             while True:
-                _viz_simple(Scx, pair, i, norms[1 + j])
+                coef = _get_coef(i, pair, meta_idx)
+                frames_kw.append(dict(coefs=(coef,), norm=norms[1 + j],
+                                      titles=(_title(meta_idx, pair, '0'),)))
+                meta_idx[0] += len(coef)
                 i += 1
                 if meta_idx[0] > len(ns[pair]) - 1:
                     break
 
-    # make gif & cleanup #####################################################
-    try:
-        if do_gif:
-            if gif_kw is None:
-                gif_kw = {}
-            make_gif(loaddir=savedir, savepath=savepath, ext=images_ext,
-                     overwrite=overwrite, delimiter=base_name, verbose=verbose,
-                     **gif_kw)
-    finally:
-        if not save_images:
-            # guarantee cleanup
-            for path in img_paths:
-                if os.path.isfile(path):
-                    os.unlink(path)
+    # render frames & make gif ###############################################
+    for k, kw in enumerate(frames_kw):
+        kw.update(do_gif=do_gif, show=show, savepath=None)
+        if save_images:
+            path = os.path.join(savedir, f'{base_name}{k}{images_ext}')
+            if os.path.isfile(path) and overwrite:
+                os.unlink(path)
+            if not os.path.isfile(path):
+                kw['savepath'] = path
+    frames = _render_frames(_gif_jtfs_2d_frame, frames_kw,
+                            n_workers=None if show else n_workers)
+
+    if do_gif:
+        if gif_kw is None:
+            gif_kw = {}
+        make_gif(loaddir=None, savepath=savepath, frames=_crop_frames(frames),
+                 overwrite=overwrite, verbose=verbose, **gif_kw)
+
+
+def _gif_jtfs_2d_frame(coefs, titles, norm, do_gif, show, savepath):
+    """Draws a frame of `gif_jtfs_2d`; returns it as an array if `do_gif`."""
+    kw = dict(abs=1, ticks=0, show=0, norm=norm)
+    if len(coefs) == 2:
+        fig, axes = plt.subplots(1, 2, figsize=(14, 7))
+        for ax, coef, title in zip(axes, coefs, titles):
+            imshow(coef, ax=ax, fig=fig, **kw, title=title)
+        fig.subplots_adjust(wspace=0.01)
+    elif do_gif:
+        # make spacing consistent with up & down
+        fig, axes = plt.subplots(1, 2, figsize=(14, 7))
+        imshow(coefs[0], ax=axes[0], fig=fig, w=14/12, h=7/12, **kw,
+               title=titles[0])
+        fig.subplots_adjust(wspace=0.01)
+        axes[1].set_frame_on(False)
+        axes[1].set_xticks([])
+        axes[1].set_yticks([])
+    else:
+        # optimize spacing for single image
+        fig = plt.figure()
+        imshow(coefs[0], fig=fig, w=14/12, h=7/12, **kw, title=titles[0])
+
+    if savepath is not None:
+        fig.savefig(savepath, bbox_inches='tight')
+    frame = _figure_to_array(fig) if do_gif else None
+    if show:
+        plt.show()
+    plt.close(fig)
+    return frame
 
 
 def gif_jtfs_3d(packed, savedir='', base_name='jtfs3d', images_ext='.png',
                 cmap='turbo', cmap_norm=.5, axes_labels=('xi2', 'xi1_fr', 'xi1'),
                 overwrite=False, save_images=False,
                 width=800, height=800, surface_count=30, opacity=.2, zoom=1,
-                angles=None, verbose=True, gif_kw=None):
+                angles=None, verbose=True, gif_kw=None, gif_ext='.gif',
+                n_workers=None):
     """Generate and save GIF of 3D JTFS slices.
 
     Parameters
@@ -889,8 +893,8 @@ def gif_jtfs_3d(packed, savedir='', base_name='jtfs3d', images_ext='.png',
     packed : tensor, 4D
         Output of `kymatio.toolkit.pack_coeffs_jtfs`.
 
-    savedir, base_name, images_ext, overwrite :
-        See `help(kymatio.visuals.gif_jtfs)`.
+    savedir, base_name, images_ext, overwrite, save_images, gif_ext :
+        See `help(kymatio.visuals.gif_jtfs_2d)`.
 
     cmap : str
         Colormap to use.
@@ -931,6 +935,9 @@ def gif_jtfs_3d(packed, savedir='', base_name='jtfs3d', images_ext='.png',
     gif_kw : dict / None
         Passed as kwargs to `kymatio.visuals.make_gif`.
 
+    n_workers : int / None
+        If > 1, renders frames in a process pool of this many workers.
+
     Example
     -------
     ::
@@ -957,7 +964,8 @@ def gif_jtfs_3d(packed, savedir='', base_name='jtfs3d', images_ext='.png',
 
     # handle args & check if already exists (if so, delete if `overwrite`)
     savedir, savepath, images_ext, save_images, *_ = _handle_gif_args(
-        savedir, base_name, images_ext, save_images, overwrite, show=False)
+        savedir, base_name, images_ext, save_images, overwrite, show=False,
+        gif_ext=gif_ext)
 
     # handle labels
     supported = ('t', 'xi2', 'xi1_fr', 'xi1')
@@ -1037,45 +1045,46 @@ def gif_jtfs_3d(packed, savedir='', base_name='jtfs3d', images_ext='.png',
     )
 
     # generate gif frames ####################################################
-    img_paths = []
+    frames_kw = []
     for k, vol4 in enumerate(packed):
-        fig = go.Figure(go.Volume(value=vol4.flatten(), **volume_kw))
-
-        eye = dict(x=eyes[k][0], y=eyes[k][1], z=eyes[k][2])
-        layout_kw['scene_camera']['eye'] = eye
-        fig.update_layout(
-            **layout_kw,
-            title={'text': f"{frame_label}={k}",
-                   'x':.5, 'y':.09,
-                   'xanchor': 'center', 'yanchor': 'top'}
-        )
-
-        savepath = os.path.join(savedir, f'{base_name}{k}{images_ext}')
-        if os.path.isfile(savepath) and overwrite:
-            os.unlink(savepath)
-        fig.write_image(savepath)
-        img_paths.append(savepath)
-        if verbose:
-            print("{}/{} frames done".format(k + 1, len(packed)), flush=True)
+        layout_kw_k = deepcopy(layout_kw)
+        layout_kw_k['scene_camera']['eye'] = dict(
+            x=eyes[k][0], y=eyes[k][1], z=eyes[k][2])
+        layout_kw_k['title'] = {'text': f"{frame_label}={k}",
+                                'x':.5, 'y':.09,
+                                'xanchor': 'center', 'yanchor': 'top'}
+        image_path = None
+        if save_images:
+            image_path = os.path.join(savedir, f'{base_name}{k}{images_ext}')
+            if os.path.isfile(image_path) and overwrite:
+                os.unlink(image_path)
+        frames_kw.append(dict(value=vol4.flatten(), volume_kw=volume_kw,
+                              layout_kw=layout_kw_k, savepath=image_path))
+    frames = _render_frames(_gif_jtfs_3d_frame, frames_kw, n_workers,
+                            verbose=verbose)
 
     # make gif ###############################################################
-    try:
-        if gif_kw is None:
-            gif_kw = {}
-        savepath = os.path.join(savedir, f'{base_name}.gif')
-        make_gif(loaddir=savedir, savepath=savepath, ext=images_ext,
-                 delimiter=base_name, overwrite=overwrite, verbose=verbose,
-                 **gif_kw)
-    finally:
-        if not save_images:
-            # guarantee cleanup
-            for path in img_paths:
-                if os.path.isfile(path):
-                    os.unlink(path)
+    if gif_kw is None:
+        gif_kw = {}
+    make_gif(loaddir=None, savepath=savepath, frames=frames,
+             overwrite=overwrite, verbose=verbose, **gif_kw)
+
+
+def _gif_jtfs_3d_frame(value, volume_kw, layout_kw, savepath):
+    """Draws a frame of `gif_jtfs_3d`; returns it as an array."""
+    import plotly.graph_objs as go
+
+    fig = go.Figure(go.Volume(value=value, **volume_kw))
+    fig.update_layout(**layout_kw)
+    if savepath is not None:
+        fig.write_image(savepath)
+    # decode in memory rather than through a file
+    frame = plt.imread(io.BytesIO(fig.to_image(format='png')), format='png')
+    return (frame[..., :3] * 255).round().astype(np.uint8)
 
 
 def energy_profile_jtfs(Scx, meta, x=None, pairs=None, kind='l2', flatten=False,
-                        plots=True, **plot_kw):
+                        plots=True, batch=False, **plot_kw):
     """Plot & print relevant energy information across coefficient pairs.
     Works for all `'dict' in out_type` and `out_exclude`.
     Also see `help(kymatio.toolkit.coeff_energy)`.
@@ -1109,16 +1118,22 @@ def energy_profile_jtfs(Scx, meta, x=None, pairs=None, kind='l2', flatten=False,
         Whether to visualize the energies and print statistics
         (will print E_out / E_in if `x` is passed regardless).
 
+    batch : bool (default False)
+        If True, computes for every sample of `Scx` at once, with a leading
+        batch dim in outputs; plots and statistics are then of the mean over
+        samples. Else, computes for the first sample.
+
     plot_kw : kwargs
         Will pass to `kymatio.visuals.plot()`.
 
     Returns
     -------
-    energies: list[float]
-        List of coefficient energies.
+    energies: list[float] / np.ndarray
+        List of coefficient energies; `(batch_size, n_coeffs)` if `batch`.
 
     pair_energies: dict[str: float]
-        Keys are pairs, values are sums of all pair's coefficient energies.
+        Keys are pairs, values are all pair's coefficient energies;
+        `(batch_size, n_pair_coeffs)` arrays if `batch`.
     """
     if not isinstance(Scx, dict):
         raise NotImplementedError("input must be dict. Set out_type='dict:array' "
@@ -1130,22 +1145,28 @@ def energy_profile_jtfs(Scx, meta, x=None, pairs=None, kind='l2', flatten=False,
                                target="L1 norm" if kind == 'l1' else "Energy")
     # make `fn`
     fn = lambda Scx, meta, pair: coeff_energy(
-        Scx, meta, pair, aggregate=False, kind=kind)
+        Scx, meta, pair, aggregate=False, kind=kind, batch=batch)
 
     # compute, plot, print
-    energies, pair_energies = _iterate_coeff_pairs(
-        Scx, meta, fn, pairs, plots=plots, flatten=flatten,
-        titles=titles, **plot_kw)
+    energies, pair_energies, idxs = _compute_coeff_pairs(
+        Scx, meta, fn, compute_pairs, flatten=flatten, batch=batch)
+    _report_coeff_pairs(energies, pair_energies, idxs, plots=plots,
+                        titles=titles, **plot_kw)
 
     # E_out / E_in
     if x is not None:
-        e_total = np.sum(energies)
-        print("E_out / E_in = %.3f" % (e_total / energy(x)))
+        if batch:
+            ratio = np.mean([e_total / energy(xi) for e_total, xi in
+                             zip(np.sum(energies, axis=-1), x)])
+            print("mean E_out / E_in = %.3f" % ratio)
+        else:
+            e_total = np.sum(energies)
+            print("E_out / E_in = %.3f" % (e_total / energy(x)))
     return energies, pair_energies
 
 
 def coeff_distance_jtfs(Scx0, Scx1, meta0, meta1=None, pairs=None, kind='l2',
-                        flatten=False, plots=True, **plot_kw):
+                        flatten=False, plots=True, batch=False, **plot_kw):
     """Computes relative distance between JTFS coefficients.
 
     Parameters
@@ -1177,16 +1198,22 @@ def coeff_distance_jtfs(Scx0, Scx1, meta0, meta1=None, pairs=None, kind='l2',
     plots : bool (default True)
         Whether to visualize the distances.
 
+    batch : bool (default False)
+        If True, computes between every pair of samples of `Scx0` and `Scx1`
+        at once, with a leading batch dim in outputs; plots and statistics are
+        then of the mean over samples. Else, computes for the first samples.
+
     plot_kw : kwargs
         Will pass to `kymatio.visuals.plot()`.
 
     Returns
     -------
-    distances : list[float]
-        List of coefficient distances.
+    distances : list[float] / np.ndarray
+        List of coefficient distances; `(batch_size, n_coeffs)` if `batch`.
 
     pair_distances : dict[str: float]
-        Keys are pairs, values are sums of all pair's coefficient distances.
+        Keys are pairs, values are all pair's coefficient distances;
+        `(batch_size, n_pair_coeffs)` arrays if `batch`.
     """
     if not all(isinstance(Scx, dict) for Scx in (Scx0, Scx1)):
         raise NotImplementedError("inputs must be dict. Set "
@@ -1200,40 +1227,66 @@ def coeff_distance_jtfs(Scx0, Scx1, meta0, meta1=None, pairs=None, kind='l2',
     titles = _make_titles_jtfs(compute_pairs,
                                target="L1 norm" if kind == 'l1' else "Energy")
     # make `fn`
-    fn = lambda Scx, meta, pair: coeff_distance(*Scx, *meta, pair, kind=kind)
+    fn = lambda Scx, meta, pair: coeff_distance(*Scx, *meta, pair, kind=kind,
+                                                batch=batch)
 
     # compute, plot, print
-    distances, pair_distances = _iterate_coeff_pairs(
-        (Scx0, Scx1), (meta0, meta1), fn, pairs, plots=plots,
-        titles=titles, **plot_kw)
+    distances, pair_distances, idxs = _compute_coeff_pairs(
+        (Scx0, Scx1), (meta0, meta1), fn, compute_pairs, flatten=flatten,
+        batch=batch)
+    _report_coeff_pairs(distances, pair_distances, idxs, plots=plots,
+                        titles=titles, **plot_kw)
 
     return distances, pair_distances
 
 
-def _iterate_coeff_pairs(Scx, meta, fn, pairs=None, flatten=False, plots=True,
-                         titles=None, **plot_kw):
+def _compute_coeff_pairs(Scx, meta, fn, compute_pairs, flatten=False,
+                         batch=False):
+    """Computes `fn` for every pair; returns per-coefficient quantities of all
+    pairs, of each pair, and indices of pairs' boundaries in the former.
+    """
     # in case multiple meta passed
     meta0 = meta[0] if isinstance(meta, tuple) else meta
-    # enforce pair order
-    compute_pairs = _get_compute_pairs(pairs, meta0)
 
     # extract energy info
     energies = []
     pair_energies = {}
     idxs = [0]
+    n_energies = 0
     for pair in compute_pairs:
         if pair not in meta0['n']:
             continue
         E_flat, E_slices = fn(Scx, meta, pair)
         data = E_flat if flatten else E_slices
+        if batch:
+            # one device-to-host copy per pair, for all samples
+            data = ExtendedUnifiedBackend(data).numpy(data)
         # flip to order freqs low-to-high
-        pair_energies[pair] = data[::-1]
-        energies.extend(data[::-1])
+        data = data[..., ::-1] if batch else data[::-1]
+        pair_energies[pair] = data
+        energies.append(data)
+        n_energies += data.shape[-1] if batch else len(data)
         # don't repeat 0
-        idxs.append(len(energies) - 1 if len(energies) != 1 else 1)
+        idxs.append(n_energies - 1 if n_energies != 1 else 1)
+
+    if batch:
+        energies = np.concatenate(energies, axis=-1)
+    else:
+        energies = np.array([e for data in energies for e in data])
+    return energies, pair_energies, idxs
+
+
+def _report_coeff_pairs(energies, pair_energies, idxs, plots=True,
+                        titles=None, **plot_kw):
+    """Plots & prints outputs of `_compute_coeff_pairs`, averaged over samples
+    if batched.
+    """
+    if energies.ndim == 2:
+        energies = energies.mean(axis=0)
+        pair_energies = {pair: np.mean(pair_energies[pair], axis=0)
+                         for pair in pair_energies}
 
     # format & plot ##########################################################
-    energies = np.array(energies)
     ticks = np.arange(len(energies))
     vlines = (idxs, {'color': 'tab:red', 'linewidth': 1})
 
@@ -1265,15 +1318,12 @@ def _iterate_coeff_pairs(Scx, meta, fn, pairs=None, flatten=False, plots=True,
     longest_num = max(map(len, nums))
 
     if plots:
-        i = 0
-        for pair in compute_pairs:
+        for i, pair in enumerate(pair_energies):
             E_pair = pair_energies_sum[pair]
             eps = _eps(e_total)
             e_perc = sig_figs(E_pair / (e_total + eps) * 100, n_sig=3)
             print("{} ({}%) -- {}".format(
                 nums[i].ljust(longest_num), str(e_perc).rjust(4), pair))
-            i += 1
-    return energies, pair_energies
 
 
 def compare_distances_jtfs(pair_distances, pair_distances_ref, plots=True,
@@ -1344,17 +1394,19 @@ def compare_distances_jtfs(pair_distances, pair_distances_ref, plots=True,
 
 def make_gif(loaddir, savepath, duration=250, start_end_pause=3, ext='.png',
              delimiter='', overwrite=False, delete_images=False, HD=None,
-             verbose=False):
+             verbose=False, frames=None):
     """Makes gif out of images in `loaddir` directory with `ext` extension,
-    and saves to `savepath`.
+    or out of `frames`, and saves to `savepath`.
 
     Parameters
     ----------
-    loaddir : str
+    loaddir : str / None
         Path to directory from which to fetch images to use as GIF frames.
+        Unused if `frames` is provided.
 
     savepath : path
-        Save path, must end with '.gif'.
+        Save path, must end with '.gif', or with '.mp4' to save a video
+        (requires `imageio` and `imageio-ffmpeg`).
 
     duration : int
         Interval between each GIF frame, in milliseconds.
@@ -1383,7 +1435,18 @@ def make_gif(loaddir, savepath, duration=250, start_end_pause=3, ext='.png',
 
     verbose : bool (default False)
         Whether to print to console the location of save file upon success.
+
+    frames : list[np.ndarray] / None
+        Images to use as GIF frames, as `uint8` arrays of shape
+        `(height, width, channels)`, all of same shape. Skips writing frames
+        to, and reading them from, disk.
     """
+    is_video = savepath.endswith('.mp4')
+    if is_video:
+        if HD is False:
+            raise ValueError("saving to '.mp4' requires `HD`")
+        HD = True
+
     # handle `HD`
     if HD or HD is None:
         try:
@@ -1402,14 +1465,18 @@ def make_gif(loaddir, savepath, duration=250, start_end_pause=3, ext='.png',
                 HD = False
 
     # fetch frames
-    loaddir = os.path.abspath(loaddir)
-    names = [n for n in os.listdir(loaddir)
-             if (n.startswith(delimiter) and n.endswith(ext))]
-    names = sorted(names, key=lambda p: int(
-        ''.join(s for s in p.split(os.sep)[-1] if s.isdigit())))
-    paths = [os.path.join(loaddir, n) for n in names]
-    frames = [(imageio.imread(p) if HD else Image.open(p))
-              for p in paths]
+    if frames is not None:
+        paths = []
+        frames = [(f if HD else Image.fromarray(f)) for f in frames]
+    else:
+        loaddir = os.path.abspath(loaddir)
+        names = [n for n in os.listdir(loaddir)
+                 if (n.startswith(delimiter) and n.endswith(ext))]
+        names = sorted(names, key=lambda p: int(
+            ''.join(s for s in p.split(os.sep)[-1] if s.isdigit())))
+        paths = [os.path.join(loaddir, n) for n in names]
+        frames = [(imageio.imread(p) if HD else Image.open(p))
+                  for p in paths]
 
     # handle frame duplication to increase their duration
     if start_end_pause is not None:
@@ -1424,7 +1491,10 @@ def make_gif(loaddir, savepath, duration=250, start_end_pause=3, ext='.png',
         # delete if exists
         os.unlink(savepath)
     # save
-    if HD:
+    if is_video:
+        imageio.mimsave(savepath, frames, fps=1000/duration,
+                        macro_block_size=1)
+    elif HD:
         imageio.mimsave(savepath, frames, fps=1000/duration)
     else:
         frame_one = frames[0]
@@ -1444,13 +1514,16 @@ def make_gif(loaddir, savepath, duration=250, start_end_pause=3, ext='.png',
 def imshow(x, title=None, show=True, cmap=None, norm=None, abs=0,
            w=None, h=None, ticks=True, borders=True, aspect='auto',
            ax=None, fig=None, yticks=None, xticks=None, xlabel=None, ylabel=None,
-           **kw):
+           lod=None, **kw):
     """
     norm: color norm, tuple of (vmin, vmax)
     abs: take abs(data) before plotting
     ticks: False to not plot x & y ticks
     borders: False to not display plot borders
     w, h: rescale width & height
+    lod: True to block-reduce `x` to the plot's resolution in pixels, keeping
+         the largest magnitude per block; None to do so if `x` is large
+         (see `_LOD_MIN_SIZE`), False to never
     kw: passed to `plt.imshow()`
     """
     ax  = ax  or plt.gca()
@@ -1468,10 +1541,15 @@ def imshow(x, title=None, show=True, cmap=None, norm=None, abs=0,
         cmap = 'turbo' if abs else 'bwr'
     _kw = dict(vmin=vmin, vmax=vmax, cmap=cmap, aspect=aspect, **kw)
 
-    if abs:
-        ax.imshow(np.abs(x), **_kw)
-    else:
-        ax.imshow(x.real, **_kw)
+    x = np.abs(x) if abs else x.real
+    x_lod = _lod_image(x, lod, ax, fig, w, h)
+    if x_lod is not x and 'extent' not in kw:
+        # keep axes in units of `x`'s samples
+        H, W = x.shape[:2]
+        origin = kw.get('origin', None) or plt.rcParams['image.origin']
+        _kw['extent'] = ((-.5, W - .5, H - .5, -.5) if origin == 'upper' else
+                         (-.5, W - .5, -.5, H - .5))
+    ax.imshow(x_lod, **_kw)
 
     if w or h:
         fig.set_size_inches(12 * (w or 1), 12 * (h or 1))
@@ -1498,13 +1576,16 @@ def imshow(x, title=None, show=True, cmap=None, norm=None, abs=0,
 def plot(x, y=None, title=None, show=0, complex=0, abs=0, w=None, h=None,
          xlims=None, ylims=None, vlines=None, hlines=None,
          xlabel=None, ylabel=None, xticks=None, yticks=None, ticks=True,
-         ax=None, fig=None, squeeze=True, auto_xlims=None, **kw):
+         ax=None, fig=None, squeeze=True, auto_xlims=None, lod=None, **kw):
     """
     norm: color norm, tuple of (vmin, vmax)
     abs: take abs(data) before plotting
     complex: plot `x.real` & `x.imag`
     ticks: False to not plot x & y ticks
     w, h: rescale width & height
+    lod: True to decimate `y` to its min & max per pixel column of the plot,
+         which draws identically; None to do so if `y` is large
+         (see `_LOD_MIN_SIZE`), False to never
     kw: passed to `plt.imshow()`
     """
     ax  = ax  or plt.gca()
@@ -1527,12 +1608,14 @@ def plot(x, y=None, title=None, show=0, complex=0, abs=0, w=None, h=None,
     y = y if isinstance(y, list) or not squeeze else y.squeeze()
 
     if complex:
-        ax.plot(x, y.real, color='tab:blue', **kw)
-        ax.plot(x, y.imag, color='tab:orange', **kw)
+        ax.plot(*_lod_line(x, y.real, lod, ax, fig, w, h), color='tab:blue',
+                **kw)
+        ax.plot(*_lod_line(x, y.imag, lod, ax, fig, w, h), color='tab:orange',
+                **kw)
     else:
         if abs:
             y = np.abs(y)
-        ax.plot(x, y, **kw)
+        ax.plot(*_lod_line(x, y, lod, ax, fig, w, h), **kw)
 
     # styling
     if vlines:
@@ -1557,7 +1640,14 @@ def plot(x, y=None, title=None, show=0, complex=0, abs=0, w=None, h=None,
 def scat(x, y=None, title=None, show=0, s=18, w=None, h=None,
          xlims=None, ylims=None, vlines=None, hlines=None, ticks=1,
          complex=False, abs=False, xlabel=None, ylabel=None, ax=None, fig=None,
-         auto_xlims=None, **kw):
+         auto_xlims=None, lod=None, **kw):
+    """
+    lod: True to keep one point per pixel cell of the plot, dropping points
+         drawn within a pixel of one kept; None to do so if `y` is large
+         (see `_LOD_MIN_SIZE`), False to never. Not applied with per-point
+         sizes or colors.
+    kw: passed to `plt.scatter()`
+    """
     ax  = ax  or plt.gca()
     fig = fig or plt.gcf()
 
@@ -1573,13 +1663,15 @@ def scat(x, y=None, title=None, show=0, s=18, w=None, h=None,
         y = x
         x = np.arange(len(x))
 
+    lod_kw = dict(lod=lod, ax=ax, fig=fig, w=w, h=h, xlims=xlims,
+                  ylims=ylims, s=s, kw=kw)
     if complex:
-        ax.scatter(x, y.real, s=s, **kw)
-        ax.scatter(x, y.imag, s=s, **kw)
+        ax.scatter(*_lod_scatter(x, y.real, **lod_kw), s=s, **kw)
+        ax.scatter(*_lod_scatter(x, y.imag, **lod_kw), s=s, **kw)
     else:
         if abs:
             y = np.abs(y)
-        ax.scatter(x, y, s=s, **kw)
+        ax.scatter(*_lod_scatter(x, y, **lod_kw), s=s, **kw)
     if not ticks:
         ax.set_xticks([])
         ax.set_yticks([])
@@ -1705,6 +1797,137 @@ def _scale_plot(fig, ax, show=False, ax_equal=False, w=None, h=None,
         plt.show()
 
 
+# inputs with more points than this are decimated by default
+_LOD_MIN_SIZE = 2**16
+# bins per pixel column of line decimation; bins don't align with pixel
+# columns, so several per column keep extrema within a pixel or so of place
+_LOD_BINS_PER_PIXEL = 4
+# cells per pixel of scatter decimation, along each axis
+_LOD_CELLS_PER_PIXEL = 2
+
+
+def _lod_pixels(ax, fig, w=None, h=None, base_size=(14, 8)):
+    """Size of `ax` in pixels once `fig` is rescaled per `w` & `h` (see
+    `_scale_plot`), at the larger of display and save resolutions.
+    """
+    bbox = ax.get_window_extent()
+    fig_w, fig_h = fig.get_size_inches()
+    scale_w = base_size[0] * (w or 1) / fig_w if (w or h) else 1
+    scale_h = base_size[1] * (h or 1) / fig_h if (w or h) else 1
+    savefig_dpi = plt.rcParams['savefig.dpi']
+    if not isinstance(savefig_dpi, str):
+        scale_w *= max(savefig_dpi / fig.dpi, 1)
+        scale_h *= max(savefig_dpi / fig.dpi, 1)
+    return (max(int(np.ceil(bbox.width * scale_w)), 1),
+            max(int(np.ceil(bbox.height * scale_h)), 1))
+
+
+def _lod_line(x, y, lod, ax, fig, w=None, h=None):
+    """Decimates `y` along its first axis to the min & max of bins of
+    samples, in original order, so connected lines draw as at full size (not
+    scatters, which would lose the points between extrema; see
+    `_lod_scatter`). Returns `(x, y)` unchanged if not applicable.
+    """
+    if lod is False:
+        return x, y
+    xa, ya = np.asarray(x), np.asarray(y)
+    n = len(ya) if ya.ndim else 0
+    if (ya.ndim not in (1, 2) or xa.shape != (n,) or
+            (lod is None and ya.size <= _LOD_MIN_SIZE)):
+        return x, y
+    n_bins = _LOD_BINS_PER_PIXEL * _lod_pixels(ax, fig, w, h)[0]
+    if n <= 4 * n_bins:
+        return x, y
+    # bins map to pixel columns only if `x` is monotonic
+    dx = np.diff(xa)
+    if not (np.all(dx >= 0) or np.all(dx <= 0)):
+        return x, y
+
+    size = -(-n // n_bins)
+    n_bins = -(-n // size)
+    # pad by repeating the last sample, which doesn't change the last bin's
+    # min & max
+    pad = np.repeat(ya[-1:], n_bins * size - n, axis=0)
+    yb = np.concatenate([ya, pad]).reshape(n_bins, size, *ya.shape[1:])
+    i_min, i_max = yb.argmin(axis=1), yb.argmax(axis=1)
+    idxs = np.stack([np.minimum(i_min, i_max), np.maximum(i_min, i_max)],
+                    axis=1)
+    offsets = (np.arange(n_bins) * size).reshape(-1, 1, *(1,) * (ya.ndim - 1))
+    idxs = np.minimum(idxs + offsets, n - 1).reshape(2 * n_bins,
+                                                     *ya.shape[1:])
+    # keep endpoints, so that axes limits are unchanged
+    ends = np.broadcast_to(np.array([0, n - 1]).reshape(2, *(1,) * (ya.ndim - 1)),
+                           (2, *ya.shape[1:]))
+    idxs = np.concatenate([ends[:1], idxs, ends[1:]])
+    return xa[idxs], np.take_along_axis(ya, idxs, axis=0)
+
+
+def _lod_scatter(x, y, lod, ax, fig, w=None, h=None, xlims=None, ylims=None,
+                 s=None, kw=None):
+    """Keeps the first point, in original order, per cell of a grid of
+    `_LOD_CELLS_PER_PIXEL` cells per pixel over the data's (or `xlims` &
+    `ylims`') range, plus the points at the data's extrema, so that axes
+    limits are unchanged. Points dropped lie within a cell of one kept.
+    Returns `(x, y)` unchanged if not applicable.
+    """
+    if lod is False:
+        return x, y
+    xa, ya = np.asarray(x), np.asarray(y)
+    n = len(ya) if ya.ndim else 0
+    if (ya.ndim != 1 or xa.shape != (n,) or
+            (lod is None and ya.size <= _LOD_MIN_SIZE)):
+        return x, y
+    # per-point sizes or colors would be misassigned
+    if np.ndim(s) > 0 or any(np.ndim(v) > 0 and len(v) == n
+                             for v in (kw or {}).values()):
+        return x, y
+    finite = np.isfinite(xa) & np.isfinite(ya)
+    if not finite.any():
+        return x, y
+    (xf, yf), i_finite = (xa[finite], ya[finite]), np.flatnonzero(finite)
+
+    width, height = (_LOD_CELLS_PER_PIXEL * p
+                     for p in _lod_pixels(ax, fig, w, h))
+
+    def cells(v, lims, n_cells):
+        v0, v1 = lims if lims is not None else (v.min(), v.max())
+        span = (v1 - v0) or 1
+        # cells beyond the limits aren't drawn, so are merged
+        return np.clip(np.floor((v - v0) / span * n_cells), -1,
+                       n_cells).astype(np.int64) + 1
+
+    keys = (cells(xf, xlims, width) * (height + 3) +
+            cells(yf, ylims, height))
+    _, idxs = np.unique(keys, return_index=True)
+    extrema = [xf.argmin(), xf.argmax(), yf.argmin(), yf.argmax()]
+    idxs = i_finite[np.union1d(idxs, extrema)]
+    if len(idxs) >= n:
+        return x, y
+    return xa[idxs], ya[idxs]
+
+
+def _lod_image(x, lod, ax, fig, w=None, h=None):
+    """Block-reduces `x` to `ax`'s resolution in pixels, keeping the value of
+    largest magnitude per block, so peaks remain visible. Returns `x` if not
+    applicable.
+    """
+    if lod is False or x.ndim != 2 or (lod is None and
+                                       x.size <= _LOD_MIN_SIZE):
+        return x
+    width, height = _lod_pixels(ax, fig, w, h, base_size=(12, 12))
+    H, W = x.shape
+    fh, fw = max(H // height, 1), max(W // width, 1)
+    if fh == 1 and fw == 1:
+        return x
+
+    # pad by repeating edges, which doesn't change the edge blocks' extrema
+    Hp, Wp = -(-H // fh) * fh, -(-W // fw) * fw
+    xp = np.pad(x, ((0, Hp - H), (0, Wp - W)), mode='edge')
+    xb = xp.reshape(Hp // fh, fh, Wp // fw, fw)
+    mx, mn = xb.max(axis=(1, 3)), xb.min(axis=(1, 3))
+    return np.where(mx >= -mn, mx, mn)
+
+
 def _colorize_complex(z):
     """Map complex `z` to 3D array suitable for complex image visualization.
 
@@ -1779,7 +2002,7 @@ def _make_titles_jtfs(compute_pairs, target):
 
 
 def _handle_gif_args(savedir, base_name, images_ext, save_images, overwrite,
-                     show):
+                     show, gif_ext='.gif'):
     do_gif = bool(savedir is not None)
     if save_images is None:
         if savedir is None:
@@ -1796,12 +2019,70 @@ def _handle_gif_args(savedir, base_name, images_ext, save_images, overwrite,
 
     if not images_ext.startswith('.'):
         images_ext = '.' + images_ext
+    if not gif_ext.startswith('.'):
+        gif_ext = '.' + gif_ext
+    if gif_ext not in ('.gif', '.mp4'):
+        raise ValueError("`gif_ext` must be '.gif' or '.mp4', got %s" % gif_ext)
 
-    savepath = os.path.join(savedir, base_name + '.gif')
+    savepath = os.path.join(savedir, base_name + gif_ext)
     _check_savepath(savepath, overwrite)
     return savedir, savepath, images_ext, save_images, show, do_gif
 
 
+def _render_frames(fn, frames_kw, n_workers=None, verbose=False):
+    """Returns `[fn(**kw) for kw in frames_kw]`, in a process pool if
+    `n_workers > 1`.
+    """
+    def done(k):
+        if verbose:
+            print("{}/{} frames done".format(k + 1, len(frames_kw)), flush=True)
+
+    if n_workers is None or n_workers <= 1:
+        frames = []
+        for k, kw in enumerate(frames_kw):
+            frames.append(fn(**kw))
+            done(k)
+        return frames
+
+    with ProcessPoolExecutor(n_workers,
+                             initializer=_render_frames_init) as pool:
+        futures = [pool.submit(fn, **kw) for kw in frames_kw]
+        frames = []
+        for k, future in enumerate(futures):
+            frames.append(future.result())
+            done(k)
+    return frames
+
+
+def _render_frames_init():
+    # workers only draw to buffers; an interactive backend could fail there
+    plt.switch_backend('Agg')
+
+
+def _figure_to_array(fig):
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba())[..., :3].copy()
+
+
+def _crop_frames(frames):
+    """Crops the blank margins shared by all `frames`, akin to
+    `bbox_inches='tight'` but keeping frames of same shape.
+    """
+    content = None
+    for frame in frames:
+        c = np.any(frame != 255, axis=-1)
+        content = c if content is None else (content | c)
+    if content is None or not content.any():
+        return frames
+    rows = np.where(content.any(axis=1))[0]
+    cols = np.where(content.any(axis=0))[0]
+    # leave a small border, as `bbox_inches='tight'` does
+    pad = 4
+    r0, r1 = max(rows[0] - pad, 0), rows[-1] + 1 + pad
+    c0, c1 = max(cols[0] - pad, 0), cols[-1] + 1 + pad
+    return [frame[r0:r1, c0:c1] for frame in frames]
+
+
 def _check_savepath(savepath, overwrite):
     if os.path.isfile(savepath):
         if not overwrite:
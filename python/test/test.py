@@ -0,0 +1,57 @@
+# dependencies
+import numpy as np
+from sklearn.base import clone
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import GridSearchCV
+from sklearn.pipeline import Pipeline
+
+# src
+from kymatio.numpy import TimeFrequencyScattering1D
+from kymatio.sklearn import TimeFrequencyScattering1D as TimeFrequencyScatteringTransformer1D
+
+
+def testMicroBatching() -> None:
+	'''
+	Check that micro-batching a JTFS under `max_memory` matches the unbatched output, for each output format.
+	'''
+	x = np.random.default_rng(0).standard_normal((6, 512))
+	for out_3D, out_type in ((False, 'array'), (True, 'array'), (True, 'list'), (False, 'dict:array')):
+		jtfs = TimeFrequencyScattering1D(
+			shape=(512, ), J=5, Q=8, J_fr=3, average_fr=True, out_3D=out_3D,
+			out_type=out_type,
+		)
+		expected = jtfs(x)
+		# small enough to split `x` into several micro-batches
+		jtfs.max_memory = 2 * jtfs._memory_per_sample(8)
+		assert jtfs._micro_batch_size(x) is not None, (out_3D, out_type)
+		out = jtfs(x)
+		if isinstance(expected, tuple):
+			assert all(np.allclose(o, e) for o, e in zip(out, expected)), (out_3D, out_type)
+		elif isinstance(expected, dict):
+			assert all(np.allclose(out[k], e) for k, e in expected.items()), (out_3D, out_type)
+		elif isinstance(expected, list):
+			assert all(np.allclose(o['coef'], e['coef']) for o, e in zip(out, expected)), (out_3D, out_type)
+		else:
+			assert np.allclose(out, expected), (out_3D, out_type)
+
+
+def testSklearnGridSearch() -> None:
+	'''
+	Check that the scikit-learn JTFS clones with its parameters as passed, and runs in a grid search.
+	'''
+	rng = np.random.default_rng(0)
+	x, y = rng.standard_normal((8, 1024)), np.arange(8) % 2
+	jtfs = TimeFrequencyScatteringTransformer1D(J=6, shape=(1024, ), Q=16, J_fr=3, average_fr=True)
+	assert clone(jtfs).get_params() == jtfs.get_params()
+	search = GridSearchCV(
+		Pipeline([('jtfs', jtfs), ('classifier', LogisticRegression(max_iter=10))]),
+		{'jtfs__J': [5, 6], 'jtfs__Q_fr': [1, 2]},
+		cv=2,
+	)
+	search.fit(x, y)
+
+
+if __name__ == '__main__':
+	testMicroBatching()
+	testSklearnGridSearch()
+	print('All checks passed.')
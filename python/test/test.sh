@@ -1,3 +1,3 @@
 pipenv run flake8 --config=test/test.cfg
 pipenv run mypy --config-file=test/test.cfg
-# pipenv run python test/test.py
\ No newline at end of file
+pipenv run python test/test.py
\ No newline at end of file